@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark screen capture modes for the Android TV Box camera.
+
+Compares device-side PNG capture (screencap -p) with raw framebuffer capture
+encoded to JPEG on the host, sent as-is or gzip-compressed on the device,
+reporting device CPU time, bytes transferred and end-to-end latency for each
+mode and thumbnail size.
+
+Usage:
+    python benchmark_screencap.py 192.168.188.221 5555 [rounds]
+"""
+
+import asyncio
+import re
+import statistics
+import sys
+import time
+
+from custom_components.android_tv_box.adb_manager import ADBManager
+from custom_components.android_tv_box.const import (
+    CAPTURE_MODE_GZIP,
+    CAPTURE_MODE_PNG,
+    CAPTURE_MODE_RAW,
+)
+from custom_components.android_tv_box.screen_capture import ScreenCapturer
+
+SIZES = [(None, None), (640, 360), (320, 180)]
+COMMANDS = {
+    CAPTURE_MODE_PNG: "screencap -p",
+    CAPTURE_MODE_RAW: "screencap",
+    CAPTURE_MODE_GZIP: "screencap | gzip -1",
+}
+
+
+# `time` layouts: mksh (Android's sh) prints "0m00.20s user 0m00.10s system"
+# on one line, bash and toybox print the label first ("user 0m0.200s")
+_TIME_VALUE = r"(?:(\d+)m)?([\d.]+)s?"
+_MKSH_TIME = re.compile(rf"{_TIME_VALUE}[ \t]+(user|system|sys)\b")
+_LABEL_TIME = re.compile(rf"\b(user|system|sys)\s+{_TIME_VALUE}")
+
+
+def parse_cpu_seconds(out: str) -> float:
+    """Return user+sys seconds from the output of the shell's ``time``."""
+    if re.search(rf"{_TIME_VALUE}[ \t]+real\b", out):
+        matches = [(m.group(1), m.group(2)) for m in _MKSH_TIME.finditer(out)]
+    else:
+        matches = [(m.group(2), m.group(3)) for m in _LABEL_TIME.finditer(out)]
+    return sum(int(minutes or 0) * 60 + float(seconds) for minutes, seconds in matches)
+
+
+async def device_cpu_seconds(adb: ADBManager, command: str) -> float:
+    """Return user+sys CPU seconds the device spends running ``command``."""
+    out, _ = await adb._execute_command(f"sh -c 'time {command} > /dev/null' 2>&1")
+    return parse_cpu_seconds(out or "")
+
+
+async def bench_mode(adb: ADBManager, mode: str, rounds: int) -> None:
+    capturer = ScreenCapturer(adb, mode, ttl=0)
+    if capturer.mode != mode:
+        print(f"⚠️  {mode} mode unavailable (Pillow missing?), skipping")
+        return
+
+    cpu = [await device_cpu_seconds(adb, COMMANDS[mode]) for _ in range(rounds)]
+    print(f"\n📸 Mode: {mode}  (device CPU {statistics.mean(cpu):.3f}s per capture)")
+
+    for width, height in SIZES if mode != CAPTURE_MODE_PNG else SIZES[:1]:
+        latencies = []
+        sizes = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            image = await capturer.async_get_frame(width, height)
+            latencies.append(time.perf_counter() - start)
+            sizes.append(len(image or b""))
+        label = f"{width}x{height}" if width else "full"
+        print(
+            f"   {label:>9}: latency {statistics.mean(latencies) * 1000:7.1f} ms "
+            f"(min {min(latencies) * 1000:.1f}), image {statistics.mean(sizes) / 1024:8.1f} KiB"
+        )
+
+    # Bytes over the wire (raw modes transfer the framebuffer, not the JPEG)
+    transfer = capturer.last_transfer
+    if transfer:
+        print(
+            f"   transferred: {transfer['bytes_transferred'] / 1024:.1f} KiB in "
+            f"{transfer['seconds'] * 1000:.1f} ms per capture (via {transfer['kind']})"
+        )
+
+
+async def main():
+    if len(sys.argv) < 3:
+        print("Usage: python benchmark_screencap.py <host> <port> [rounds]")
+        sys.exit(1)
+
+    host = sys.argv[1]
+    port = int(sys.argv[2])
+    rounds = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+
+    adb = ADBManager(host, port, timeout=30)
+    if not await adb.connect():
+        print(f"❌ Could not connect to {host}:{port}")
+        sys.exit(1)
+
+    try:
+        print(f"🔍 Benchmarking screen capture on {host}:{port} ({rounds} rounds)")
+        for mode in COMMANDS:
+            await bench_mode(adb, mode, rounds)
+    finally:
+        await adb.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
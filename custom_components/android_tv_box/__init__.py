@@ -7,8 +7,21 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
+from .const import (
+    DATA_ADB_POOL,
+    DATA_SCHEDULER,
+    DATA_STORE,
+    DEFAULT_ADB_PER_DEVICE_LIMIT,
+    DEFAULT_ADB_POOL_WORKERS,
+    DEFAULT_MAX_CONCURRENT_POLLS,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    SHARED_DATA_KEYS,
+)
 from .coordinator import AndroidTVBoxUpdateCoordinator
+from .scheduler import AndroidTVBoxPollScheduler
+from .storage import AndroidTVBoxStore
+from .worker_pool import ADBWorkerPool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,16 +32,50 @@ PLATFORMS: list[Platform] = [
     Platform.CAMERA,
     Platform.MEDIA_PLAYER,
     Platform.SELECT,
+    Platform.SENSOR,
+    Platform.BINARY_SENSOR,
 ]
 
 
+def _async_get_scheduler(hass: HomeAssistant) -> AndroidTVBoxPollScheduler:
+    """Return the domain-wide poll scheduler, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_SCHEDULER not in domain_data:
+        domain_data[DATA_SCHEDULER] = AndroidTVBoxPollScheduler(
+            hass, DEFAULT_SCAN_INTERVAL, DEFAULT_MAX_CONCURRENT_POLLS
+        )
+    return domain_data[DATA_SCHEDULER]
+
+
+def _async_get_adb_pool(hass: HomeAssistant) -> ADBWorkerPool:
+    """Return the domain-wide ADB worker pool, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_ADB_POOL not in domain_data:
+        domain_data[DATA_ADB_POOL] = ADBWorkerPool(
+            DEFAULT_ADB_POOL_WORKERS, DEFAULT_ADB_PER_DEVICE_LIMIT
+        )
+    return domain_data[DATA_ADB_POOL]
+
+
+async def _async_get_store(hass: HomeAssistant) -> AndroidTVBoxStore:
+    """Return the domain-wide store, loading it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_STORE not in domain_data:
+        domain_data[DATA_STORE] = AndroidTVBoxStore(hass)
+    store: AndroidTVBoxStore = domain_data[DATA_STORE]
+    await store.async_load()
+    return store
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Android TV Box from a config entry."""
     try:
         _LOGGER.debug("Setting up Android TV Box integration")
         
         # Create coordinator
-        coordinator = AndroidTVBoxUpdateCoordinator(hass, entry)
+        coordinator = AndroidTVBoxUpdateCoordinator(
+            hass, entry, _async_get_adb_pool(hass), await _async_get_store(hass)
+        )
         
         # Set up coordinator
         setup_success = await coordinator.async_setup()
@@ -36,12 +83,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             _LOGGER.error("Failed to set up Android TV Box coordinator")
             return False
         
-        # Perform initial data fetch
-        await coordinator.async_config_entry_first_refresh()
+        # Perform initial data fetch (bounded by the fleet-wide concurrency cap)
+        scheduler = _async_get_scheduler(hass)
+        await scheduler.async_run_limited(coordinator.async_config_entry_first_refresh)
         
         # Store coordinator in hass data
-        hass.data.setdefault(DOMAIN, {})
         hass.data[DOMAIN][entry.entry_id] = coordinator
+        scheduler.async_register(entry.entry_id, coordinator)
         
         # Set up platforms
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -67,13 +115,21 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         # Clean up coordinator
         coordinator: AndroidTVBoxUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+        scheduler: AndroidTVBoxPollScheduler = hass.data[DOMAIN][DATA_SCHEDULER]
+        pool: ADBWorkerPool = hass.data[DOMAIN][DATA_ADB_POOL]
+        # Waits for a poll in flight, which could otherwise reconnect the device
+        await scheduler.async_unregister(entry.entry_id)
         await coordinator.async_shutdown()
+        pool.release_device(coordinator.adb_manager.device_id)
         
         # Remove entry from hass data
         hass.data[DOMAIN].pop(entry.entry_id)
         
         # Clean up domain data if no more entries
-        if not hass.data[DOMAIN]:
+        if all(key in SHARED_DATA_KEYS for key in hass.data[DOMAIN]):
+            scheduler.async_shutdown()
+            pool.shutdown()
+            await hass.data[DOMAIN][DATA_STORE].async_save()
             hass.data.pop(DOMAIN)
     
     _LOGGER.info("Android TV Box integration unloaded")
@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-import os
 import re
-from typing import Any, Dict, Optional, Tuple
+import time
+import zlib
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
 
 try:
     from adb_shell.adb_device import AdbDeviceTcp
@@ -13,26 +16,106 @@ try:
 except ImportError as e:
     raise ImportError(
         f"Required ADB library not found: {e}. "
-        "Please install with: pip install adb-shell>=0.4.4"
+        "Please install with: pip install 'adb-shell>=0.4.4,<0.5'"
     ) from e
 
-from .const import ADB_COMMANDS, ADB_CONTROL_COMMANDS, DEFAULT_TIMEOUT
+from .app_catalog import (
+    PACKAGE_LIST_COMMAND,
+    PACKAGE_SIGNATURE_COMMAND,
+    AppInfo,
+    package_details_command,
+    parse_package_details,
+    parse_package_list,
+    parse_package_signature,
+)
+from .capabilities import PROBE_VARIANTS, DeviceCapabilities
+from .device_settings import SETTINGS_LIST_COMMAND, SettingsSnapshot
+from .launch_stats import LaunchHistory, am_start_command, parse_am_start
+from .media_session import MediaSession
+from .network import INTERFACES_COMMAND, NETWORK_COMMAND, parse_network_state
+from .const import (
+    ADB_COMMANDS,
+    ADB_CONTROL_COMMANDS,
+    BOOT_ID_PATH,
+    COMPRESSOR_CANDIDATES,
+    DEFAULT_TIMEOUT,
+    DEVICE_SCREENSHOT_LEFTOVERS,
+    WAIT_BACKOFF,
+    WAIT_INITIAL_INTERVAL,
+    WAIT_MAX_INTERVAL,
+    WAIT_TIMEOUTS,
+)
+
+if TYPE_CHECKING:
+    from .worker_pool import ADBWorkerPool
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+_BOOT_ID = re.compile(r"^([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$", re.M)
+_GETPROP_LINE = re.compile(r"^\[([^\]]+)\]: \[(.*)\]$", re.M)
+
+
+def parse_getprop(output: str) -> Dict[str, str]:
+    """Parse a full ``getprop`` dump into a property map."""
+    return dict(_GETPROP_LINE.findall(output))
+
 
 class ADBManager:
     """Manages ADB connection and commands for Android TV Box."""
 
-    def __init__(self, host: str, port: int, timeout: int = DEFAULT_TIMEOUT) -> None:
-        """Initialize ADB manager."""
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        timeout: int = DEFAULT_TIMEOUT,
+        pool: Optional[ADBWorkerPool] = None,
+    ) -> None:
+        """Initialize ADB manager.
+
+        When ``pool`` is given, blocking adb-shell calls run on the shared
+        domain worker pool; otherwise the default executor is used.
+        """
         self.host = host
         self.port = port
         self.timeout = timeout
         self.device_id = f"{host}:{port}"
+        self._pool = pool
         self._device: Optional[AdbDeviceTcp] = None
         self._connected = False
-        self._device_info: Dict[str, Any] = {}
+        # Boot-scoped caches: the getprop map is only re-read after a reboot
+        self.boot_id: Optional[str] = None
+        self.reboots = 0
+        self.properties: Dict[str, str] = {}
+        # Latest `settings list` snapshot
+        self.settings: Optional[SettingsSnapshot] = None
+        # Result of the device-side screenshot purge done after the first connect
+        self._storage_purged = False
+        self.storage_reclaimed: Dict[str, Any] = {}
+        # Which probe command variants work on this device
+        self.capabilities = DeviceCapabilities()
+        # On-device gzip command for compressed transfers, detected once
+        self.compressor: Optional[str] = None
+        self._compressor_checked = False
+        self._compressor_lock = asyncio.Lock()
+        self.compressed_commands = 0
+        self.compressed_bytes = 0
+        self.compressed_bytes_transferred = 0
+        # Rolling per-app `am start -W` timings
+        self.launch_history = LaunchHistory()
+        # Condition waits: how many reached their target, and how long they took
+        self.waits = 0
+        self.wait_timeouts = 0
+        self.wait_seconds = 0.0
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking adb-shell call off the event loop."""
+        if self._pool is not None:
+            return await self._pool.run(self.device_id, func, *args)
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
 
     async def connect(self) -> bool:
         """Connect to the Android device via ADB."""
@@ -51,19 +134,20 @@ class ADBManager:
             
             # Establish the TCP connection first
             _LOGGER.debug("Establishing TCP connection...")
-            await asyncio.get_event_loop().run_in_executor(
-                None, self._device.connect, None, self.timeout
-            )
+            await self._run(self._device.connect, None, self.timeout)
             
-            # Test with a simple echo command
+            # Test with a simple echo command, reading the boot id on the way
             _LOGGER.debug("Testing connection with echo command...")
-            result = await asyncio.get_event_loop().run_in_executor(
-                None, self._device.shell, "echo 'connection_test'"
+            result = await self._run(
+                self._device.shell, f"cat {BOOT_ID_PATH} 2>/dev/null; echo 'connection_test'"
             )
             
             if result and "connection_test" in result:
+                self._track_boot(result)
                 self._connected = True
                 _LOGGER.info("Successfully connected to Android TV Box at %s:%s", self.host, self.port)
+                if not self._storage_purged:
+                    await self.purge_device_screenshots()
                 return True
             else:
                 _LOGGER.error("Connection test failed - no response from device")
@@ -87,9 +171,7 @@ class ADBManager:
         """Disconnect from the Android device."""
         if self._device:
             try:
-                await asyncio.get_event_loop().run_in_executor(
-                    None, self._device.close
-                )
+                await self._run(self._device.close)
                 _LOGGER.info("Disconnected from Android TV Box")
             except Exception as e:
                 _LOGGER.error("Error disconnecting: %s", e)
@@ -102,16 +184,30 @@ class ADBManager:
         """Return connection status."""
         return self._connected and self._device is not None
 
-    async def _execute_command(self, command: str) -> Tuple[str, str]:
-        """Execute ADB command and return stdout, stderr."""
+    async def _execute_command(self, command: str, compress: bool = False) -> Tuple[str, str]:
+        """Execute ADB command and return stdout, stderr.
+
+        With ``compress`` the output is gzip-compressed on the device and
+        inflated on the host as it streams in, which pays off for large
+        outputs over Wi-Fi. Devices without a compressor run the command
+        uncompressed.
+        """
         if not self._device:
             raise ConnectionError("ADB device not connected")
 
         try:
             _LOGGER.debug("Executing ADB command: %s", command)
-            result = await asyncio.get_event_loop().run_in_executor(
-                None, self._device.shell, command
-            )
+            compressor = await self.async_get_compressor() if compress else None
+            if compressor:
+                data, transferred = await self._run(
+                    self._read_gzip_output, f"({command}) 2>&1 | {compressor} -1"
+                )
+                self.compressed_commands += 1
+                self.compressed_bytes += len(data)
+                self.compressed_bytes_transferred += transferred
+                result = data.decode("utf-8", errors="replace")
+            else:
+                result = await self._run(self._device.shell, command)
             
             # ADB shell returns string directly
             stdout = result.strip() if result else ""
@@ -127,6 +223,60 @@ class ADBManager:
             _LOGGER.error("Command failed: %s - %s", command, e)
             raise
 
+    def _track_boot(self, output: str) -> None:
+        """Record the boot id and drop boot-scoped caches after a reboot."""
+        m = _BOOT_ID.search(output)
+        if not m or m.group(1) == self.boot_id:
+            return
+        if self.boot_id is not None:
+            self.reboots += 1
+            _LOGGER.info("%s rebooted; dropping cached device state", self.device_id)
+        self.boot_id = m.group(1)
+        self.properties = {}
+        self._compressor_checked = False
+        self.compressor = None
+
+    @property
+    def gzip_available(self) -> Optional[bool]:
+        """Return whether the device can compress output (None until detected)."""
+        return bool(self.compressor) if self._compressor_checked else None
+
+    async def async_get_compressor(self) -> Optional[str]:
+        """Return the on-device gzip command, detecting it on first use."""
+        if self._compressor_checked:
+            return self.compressor
+        async with self._compressor_lock:
+            if self._compressor_checked:
+                return self.compressor
+            candidates = " ".join(f"'{candidate}'" for candidate in COMPRESSOR_CANDIDATES)
+            try:
+                stdout, _ = await self._execute_command(
+                    f"for c in {candidates}; do "
+                    'echo x | $c -1 > /dev/null 2>&1 && { echo "compressor:$c"; break; }; done; true'
+                )
+            except Exception as e:
+                _LOGGER.debug("Compressor detection failed: %s", e)
+                return None
+            match = re.search(r"compressor:(.+)", stdout)
+            self.compressor = match.group(1).strip() if match else None
+            self._compressor_checked = True
+            _LOGGER.debug("Compressor on %s: %s", self.device_id, self.compressor or "none")
+            return self.compressor
+
+    def compression_diagnostics(self) -> Dict[str, Any]:
+        """Return compressed transfer details."""
+        return {
+            "compressor": self.compressor,
+            "detected": self._compressor_checked,
+            "commands": self.compressed_commands,
+            "bytes": self.compressed_bytes,
+            "bytes_transferred": self.compressed_bytes_transferred,
+            "ratio": (
+                round(self.compressed_bytes / self.compressed_bytes_transferred, 2)
+                if self.compressed_bytes_transferred else None
+            ),
+        }
+
     async def check_connection(self) -> bool:
         """Check if ADB connection is active."""
         if not self._device:
@@ -134,12 +284,13 @@ class ADBManager:
             return False
             
         try:
-            # Use a simple echo test instead of checking for "connected"
-            result = await asyncio.get_event_loop().run_in_executor(
-                None, self._device.shell, "echo 'connection_check'"
+            # Echo test that also reads the boot id, so reboots are noticed for free
+            result = await self._run(
+                self._device.shell, f"cat {BOOT_ID_PATH} 2>/dev/null; echo 'connection_check'"
             )
             
             if result and "connection_check" in result:
+                self._track_boot(result)
                 self._connected = True
                 _LOGGER.debug("Connection check successful")
                 return True
@@ -157,6 +308,111 @@ class ADBManager:
             self._connected = False
             return False
 
+    async def _async_probe(self, probe: str) -> Any:
+        """Run the command variants of ``probe`` until one is understood.
+
+        Variants are tried in the order of the device's capability matrix
+        (fastest known-good first); each outcome and timing is recorded. A
+        variant that fails or times out counts as not understood and the next
+        one is tried; a lost connection fails the probe at once. Returns the
+        parsed result, or None if no variant answered; if every variant
+        failed, the last error is raised.
+        """
+        error: Optional[Exception] = None
+        for variant in self.capabilities.order(probe):
+            started = time.monotonic()
+            try:
+                out, _ = await self._execute_command(variant.command)
+            except ConnectionError:
+                raise
+            except Exception as e:
+                _LOGGER.debug("Probe %s variant %s failed: %s", probe, variant.name, e)
+                self.capabilities.record(probe, variant.name, time.monotonic() - started, False)
+                error = e
+                continue
+            error = None
+            result = variant.parse(out or "")
+            self.capabilities.record(probe, variant.name, time.monotonic() - started, result is not None)
+            if result is not None:
+                return result
+        if error is not None:
+            raise error
+        return None
+
+    async def async_wait_for(
+        self,
+        read: Callable[[], Awaitable[_T]],
+        reached: Callable[[_T], bool],
+        timeout: float,
+    ) -> Tuple[bool, Optional[_T]]:
+        """Poll ``read`` until ``reached`` holds for its result or ``timeout`` passes.
+
+        The first poll runs right away; later ones start WAIT_INITIAL_INTERVAL
+        apart and back off to WAIT_MAX_INTERVAL, so a quick device answers
+        within a round trip or two while a slow one is not flooded. Returns
+        whether the condition was reached and the last value read.
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + timeout
+        interval = WAIT_INITIAL_INTERVAL
+        value: Optional[_T] = None
+        while True:
+            try:
+                value = await read()
+            except Exception as e:
+                _LOGGER.debug("Wait condition read failed: %s", e)
+            else:
+                if reached(value):
+                    self.waits += 1
+                    self.wait_seconds += loop.time() - started
+                    return True, value
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                self.wait_timeouts += 1
+                return False, value
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * WAIT_BACKOFF, WAIT_MAX_INTERVAL)
+
+    def wait_diagnostics(self) -> Dict[str, Any]:
+        """Return condition-wait counters."""
+        return {
+            "reached": self.waits,
+            "timed_out": self.wait_timeouts,
+            "avg_wait_s": round(self.wait_seconds / self.waits, 3) if self.waits else None,
+        }
+
+    async def _is_running(self, package: str) -> bool:
+        """Return True if ``package`` has a process."""
+        stdout, _ = await self._execute_command(f"pidof {package} || true")
+        return bool(stdout.strip())
+
+    async def async_discover_capabilities(self) -> DeviceCapabilities:
+        """Time every probe variant once and prefer the fastest working one."""
+        capabilities = DeviceCapabilities(self.capabilities.fingerprint)
+        for probe, variants in PROBE_VARIANTS.items():
+            for variant in variants:
+                started = time.monotonic()
+                try:
+                    out, _ = await self._execute_command(variant.command)
+                    ok = variant.parse(out or "") is not None
+                except Exception as e:
+                    _LOGGER.debug("Probe variant %s/%s failed: %s", probe, variant.name, e)
+                    ok = False
+                capabilities.record(probe, variant.name, time.monotonic() - started, ok)
+        capabilities.select_fastest()
+        self.capabilities = capabilities
+        _LOGGER.debug("Capabilities of %s: %s", self.device_id, capabilities.as_dict())
+        return capabilities
+
+    async def get_build_fingerprint(self) -> Optional[str]:
+        """Return ``ro.build.fingerprint``."""
+        try:
+            return (await self.get_properties()).get("ro.build.fingerprint") or None
+        except Exception as e:
+            _LOGGER.debug("get_build_fingerprint failed: %s", e)
+            return None
+
     async def get_power_state(self) -> Tuple[str, bool]:
         """Get device power state.
         
@@ -166,50 +422,8 @@ class ADBManager:
             screen_on: True if screen is on, False otherwise
         """
         try:
-            stdout, _ = await self._execute_command(ADB_COMMANDS["power_state"])
-
-            wakefulness = "unknown"
-            screen_on = None
-
-            for line in stdout.split('\n'):
-                line = line.strip()
-                if 'mWakefulness=' in line:
-                    if 'Awake' in line:
-                        wakefulness = "on"
-                    elif 'Asleep' in line:
-                        wakefulness = "off"
-                    elif 'Dreaming' in line or 'Dozing' in line:
-                        wakefulness = "standby"
-                # Legacy field
-                if 'mScreenOn=' in line:
-                    screen_on = 'true' in line.lower()
-                # Newer formats: Display Power: state=ON/OFF
-                m = re.search(r"state=([A-Z]+)", line)
-                if m and 'Display' in line:
-                    state = m.group(1)
-                    if state == 'ON':
-                        screen_on = True
-                        if wakefulness == 'unknown':
-                            wakefulness = 'on'
-                    elif state in ('OFF', 'DOZE'):
-                        screen_on = False
-                        if wakefulness == 'unknown':
-                            wakefulness = 'off'
-
-            # Fallback to dumpsys display if screen_on is still unknown
-            if screen_on is None:
-                disp, _ = await self._execute_command(r"dumpsys display | grep -i 'mScreenState\|state=' | head -n 5")
-                if re.search(r"(mScreenState=ON|state=ON|Display 0 state=ON)", disp or '', re.I):
-                    screen_on = True
-                    if wakefulness == 'unknown':
-                        wakefulness = 'on'
-                elif re.search(r"(mScreenState=OFF|state=OFF|Display 0 state=OFF)", disp or '', re.I):
-                    screen_on = False
-                    if wakefulness == 'unknown':
-                        wakefulness = 'off'
-
-            return wakefulness, bool(screen_on) if screen_on is not None else False
-        
+            result = await self._async_probe("power")
+            return result if result is not None else ("unknown", False)
         except Exception as e:
             _LOGGER.error("Failed to get power state: %s", e)
             return "unknown", False
@@ -222,27 +436,17 @@ class ADBManager:
             if current == target:
                 return True
 
-            # First attempt
-            primary = ADB_CONTROL_COMMANDS["power_on" if power_on else "power_off"]
-            await self._execute_command(primary)
-            await asyncio.sleep(0.8)
-            new_state, _ = await self.get_power_state()
-            if new_state == target:
-                return True
+            def reached(state: Tuple[str, bool]) -> bool:
+                return state[0] == target
 
-            # Fallback: toggle power key
-            await self._execute_command("input keyevent 26")
-            await asyncio.sleep(0.8)
-            new_state, _ = await self.get_power_state()
-            if new_state == target:
-                return True
-
-            # Final retry once more
-            await asyncio.sleep(0.6)
-            await self._execute_command("input keyevent 26")
-            await asyncio.sleep(0.8)
-            new_state, _ = await self.get_power_state()
-            return new_state == target
+            # First attempt, then toggle the power key twice as fallback
+            primary = ADB_CONTROL_COMMANDS["power_on" if power_on else "power_off"]
+            for command in (primary, "input keyevent 26", "input keyevent 26"):
+                await self._execute_command(command)
+                ok, _state = await self.async_wait_for(self.get_power_state, reached, WAIT_TIMEOUTS["power"])
+                if ok:
+                    return True
+            return False
 
         except Exception as e:
             _LOGGER.error("Failed to set power state to %s: %s", power_on, e)
@@ -259,92 +463,81 @@ class ADBManager:
         except Exception as e:
             _LOGGER.debug("quick_power failed: %s", e)
 
-    async def get_wifi_state(self) -> Dict[str, Any]:
-        """Get WiFi connection state and information."""
-        wifi_info = {
-            "enabled": False,
-            "connected": False,
-            "ssid": None,
-            "ip_address": None,
-        }
-        
+    async def get_settings(self) -> SettingsSnapshot:
+        """Read the global, secure and system settings in one call."""
+        stdout, _ = await self._execute_command(SETTINGS_LIST_COMMAND, compress=True)
+        self.settings = SettingsSnapshot.parse(stdout)
+        return self.settings
+
+    async def get_network_state(self) -> Dict[str, Any]:
+        """Get WiFi and Ethernet state in one call.
+
+        Returns WiFi association (connected, ssid, rssi, link_speed,
+        frequency), the active transport's ``ip_address`` and
+        ``network_type``, ``ethernet_connected`` and per-interface details.
+        The WiFi status lookup is skipped while the latest settings snapshot
+        says WiFi is off. Command failures are raised rather than reported
+        as a disconnected network, so callers keep the last known state.
+        """
+        wifi_off = self.settings is not None and self.settings.wifi_enabled is False
         try:
-            # Check if WiFi is enabled
-            stdout, _ = await self._execute_command(ADB_COMMANDS["wifi_state"])
-            wifi_info["enabled"] = stdout.strip() == "1"
-            
-            if wifi_info["enabled"]:
-                # Get SSID
-                try:
-                    stdout, _ = await self._execute_command(ADB_COMMANDS["wifi_ssid"])
-                    if "SSID:" in stdout:
-                        ssid_line = stdout.strip()
-                        # Extract SSID from format: SSID: "NetworkName"
-                        if '"' in ssid_line:
-                            wifi_info["ssid"] = ssid_line.split('"')[1]
-                            wifi_info["connected"] = True
-                except Exception:
-                    pass
-                
-                # Get IP address
-                try:
-                    stdout, _ = await self._execute_command(ADB_COMMANDS["ip_address"])
-                    for line in stdout.split('\n'):
-                        if 'inet ' in line and not line.strip().startswith('inet 127.'):
-                            # Extract IP from format: inet 192.168.1.100/24
-                            ip_part = line.split('inet ')[1].split('/')[0].strip()
-                            wifi_info["ip_address"] = ip_part
-                            break
-                except Exception:
-                    pass
-            
+            stdout, _ = await self._execute_command(INTERFACES_COMMAND if wifi_off else NETWORK_COMMAND)
         except Exception as e:
-            _LOGGER.error("Failed to get WiFi state: %s", e)
-        
-        return wifi_info
+            _LOGGER.debug("Failed to get network state: %s", e)
+            raise
+        return parse_network_state(stdout)
 
     async def set_wifi_state(self, enabled: bool) -> bool:
         """Enable or disable WiFi."""
         try:
             command = ADB_CONTROL_COMMANDS["wifi_enable" if enabled else "wifi_disable"]
             await self._execute_command(command)
-            
-            # Wait for WiFi state to change
-            await asyncio.sleep(3.0)
-            
-            # Verify the state change
-            wifi_info = await self.get_wifi_state()
-            return wifi_info["enabled"] == enabled
+
+            # Wait for the wifi_on setting to follow, then refresh the snapshot
+            # that gates the WiFi part of the network probe
+            ok, _value = await self.async_wait_for(
+                self._read_wifi_on, lambda value: value == enabled, WAIT_TIMEOUTS["wifi"]
+            )
+            await self.get_settings()
+            return ok
             
         except Exception as e:
             _LOGGER.error("Failed to set WiFi state to %s: %s", enabled, e)
             return False
 
+    async def _read_wifi_on(self) -> Optional[bool]:
+        """Read ``global/wifi_on`` alone (cheaper than a full settings snapshot)."""
+        stdout, _ = await self._execute_command(ADB_COMMANDS["wifi_state"])
+        value = stdout.strip()
+        return value in ("1", "2") if value.isdigit() else None
+
+    async def get_properties(self) -> Dict[str, str]:
+        """Return the device's system properties from one ``getprop`` dump.
+
+        The map is kept until the device reboots.
+        """
+        if not self.properties:
+            stdout, _ = await self._execute_command("getprop", compress=True)
+            self.properties = parse_getprop(stdout)
+        return self.properties
+
     async def get_device_info(self) -> Dict[str, Any]:
         """Get device information."""
-        if self._device_info:
-            return self._device_info
-            
-        device_info = {}
-        
+        device_info: Dict[str, Any] = {}
         try:
-            # Get device model
-            stdout, _ = await self._execute_command(ADB_COMMANDS["device_model"])
-            device_info["model"] = stdout.strip() if stdout else "Unknown"
-            
-            # Get Android version
-            stdout, _ = await self._execute_command(ADB_COMMANDS["android_version"])
-            device_info["android_version"] = stdout.strip() if stdout else "Unknown"
-            
-            # Get device brand
-            stdout, _ = await self._execute_command(ADB_COMMANDS["device_brand"])
-            device_info["brand"] = stdout.strip() if stdout else "Unknown"
-            
-            self._device_info = device_info
-            
+            props = await self.get_properties()
         except Exception as e:
             _LOGGER.error("Failed to get device info: %s", e)
-            
+            return device_info
+
+        device_info["model"] = props.get("ro.product.model") or "Unknown"
+        device_info["android_version"] = props.get("ro.build.version.release") or "Unknown"
+        device_info["brand"] = props.get("ro.product.brand") or "Unknown"
+        device_info["manufacturer"] = props.get("ro.product.manufacturer")
+        device_info["sdk"] = props.get("ro.build.version.sdk")
+        device_info["serial"] = props.get("ro.serialno") or props.get("ro.boot.serialno")
+        device_info["fingerprint"] = props.get("ro.build.fingerprint")
+        device_info["build"] = props.get("ro.build.display.id")
         return device_info
 
     # ===== Media / Volume helpers =====
@@ -368,76 +561,90 @@ class ADBManager:
         return 0, 15, False
 
     async def set_volume(self, level: int) -> bool:
-        """Set media volume level (0..max). Uses service call audio."""
+        """Set media volume level (0..max). Uses service call audio.
+
+        Returns True once the command was sent. Some devices settle on a
+        nearby index, so the level actually set is left for the next poll to
+        reconcile.
+        """
         try:
             await self._execute_command(f"service call audio 12 i32 3 i32 {level} i32 0")
-            await asyncio.sleep(0.3)
             return True
         except Exception as e:
             _LOGGER.warning("set_volume failed: %s", e)
             return False
 
+    async def resolve_launch_activity(self, package: str) -> Optional[str]:
+        """Return the launcher component of ``package``, e.g. ``pkg/.MainActivity``."""
+        try:
+            stdout, _ = await self._execute_command(
+                f"cmd package resolve-activity --brief {package} | tail -n 1"
+            )
+        except Exception as e:
+            _LOGGER.debug("resolve_launch_activity failed for %s: %s", package, e)
+            return None
+        component = (stdout or "").strip()
+        return component if "/" in component and " " not in component else None
+
     async def start_app(self, target: str) -> bool:
         """Start an app by package or component.
 
         - If `target` contains '/', treat as component for am start -n
-        - Else resolve launcher activity or use monkey
+        - Else resolve launcher activity or use the launcher intent
+
+        ``am start -W`` returns once the activity has been drawn, so no
+        settle delay is needed. Returns False if the launch was rejected.
         """
         if not target:
             return False
+        if "/" not in target:
+            # Try to resolve launcher activity
+            component = await self.resolve_launch_activity(target)
+            if not component:
+                return await self.start_launcher_intent(target)
+            target = component
         try:
-            if "/" in target:
-                # Component specified
-                await self._execute_command(f"am start -n {target}")
-                await asyncio.sleep(0.8)
-                return True
+            return await self._am_start(target.split("/", 1)[0], f"-n {target}")
+        except Exception as e:
+            _LOGGER.warning("start_app failed for %s: %s", target, e)
+            return await self._monkey_start(target.split("/", 1)[0])
 
-            package = target
-            # Try to resolve launcher activity
-            comp_out, _ = await self._execute_command(
-                f"cmd package resolve-activity --brief {package} | tail -n 1"
+    async def start_launcher_intent(self, package: str) -> bool:
+        """Start ``package`` through its launcher intent, without resolving it."""
+        try:
+            return await self._am_start(
+                package, f"-a android.intent.action.MAIN -c android.intent.category.LAUNCHER {package}"
             )
-            comp_out = (comp_out or "").strip()
-            if comp_out and "/" in comp_out:
-                await self._execute_command(f"am start -n {comp_out}")
-                await asyncio.sleep(0.8)
-                return True
+        except Exception as e:
+            _LOGGER.warning("start_app failed for %s: %s", package, e)
+            return await self._monkey_start(package)
 
-            # Fallback to main launcher intent
-            await self._execute_command(
-                f"am start -a android.intent.action.MAIN -c android.intent.category.LAUNCHER {package}"
-            )
-            await asyncio.sleep(0.8)
+    async def _monkey_start(self, package: str) -> bool:
+        """Final fallback: start ``package`` with monkey."""
+        try:
+            await self._execute_command(f"monkey -p {package} -c android.intent.category.LAUNCHER 1")
             return True
         except Exception as e:
-            _LOGGER.warning("start_app failed for %s: %s", target, e)
-            # Final fallback to monkey
-            try:
-                await self._execute_command(f"monkey -p {target} -c android.intent.category.LAUNCHER 1")
-                await asyncio.sleep(0.8)
-                return True
-            except Exception as e2:
-                _LOGGER.warning("monkey fallback failed for %s: %s", target, e2)
-                return False
+            _LOGGER.warning("monkey fallback failed for %s: %s", package, e)
+            return False
+
+    async def _am_start(self, package: str, args: str) -> bool:
+        """Run ``am start -W``, record its timing and return whether it started."""
+        stdout, _ = await self._execute_command(am_start_command(package, args))
+        result = parse_am_start(stdout, package)
+        if result is None:
+            _LOGGER.debug("am start %s rejected: %s", args, stdout)
+            return False
+        self.launch_history.record(result)
+        _LOGGER.debug(
+            "Launched %s (%s) in %s ms", package, result.launch_state, result.total_time
+        )
+        return True
 
     async def get_current_app(self) -> Optional[str]:
         """Return current foreground app package if detectable."""
         try:
-            # Try activity stack first (Android 10+ may use 'topResumedActivity')
-            out, _ = await self._execute_command("dumpsys activity activities | grep -m 1 -E 'mResumedActivity|topResumedActivity'")
-            m = re.search(r" ([a-zA-Z0-9_\.]+)/(?:[A-Za-z0-9_\./]+)", out or "")
-            if m:
-                return m.group(1)
-            # Fallback: dumpsys activity top
-            out_top, _ = await self._execute_command("dumpsys activity top | head -n 20")
-            m_top = re.search(r"ACTIVITY\s+([a-zA-Z0-9_\.]+)/", out_top or "")
-            if m_top:
-                return m_top.group(1)
-            # Fallback to window focus
-            out2, _ = await self._execute_command("dumpsys window windows | grep -m 1 mCurrentFocus")
-            m2 = re.search(r" ([a-zA-Z0-9_\.]+)/", out2 or "")
-            if m2:
-                return m2.group(1)
+            return await self._async_probe("current_app")
         except Exception as e:
             _LOGGER.debug("get_current_app failed: %s", e)
         return None
@@ -460,42 +667,47 @@ class ADBManager:
         if not self.is_connected:
             return False
         try:
-            # Stop then start the ISG main activity
-            await self._execute_command("am force-stop com.linknlink.app.device.isg")
-            await asyncio.sleep(1.5)
-            await self._execute_command("am start -n com.linknlink.app.device.isg/.MainActivity")
-            return True
+            # Stop then start the ISG main activity once its process is gone
+            package = "com.linknlink.app.device.isg"
+            await self._execute_command(f"am force-stop {package}")
+            await self.async_wait_for(
+                lambda: self._is_running(package), lambda running: not running, WAIT_TIMEOUTS["app_stop"]
+            )
+            return await self._am_start(package, f"-n {package}/.MainActivity")
         except Exception as e:
             _LOGGER.warning("restart_isg failed: %s", e)
             return False
 
-    async def refresh_apps(self) -> bool:
-        """Refresh installed user apps list (pm list packages -3)."""
-        if not self.is_connected:
-            return False
+    async def get_package_signature(self) -> Optional[str]:
+        """Return a checksum of the installed third-party packages and versions."""
         try:
-            stdout, _ = await self._execute_command("pm list packages -3")
-            _LOGGER.debug("Installed apps sample: %s", (stdout or "").splitlines()[:10])
-            return True
+            stdout, _ = await self._execute_command(PACKAGE_SIGNATURE_COMMAND)
+            return parse_package_signature(stdout or "")
         except Exception as e:
-            _LOGGER.warning("refresh_apps failed: %s", e)
-            return False
+            _LOGGER.debug("get_package_signature failed: %s", e)
+            return None
 
-    async def list_installed_apps(self) -> list[str]:
-        """Return list of installed third-party package names (pm list packages -3)."""
+    async def list_packages(self) -> Dict[str, Optional[int]]:
+        """Return installed third-party packages mapped to their version codes."""
         if not self.is_connected:
-            return []
+            return {}
+        try:
+            stdout, _ = await self._execute_command(PACKAGE_LIST_COMMAND, compress=True)
+            return parse_package_list(stdout or "")
+        except Exception as e:
+            _LOGGER.debug("list_packages failed: %s", e)
+            return {}
+
+    async def get_package_details(self, packages: List[str]) -> Dict[str, AppInfo]:
+        """Return version and last update time of ``packages`` in one call."""
+        if not packages:
+            return {}
         try:
-            stdout, _ = await self._execute_command("pm list packages -3")
-            packages = []
-            for line in (stdout or "").splitlines():
-                line = line.strip()
-                if line.startswith("package:"):
-                    packages.append(line.split(":", 1)[1])
-            return sorted(set(packages))
+            stdout, _ = await self._execute_command(package_details_command(packages), compress=True)
+            return parse_package_details(stdout or "")
         except Exception as e:
-            _LOGGER.debug("list_installed_apps failed: %s", e)
-            return []
+            _LOGGER.debug("get_package_details failed: %s", e)
+            return {}
 
     async def reboot_device(self) -> bool:
         """Reboot the device."""
@@ -508,44 +720,146 @@ class ADBManager:
             _LOGGER.warning("reboot_device failed: %s", e)
             return False
 
-    async def take_screenshot(self) -> Optional[str]:
-        """Take a screenshot on device and save to /sdcard/Download/.
+    async def purge_device_screenshots(self) -> Tuple[int, int]:
+        """Delete leftover screenshot files from the device in one shell call.
 
-        Returns the device file path if successful.
+        Returns the number of files removed and the bytes reclaimed.
         """
-        if not self.is_connected:
+        script = (
+            f"for f in {DEVICE_SCREENSHOT_LEFTOVERS}; do "
+            '[ -f "$f" ] && wc -c < "$f" && rm -f "$f"; done; true'
+        )
+        try:
+            stdout, _ = await self._execute_command(script)
+        except Exception as e:
+            _LOGGER.debug("purge_device_screenshots failed: %s", e)
+            return 0, 0
+        sizes = [int(line) for line in stdout.split() if line.isdigit()]
+        self._storage_purged = True
+        self.storage_reclaimed = {
+            "files": len(sizes),
+            "bytes": sum(sizes),
+            "at": datetime.now().isoformat(),
+        }
+        if sizes:
+            _LOGGER.info(
+                "Removed %d leftover screenshots (%.1f MiB) from %s",
+                len(sizes), sum(sizes) / (1024 * 1024), self.device_id,
+            )
+        return len(sizes), sum(sizes)
+
+    async def capture_screen(self) -> Optional[bytes]:
+        """Capture the screen as PNG bytes streamed from ``screencap -p``.
+
+        Uses the exec-out service, so the binary output is neither written to
+        device storage nor mangled by a pty, and arrives in a single transfer.
+        """
+        if not self.is_connected or not self._device:
             return None
         try:
-            # Milliseconds timestamp-based name
-            ts = int(asyncio.get_event_loop().time() * 1000)
-            device_path = f"/sdcard/Download/android_tv_box_{ts}.png"
-            await self._execute_command(f"screencap -p {device_path}")
-            # Verify file exists
-            stdout, _ = await self._execute_command(f"ls {device_path}")
-            if device_path in (stdout or ""):
-                return device_path
+            data = await self._run(
+                functools.partial(
+                    self._device.exec_out,
+                    "screencap -p",
+                    transport_timeout_s=self.timeout,
+                    decode=False,
+                )
+            )
+            if data and data.startswith(PNG_SIGNATURE):
+                return data
+            _LOGGER.debug("capture_screen returned %d bytes without PNG signature", len(data or b""))
             return None
         except Exception as e:
-            _LOGGER.warning("take_screenshot failed: %s", e)
+            _LOGGER.warning("capture_screen failed: %s", e)
             return None
 
-    async def pull_file(self, device_path: str, local_path: str) -> bool:
-        """Pull a file from device to host using adb-shell file sync.
+    async def capture_screen_raw(self) -> Optional[bytes]:
+        """Capture the raw framebuffer (``screencap`` without ``-p``).
 
-        local_path should be an absolute path on the host.
+        Skips device-side PNG compression; the caller decodes and encodes the
+        frame on the host.
         """
         if not self.is_connected or not self._device:
-            return False
+            return None
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(local_path), exist_ok=True)
-            loop = asyncio.get_event_loop()
-            # Use the device's pull method in executor
-            await loop.run_in_executor(None, self._device.pull, device_path, local_path)
-            return os.path.exists(local_path) and os.path.getsize(local_path) > 0
+            return await self._run(
+                functools.partial(
+                    self._device.exec_out,
+                    "screencap",
+                    transport_timeout_s=self.timeout,
+                    decode=False,
+                )
+            )
         except Exception as e:
-            _LOGGER.warning("pull_file failed: %s", e)
-            return False
+            _LOGGER.warning("capture_screen_raw failed: %s", e)
+            return None
+
+    async def capture_screen_gzip(self) -> Optional[Tuple[bytes, int]]:
+        """Capture the raw framebuffer compressed on the device with ``gzip -1``.
+
+        The compressed stream is inflated chunk by chunk as it arrives.
+        Returns the raw screencap bytes and the number of bytes transferred,
+        or None if the device has no gzip.
+        """
+        if not self.is_connected or not self._device:
+            return None
+        compressor = await self.async_get_compressor()
+        if not compressor:
+            return None
+        try:
+            return await self._run(self._read_gzip_output, f"screencap | {compressor} -1")
+        except Exception as e:
+            _LOGGER.warning("capture_screen_gzip failed: %s", e)
+            return None
+
+    def _read_gzip_output(self, command: str) -> Tuple[bytes, int]:
+        """Run ``command`` and inflate its gzip output while streaming (worker thread)."""
+        inflater = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        data = bytearray()
+        transferred = 0
+        for chunk in self.iter_shell_output(command, self.timeout):
+            transferred += len(chunk)
+            data += inflater.decompress(chunk)
+        data += inflater.flush()
+        if not inflater.eof:
+            raise ValueError(f"truncated gzip stream after {transferred} bytes")
+        return bytes(data), transferred
+
+    def iter_shell_output(self, command: str, timeout: float) -> Iterator[bytes]:
+        """Yield raw output chunks of a long-running shell command.
+
+        Uses the exec service like ``exec_out``, so binary output is not
+        altered by a pty. Blocking generator meant for a worker thread;
+        ``timeout`` bounds how long a single read may wait for more output.
+
+        adb-shell has no public streaming form of ``exec_out``, so this relies
+        on its private ``_streaming_service`` (present through 0.4.x, which
+        the manifest pins). Should a release drop it, the output is read with
+        ``exec_out`` instead and arrives in one chunk when the command ends.
+        """
+        if not self._device:
+            raise ConnectionError("ADB device not connected")
+        streaming_service = getattr(self._device, "_streaming_service", None)
+        if streaming_service is None:
+            _LOGGER.debug("adb-shell lacks _streaming_service; reading %s with exec_out", command)
+            yield self._device.exec_out(
+                command, transport_timeout_s=timeout, read_timeout_s=timeout, decode=False
+            )
+            return
+        yield from streaming_service(
+            b"exec",
+            command.encode("utf-8"),
+            transport_timeout_s=timeout,
+            read_timeout_s=timeout,
+            decode=False,
+        )
+
+    async def stop_screenrecord(self) -> None:
+        """Stop any screenrecord process streaming from the device."""
+        try:
+            await self._execute_command("pkill -INT screenrecord || killall -INT screenrecord")
+        except Exception as e:
+            _LOGGER.debug("stop_screenrecord failed: %s", e)
 
     # ===== Media playback helpers =====
 
@@ -589,39 +903,13 @@ class ADBManager:
             _LOGGER.debug("media_previous failed: %s", e)
             return False
 
-    async def get_playback_state(self) -> str:
-        """Return playback state: 'playing', 'paused', or 'idle'."""
+    async def get_media_session(self) -> MediaSession:
+        """Return the active media session, with playback state and metadata."""
         try:
-            out, _ = await self._execute_command(
-                "dumpsys media_session | grep -m 1 -E 'state=PlaybackState|state=' || true"
-            )
-            # Numeric form: state=PlaybackState {state=3, ...}
-            m = re.search(r"state=PlaybackState \{state=(\d+)", out or "")
-            if m:
-                code = int(m.group(1))
-                if code == 3:
-                    return "playing"
-                if code in (2,):
-                    return "paused"
-                return "idle"
-            # Text form: state=PLAYING/PAUSED
-            m2 = re.search(r"state=([A-Z_]+)", out or "")
-            if m2:
-                st = m2.group(1)
-                if st == "PLAYING":
-                    return "playing"
-                if st in ("PAUSED", "STOPPED"): 
-                    return "paused"
-            # Fallback: active sessions
-            out2, _ = await self._execute_command("dumpsys media_session | grep -m 1 -E 'PlaybackState|state=' || true")
-            if "PLAYING" in (out2 or ""):
-                return "playing"
-            if "PAUSED" in (out2 or ""):
-                return "paused"
-            return "idle"
-        except Exception as e:
-            _LOGGER.debug("get_playback_state failed: %s", e)
-            return "idle"
+            return await self._async_probe("playback") or MediaSession("idle")
+        except Exception as e:
+            _LOGGER.debug("get_media_session failed: %s", e)
+            return MediaSession("idle")
 
     async def test_adb_connection(self) -> Dict[str, Any]:
         """Test ADB connection and return connection details."""
@@ -686,17 +974,19 @@ class ADBManager:
                     _LOGGER.warning("Power state check failed: %s", power_error)
                     result["connection_details"]["power_error"] = str(power_error)
                 
-                # Test WiFi state
+                # Test network state
                 try:
-                    wifi_info = await asyncio.wait_for(
-                        self.get_wifi_state(), 
+                    network_info = await asyncio.wait_for(
+                        self.get_network_state(), 
                         timeout=5
                     )
-                    result["wifi_enabled"] = wifi_info["enabled"]
-                    result["connection_details"]["wifi_info"] = wifi_info
-                except Exception as wifi_error:
-                    _LOGGER.warning("WiFi state check failed: %s", wifi_error)
-                    result["connection_details"]["wifi_error"] = str(wifi_error)
+                    result["wifi_enabled"] = (
+                        bool(self.settings.wifi_enabled) if self.settings is not None else network_info["connected"]
+                    )
+                    result["connection_details"]["network_info"] = network_info
+                except Exception as network_error:
+                    _LOGGER.warning("Network state check failed: %s", network_error)
+                    result["connection_details"]["network_error"] = str(network_error)
                     
             else:
                 _LOGGER.error("Initial connection failed after %.2f seconds", connection_time)
@@ -0,0 +1,250 @@
+"""Installed-app catalog for Android TV Box integration."""
+from __future__ import annotations
+
+import json
+import logging
+import re
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+from .const import APP_DETAILS_BATCH, DEFAULT_APPS
+
+if TYPE_CHECKING:
+    from .adb_manager import ADBManager
+
+_LOGGER = logging.getLogger(__name__)
+
+_PACKAGE_MARKER = "@@pkg:"
+
+# Third-party packages with their version codes; older releases without
+# --show-versioncode fall back to the bare list
+PACKAGE_LIST_COMMAND = (
+    "cmd package list packages -3 --show-versioncode 2>/dev/null "
+    "|| pm list packages -3 --show-versioncode 2>/dev/null "
+    "|| pm list packages -3"
+)
+# Checksum of the list above: a new, removed or updated app changes it
+PACKAGE_SIGNATURE_COMMAND = f"({PACKAGE_LIST_COMMAND}) | md5sum"
+
+_VALID_PACKAGE = re.compile(r"^[A-Za-z0-9_.]+$")
+_LIST_LINE = re.compile(r"^package:([A-Za-z0-9_.]+)(?:\s+versionCode:(\d+))?")
+_SIGNATURE = re.compile(r"^([0-9a-f]{32})\b")
+_DETAIL_FIELDS = {
+    "versionCode": re.compile(r"versionCode=(\d+)"),
+    "versionName": re.compile(r"versionName=(\S+)"),
+    "lastUpdateTime": re.compile(r"lastUpdateTime=([0-9: -]+\d)"),
+}
+
+
+class AppInfo(NamedTuple):
+    """Metadata of one installed package from ``dumpsys package``."""
+
+    version_code: Optional[int]
+    version_name: Optional[str]
+    last_update_time: Optional[str]
+
+
+def parse_package_signature(output: str) -> Optional[str]:
+    """Return the checksum printed by ``PACKAGE_SIGNATURE_COMMAND``."""
+    m = _SIGNATURE.match(output.strip())
+    return m.group(1) if m else None
+
+
+def parse_package_list(output: str) -> Dict[str, Optional[int]]:
+    """Parse ``pm list packages`` output into ``{package: version_code}``."""
+    packages: Dict[str, Optional[int]] = {}
+    for line in output.splitlines():
+        m = _LIST_LINE.match(line.strip())
+        if m:
+            packages[m.group(1)] = int(m.group(2)) if m.group(2) else None
+    return packages
+
+
+def package_details_command(packages: Iterable[str]) -> str:
+    """Return one shell call printing version and update time of ``packages``."""
+    names = " ".join(p for p in packages if _VALID_PACKAGE.match(p))
+    return (
+        f"for p in {names}; do echo \"{_PACKAGE_MARKER}$p\"; "
+        "dumpsys package $p | grep -m 3 -E 'versionCode=|versionName=|lastUpdateTime='; done"
+    )
+
+
+def parse_package_details(output: str) -> Dict[str, AppInfo]:
+    """Parse the output of ``package_details_command``."""
+    fields: Dict[str, Dict[str, str]] = {}
+    current: Optional[Dict[str, str]] = None
+    for line in output.splitlines():
+        line = line.strip()
+        if line.startswith(_PACKAGE_MARKER):
+            current = fields.setdefault(line[len(_PACKAGE_MARKER):], {})
+            continue
+        if current is None:
+            continue
+        for name, regex in _DETAIL_FIELDS.items():
+            m = regex.search(line)
+            if m and name not in current:
+                current[name] = m.group(1)
+    return {
+        package: AppInfo(
+            int(values["versionCode"]) if "versionCode" in values else None,
+            values.get("versionName"),
+            values.get("lastUpdateTime"),
+        )
+        for package, values in fields.items()
+    }
+
+
+def parse_apps_option(value: Any) -> Dict[str, str]:
+    """Parse the apps option (JSON ``{friendly name: package}``)."""
+    if isinstance(value, str) and value.strip():
+        try:
+            apps = json.loads(value)
+        except ValueError as e:
+            _LOGGER.warning("Failed to parse apps option: %s", e)
+        else:
+            if isinstance(apps, dict):
+                return {str(name): str(package) for name, package in apps.items()}
+            _LOGGER.warning("Apps option is not a JSON object")
+    return {}
+
+
+class AppCatalog:
+    """Installed third-party apps of one device, refreshed incrementally.
+
+    A refresh first reads a checksum of the package list and stops there when
+    it is unchanged. Otherwise the list is read with version codes, and only
+    new or updated packages have their metadata fetched, at most
+    ``APP_DETAILS_BATCH`` per refresh. The configured friendly names are
+    indexed in both directions for the select and media player entities, and
+    resolved launcher components are kept per package until its version or
+    update time changes.
+    """
+
+    def __init__(self, adb_manager: ADBManager, apps_option: Any, stored: Optional[Mapping[str, Any]] = None) -> None:
+        """Initialize the catalog, restoring a saved state if given."""
+        self._adb = adb_manager
+        self.names: Dict[str, str] = parse_apps_option(apps_option) or dict(DEFAULT_APPS)
+        self._labels: Dict[str, str] = {}
+        for name, package in self.names.items():
+            self._labels.setdefault(package, name)
+
+        self.signature: Optional[str] = None
+        self.versions: Dict[str, Optional[int]] = {}
+        self.apps: Dict[str, AppInfo] = {}
+        # package -> (launcher component, version key it was resolved for)
+        self.launch_components: Dict[str, Tuple[str, Optional[str]]] = {}
+        if stored:
+            self.signature = stored.get("signature")
+            self.versions = dict(stored.get("versions", {}))
+            self.apps = {package: AppInfo(*info) for package, info in stored.get("apps", {}).items()}
+            self.launch_components = {
+                package: (component, key) for package, (component, key) in stored.get("launch", {}).items()
+            }
+        self.changed = False
+        self.refreshes = 0
+        self.skipped = 0
+
+    @property
+    def packages(self) -> Tuple[str, ...]:
+        """Return the installed packages, sorted."""
+        return tuple(sorted(self.versions))
+
+    def _pending(self) -> List[str]:
+        """Return packages whose metadata is missing or older than the list."""
+        return sorted(
+            package
+            for package, version in self.versions.items()
+            if package not in self.apps
+            or (version is not None and self.apps[package].version_code != version)
+        )
+
+    def label_for(self, package: str) -> Optional[str]:
+        """Return the friendly name configured for ``package``."""
+        return self._labels.get(package)
+
+    def package_for(self, name: str) -> Optional[str]:
+        """Return the package of a friendly name, or ``name`` if it is a package."""
+        package = self.names.get(name)
+        if package is not None:
+            return package
+        return name if name in self.versions else None
+
+    def display_name(self, package: str) -> str:
+        """Return the friendly name of ``package``, or the package itself."""
+        return self._labels.get(package, package)
+
+    def _version_key(self, package: str) -> Optional[str]:
+        """Return what identifies the installed build of ``package``, if known."""
+        info = self.apps.get(package)
+        if info is not None and (info.version_code is not None or info.last_update_time):
+            return f"{info.version_code}@{info.last_update_time}"
+        version = self.versions.get(package)
+        return str(version) if version is not None else None
+
+    def launch_component(self, package: str) -> Optional[str]:
+        """Return the cached launcher component if it matches the installed build."""
+        cached = self.launch_components.get(package)
+        if cached is None or cached[1] != self._version_key(package):
+            return None
+        return cached[0]
+
+    def set_launch_component(self, package: str, component: Optional[str]) -> None:
+        """Cache (or with None, forget) the launcher component of ``package``."""
+        if component is None:
+            if self.launch_components.pop(package, None) is not None:
+                self.changed = True
+            return
+        entry = (component, self._version_key(package))
+        if self.launch_components.get(package) != entry:
+            self.launch_components[package] = entry
+            self.changed = True
+
+    async def async_refresh(self, force: bool = False) -> Optional[Tuple[str, ...]]:
+        """Refresh the catalog; return the package list, or None if unchanged."""
+        self.refreshes += 1
+        signature = await self._adb.get_package_signature()
+        if not force and signature is not None and signature == self.signature and not self._pending():
+            self.skipped += 1
+            return None
+
+        versions = await self._adb.list_packages()
+        if not versions and self.versions:
+            # An empty answer is more likely a failed call than no apps at all
+            return None
+        removed = set(self.versions) - set(versions)
+        for package in removed:
+            self.apps.pop(package, None)
+            self.launch_components.pop(package, None)
+        self.versions = versions
+        self.signature = signature
+
+        pending = self._pending()
+        if pending:
+            details = await self._adb.get_package_details(pending[:APP_DETAILS_BATCH])
+            self.apps.update(details)
+            _LOGGER.debug(
+                "App catalog of %s: %d metadata updates, %d pending",
+                self._adb.device_id, len(details), max(0, len(pending) - APP_DETAILS_BATCH),
+            )
+        self.changed = True
+        return self.packages
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the catalog in storable form."""
+        return {
+            "signature": self.signature,
+            "versions": dict(self.versions),
+            "apps": {package: list(info) for package, info in self.apps.items()},
+            "launch": {package: list(entry) for package, entry in self.launch_components.items()},
+        }
+
+    def diagnostics(self) -> Dict[str, Any]:
+        """Return catalog state for diagnostics."""
+        return {
+            "packages": len(self.versions),
+            "with_metadata": len(self.apps),
+            "pending_metadata": len(self._pending()),
+            "refreshes": self.refreshes,
+            "skipped_unchanged": self.skipped,
+            "friendly_names": len(self.names),
+            "cached_launch_components": len(self.launch_components),
+        }
@@ -0,0 +1,133 @@
+"""Binary sensor platform for Android TV Box integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, Optional
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN, ENTITY_SUFFIXES
+from .coordinator import AndroidTVBoxUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Android TV Box binary sensor entities from a config entry."""
+    coordinator: AndroidTVBoxUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+
+    async_add_entities(
+        [
+            AndroidTVBoxSettingBinarySensor(
+                coordinator, config_entry, ENTITY_SUFFIXES["adb_enabled"], "ADB Enabled",
+                "global", "adb_enabled", "mdi:android-debug-bridge",
+            ),
+            AndroidTVBoxSettingBinarySensor(
+                coordinator, config_entry, ENTITY_SUFFIXES["adb_wifi_enabled"], "Wireless ADB Enabled",
+                "global", "adb_wifi_enabled", "mdi:wifi-cog",
+            ),
+            AndroidTVBoxSettingBinarySensor(
+                coordinator, config_entry, ENTITY_SUFFIXES["development_settings"], "Developer Options",
+                "global", "development_settings_enabled", "mdi:developer-board",
+            ),
+            AndroidTVBoxEthernetBinarySensor(coordinator, config_entry),
+        ]
+    )
+
+
+class AndroidTVBoxSettingBinarySensor(CoordinatorEntity[AndroidTVBoxUpdateCoordinator], BinarySensorEntity):
+    """Diagnostic on/off flag read from the coordinator's settings snapshot."""
+
+    def __init__(
+        self,
+        coordinator: AndroidTVBoxUpdateCoordinator,
+        config_entry: ConfigEntry,
+        entity_suffix: str,
+        name: str,
+        namespace: str,
+        key: str,
+        icon: str,
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator)
+        self._config_entry = config_entry
+        self._namespace = namespace
+        self._key = key
+        self._attr_has_entity_name = True
+        self._attr_name = name
+        self._attr_icon = icon
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+
+        host = config_entry.data[CONF_HOST]
+        port = config_entry.data[CONF_PORT]
+        self._attr_unique_id = f"{host}:{port}_{entity_suffix}"
+
+    @property
+    def device_info(self) -> Dict[str, Any]:
+        """Return device info."""
+        return self.coordinator.device_info
+
+    @property
+    def available(self) -> bool:
+        """Return True once a settings snapshot has been read."""
+        return self.coordinator.data.is_connected and self.coordinator.data.settings is not None
+
+    @property
+    def is_on(self) -> Optional[bool]:
+        """Return True if the setting is enabled."""
+        settings = self.coordinator.data.settings
+        if settings is None:
+            return None
+        value = settings.get_int(self._namespace, self._key)
+        return bool(value) if value is not None else None
+
+
+class AndroidTVBoxEthernetBinarySensor(CoordinatorEntity[AndroidTVBoxUpdateCoordinator], BinarySensorEntity):
+    """Wired network link with an IPv4 address."""
+
+    _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+
+    def __init__(self, coordinator: AndroidTVBoxUpdateCoordinator, config_entry: ConfigEntry) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator)
+        self._config_entry = config_entry
+        self._attr_has_entity_name = True
+        self._attr_name = "Ethernet"
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+
+        host = config_entry.data[CONF_HOST]
+        port = config_entry.data[CONF_PORT]
+        self._attr_unique_id = f"{host}:{port}_{ENTITY_SUFFIXES['ethernet']}"
+
+    @property
+    def device_info(self) -> Dict[str, Any]:
+        """Return device info."""
+        return self.coordinator.device_info
+
+    @property
+    def available(self) -> bool:
+        """Return True if the device is connected."""
+        return self.coordinator.data.is_connected
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if the device is on a wired network."""
+        return self.coordinator.data.ethernet_connected
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return the active transport and address."""
+        return {
+            "network_type": self.coordinator.data.network_type,
+            "ip_address": self.coordinator.data.ip_address,
+        }
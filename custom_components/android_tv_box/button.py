@@ -1,7 +1,6 @@
 """Button platform for Android TV Box integration."""
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any, Dict
 
@@ -97,9 +96,8 @@ class AndroidTVBoxRestartISGButton(AndroidTVBoxButtonBase):
 
     async def async_press(self) -> None:
         try:
-            ok = await self.coordinator.adb_manager.restart_isg()
-            if ok:
-                await asyncio.sleep(3.0)
+            # restart_isg returns once the activity has been drawn
+            await self.coordinator.adb_manager.restart_isg()
             await self.coordinator.async_request_refresh()
         except Exception as e:
             _LOGGER.warning("Restart ISG failed: %s", e)
@@ -112,8 +110,7 @@ class AndroidTVBoxRefreshAppsButton(AndroidTVBoxButtonBase):
 
     async def async_press(self) -> None:
         try:
-            await self.coordinator.adb_manager.refresh_apps()
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_apps()
         except Exception as e:
             _LOGGER.warning("Refresh apps failed: %s", e)
 
@@ -137,16 +134,13 @@ class AndroidTVBoxScreenshotButton(AndroidTVBoxButtonBase):
 
     async def async_press(self) -> None:
         try:
-            device_path = await self.coordinator.adb_manager.take_screenshot()
-            if device_path:
-                _LOGGER.info("Screenshot saved on device: %s", device_path)
-                # Also pull to HA www directory for easy viewing
-                local_dir = "/home/bo/.homeassistant/www/screenshots"
-                ts = int(asyncio.get_event_loop().time() * 1000)
-                local_path = f"{local_dir}/android_tv_box_{ts}.png"
-                ok = await self.coordinator.adb_manager.pull_file(device_path, local_path)
-                if ok:
-                    _LOGGER.info("Screenshot copied to: %s", local_path)
+            # Reuse the shared frame cache instead of a separate device capture
+            capturer = self.coordinator.screen_capture
+            image = await capturer.async_get_frame()
+            if image:
+                local_path = await self.coordinator.screenshot_archive.async_add(image, capturer.content_type)
+                if local_path:
+                    _LOGGER.info("Screenshot saved to: %s", local_path)
             await self.coordinator.async_request_refresh()
         except Exception as e:
             _LOGGER.warning("Screenshot failed: %s", e)
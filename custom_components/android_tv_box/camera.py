@@ -1,26 +1,31 @@
 """Camera platform for Android TV Box integration."""
 from __future__ import annotations
 
-import asyncio
 import logging
-import os
 from typing import Any, Dict, Optional
 
-from homeassistant.components.camera import Camera
+from aiohttp import web
+
+from homeassistant.components.camera import Camera, CameraEntityFeature
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.network import NoURLAvailableError, get_url
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
+    CAPTURE_MODE_PNG,
+    DATA_VIEWS_REGISTERED,
     DOMAIN,
-    SCREENSHOT_DIR,
-    SCREENSHOT_RETAIN,
-    OPT_SCREENSHOT_DIR,
-    OPT_SCREENSHOT_RETAIN,
+    OPT_ARCHIVE_ON_CHANGE,
+    OPT_H264_STREAM,
+    OPT_SCREENSHOT_ARCHIVE,
 )
 from .coordinator import AndroidTVBoxUpdateCoordinator
+from .screen_capture import ScreenSnapshotView
+from .screen_record import ScreenRecordView
+from .screenshot_archive import ScreenshotFileView
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,6 +37,14 @@ async def async_setup_entry(
 ) -> None:
     """Set up Android TV Box camera from config entry."""
     coordinator: AndroidTVBoxUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+
+    # Views cannot be unregistered, so register once per HA run
+    if not hass.data.get(DATA_VIEWS_REGISTERED):
+        hass.http.register_view(ScreenRecordView(hass))
+        hass.http.register_view(ScreenSnapshotView(hass))
+        hass.http.register_view(ScreenshotFileView(hass))
+        hass.data[DATA_VIEWS_REGISTERED] = True
+
     async_add_entities([AndroidTVBoxCamera(coordinator, config_entry)])
 
 
@@ -50,12 +63,11 @@ class AndroidTVBoxCamera(CoordinatorEntity[AndroidTVBoxUpdateCoordinator], Camer
         port = config_entry.data[CONF_PORT]
         self._attr_unique_id = f"{host}:{port}_camera"
 
-        # ensure local screenshot dir exists (from options or default)
-        try:
-            opt_dir = self._config_entry.options.get(OPT_SCREENSHOT_DIR, SCREENSHOT_DIR)
-            os.makedirs(opt_dir, exist_ok=True)
-        except Exception as e:
-            _LOGGER.debug("Failed to ensure screenshot dir: %s", e)
+        self._capturer = coordinator.screen_capture
+        self.content_type = self._capturer.content_type
+
+        if config_entry.options.get(OPT_H264_STREAM, False):
+            self._attr_supported_features = CameraEntityFeature.STREAM
 
     @property
     def device_info(self) -> Dict[str, Any]:
@@ -64,45 +76,66 @@ class AndroidTVBoxCamera(CoordinatorEntity[AndroidTVBoxUpdateCoordinator], Camer
     async def async_camera_image(self, width: int | None = None, height: int | None = None) -> bytes | None:
         """Return a still image from the camera.
 
-        Strategy: take a screenshot on device, pull to local www/screenshots, enforce retention, return bytes.
+        Strategy: serve the shared frame cache, which streams a capture straight into
+        memory (PNG, or a raw framebuffer downscaled to ``width``/``height`` and
+        JPEG-encoded on the host) at most once per TTL for all viewers; archiving
+        happens in the background when enabled.
         """
         try:
-            device_path = await self.coordinator.adb_manager.take_screenshot()
-            if not device_path:
-                return None
-
-            ts = int(asyncio.get_event_loop().time() * 1000)
-            target_dir = self._config_entry.options.get(OPT_SCREENSHOT_DIR, SCREENSHOT_DIR)
-            retain = self._config_entry.options.get(OPT_SCREENSHOT_RETAIN, SCREENSHOT_RETAIN)
-            local_path = os.path.join(target_dir, f"android_tv_box_{ts}.png")
-            ok = await self.coordinator.adb_manager.pull_file(device_path, local_path)
-            if not ok:
+            captures, frame_id = self._capturer.captures, self._capturer.frame_id
+            image = await self._capturer.async_get_frame(width, height)
+            if image is None:
                 return None
 
-            # retention cleanup
-            try:
-                def _list_pngs() -> list[str]:
-                    return [
-                        os.path.join(SCREENSHOT_DIR, f)
-                        for f in os.listdir(SCREENSHOT_DIR)
-                        if f.endswith(".png")
-                    ]
-                files = await asyncio.to_thread(_list_pngs)
-                files.sort(key=os.path.getmtime)
-                if len(files) > retain:
-                    for f in files[:-retain]:
-                        try:
-                            await asyncio.to_thread(os.remove, f)
-                        except Exception:
-                            pass
-            except Exception as e:
-                _LOGGER.debug("Retention cleanup failed: %s", e)
-
-            # read bytes
-            def _read_bytes(p: str) -> bytes:
-                with open(p, "rb") as f:
-                    return f.read()
-            return await asyncio.to_thread(_read_bytes, local_path)
+            # Archive only frames this request actually captured (and, with the
+            # archive-on-change policy, only when the screen content changed).
+            # Viewers sharing one capture all see it as new, so each frame is
+            # archived once, by whichever request gets here first.
+            if self._config_entry.options.get(OPT_ARCHIVE_ON_CHANGE, True):
+                new_frame = self._capturer.frame_id != frame_id
+                key = ("frame", self._capturer.frame_id)
+            else:
+                new_frame = self._capturer.captures != captures
+                key = ("capture", self._capturer.captures)
+            if (
+                new_frame
+                and key != self._capturer.archived_key
+                and self._config_entry.options.get(OPT_SCREENSHOT_ARCHIVE, False)
+            ):
+                self._capturer.archived_key = key
+                # Archive full-size frames, not the thumbnails dashboards ask for
+                resized = (width or height) and self._capturer.mode != CAPTURE_MODE_PNG
+                self.hass.async_create_background_task(
+                    self._async_archive(None if resized else image),
+                    f"{DOMAIN} archive {self.entity_id}",
+                )
+            return image
         except Exception as e:
             _LOGGER.warning("Failed to capture camera image: %s", e)
             return None
+
+    async def stream_source(self) -> str | None:
+        """Return the local H.264 mirror URL for the stream component."""
+        if not self._config_entry.options.get(OPT_H264_STREAM, False):
+            return None
+        try:
+            base = get_url(self.hass, allow_external=False, allow_cloud=False)
+        except NoURLAvailableError:
+            base = f"http://127.0.0.1:{self.hass.http.server_port}"
+        path = ScreenRecordView.url.format(entry_id=self._config_entry.entry_id)
+        return f"{base}{path}?token={self.coordinator.screen_record.token}"
+
+    async def handle_async_mjpeg_stream(self, request: web.Request) -> web.StreamResponse | None:
+        """Serve a live MJPEG view fed by the device's shared capture loop."""
+        return await self.coordinator.screen_streamer.async_handle(request)
+
+    async def _async_archive(self, image: Optional[bytes]) -> None:
+        """Add a frame to the device's screenshot archive.
+
+        When ``image`` is None the latest frame is encoded at full size.
+        """
+        if image is None:
+            image = await self._capturer.async_encode()
+            if image is None:
+                return
+        await self.coordinator.screenshot_archive.async_add(image, self.content_type)
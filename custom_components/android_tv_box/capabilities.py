@@ -0,0 +1,187 @@
+"""Probe command variants and per-device capability matrix for Android TV Box."""
+from __future__ import annotations
+
+import re
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .const import ADB_COMMANDS, PROBE_EWMA_ALPHA
+from .media_session import MEDIA_SESSION_COMMAND, parse_media_session
+
+_DISPLAY_ON = re.compile(r"(mScreenState=ON|state=ON|Display 0 state=ON)", re.I)
+_DISPLAY_OFF = re.compile(r"(mScreenState=OFF|state=OFF|Display 0 state=OFF)", re.I)
+_DISPLAY_COMMAND = r"dumpsys display | grep -i 'mScreenState\|state=' | head -n 5"
+
+
+class ProbeVariant(NamedTuple):
+    """One way of answering a probe: a shell command and its output parser.
+
+    The parser returns None when the output is not understood, which marks
+    the variant as not working for that call.
+    """
+
+    name: str
+    command: str
+    parse: Callable[[str], Any]
+
+
+def parse_power(out: str) -> Optional[Tuple[str, bool]]:
+    """Parse ``dumpsys power`` and/or ``dumpsys display`` output.
+
+    Returns (power_state, screen_on), or None if the screen state is unknown.
+    """
+    wakefulness = "unknown"
+    screen_on = None
+
+    for line in out.split("\n"):
+        line = line.strip()
+        if "mWakefulness=" in line:
+            if "Awake" in line:
+                wakefulness = "on"
+            elif "Asleep" in line:
+                wakefulness = "off"
+            elif "Dreaming" in line or "Dozing" in line:
+                wakefulness = "standby"
+        # Legacy field
+        if "mScreenOn=" in line:
+            screen_on = "true" in line.lower()
+        # Newer formats: Display Power: state=ON/OFF
+        m = re.search(r"state=([A-Z]+)", line)
+        if m and "Display" in line:
+            state = m.group(1)
+            if state == "ON":
+                screen_on = True
+            elif state in ("OFF", "DOZE"):
+                screen_on = False
+
+    # dumpsys display output
+    if screen_on is None:
+        if _DISPLAY_ON.search(out):
+            screen_on = True
+        elif _DISPLAY_OFF.search(out):
+            screen_on = False
+    if screen_on is None:
+        return None
+    if wakefulness == "unknown":
+        wakefulness = "on" if screen_on else "off"
+    return wakefulness, screen_on
+
+
+def _package_parser(pattern: str) -> Callable[[str], Optional[str]]:
+    regex = re.compile(pattern)
+
+    def parse(out: str) -> Optional[str]:
+        m = regex.search(out)
+        return m.group(1) if m else None
+
+    return parse
+
+
+# Variants per probe, in the order tried before anything is known about a device
+PROBE_VARIANTS: Dict[str, Tuple[ProbeVariant, ...]] = {
+    "power": (
+        ProbeVariant("dumpsys_power", ADB_COMMANDS["power_state"], parse_power),
+        ProbeVariant(
+            "dumpsys_power_display", f"{ADB_COMMANDS['power_state']}; {_DISPLAY_COMMAND}", parse_power
+        ),
+    ),
+    "current_app": (
+        ProbeVariant(
+            "activities",
+            "dumpsys activity activities | grep -m 1 -E 'mResumedActivity|topResumedActivity'",
+            _package_parser(r" ([a-zA-Z0-9_\.]+)/(?:[A-Za-z0-9_\./]+)"),
+        ),
+        ProbeVariant(
+            "activity_top",
+            "dumpsys activity top | head -n 20",
+            _package_parser(r"ACTIVITY\s+([a-zA-Z0-9_\.]+)/"),
+        ),
+        ProbeVariant(
+            "window_focus",
+            "dumpsys window windows | grep -m 1 mCurrentFocus",
+            _package_parser(r" ([a-zA-Z0-9_\.]+)/"),
+        ),
+    ),
+    "playback": (
+        ProbeVariant("media_session", MEDIA_SESSION_COMMAND, parse_media_session),
+    ),
+}
+
+
+class DeviceCapabilities:
+    """Which probe variants work on one device, and how long each takes.
+
+    ``timings`` holds a smoothed latency per working variant and None for
+    variants whose output was not understood. The preferred variant is
+    tried first; if it stops answering and another variant does, that one
+    becomes preferred and ``changed`` is set so the owner can persist it.
+    """
+
+    def __init__(
+        self,
+        fingerprint: Optional[str] = None,
+        preferred: Optional[Dict[str, str]] = None,
+        timings: Optional[Dict[str, Dict[str, Optional[float]]]] = None,
+    ) -> None:
+        """Initialize the capability matrix."""
+        self.fingerprint = fingerprint
+        self.preferred: Dict[str, str] = dict(preferred or {})
+        self.timings: Dict[str, Dict[str, Optional[float]]] = {
+            probe: dict(values) for probe, values in (timings or {}).items()
+        }
+        self.changed = False
+
+    def order(self, probe: str) -> List[ProbeVariant]:
+        """Return the variants for ``probe``, fastest known-good first."""
+        timings = self.timings.get(probe, {})
+        preferred = self.preferred.get(probe)
+
+        def rank(variant: ProbeVariant) -> Tuple[int, float]:
+            if variant.name == preferred:
+                return (0, 0.0)
+            if variant.name not in timings:
+                return (2, 0.0)  # untested
+            seconds = timings[variant.name]
+            return (1, seconds) if seconds is not None else (3, 0.0)
+
+        return sorted(PROBE_VARIANTS[probe], key=rank)
+
+    def record(self, probe: str, variant: str, seconds: float, ok: bool) -> None:
+        """Record the outcome of running ``variant``."""
+        timings = self.timings.setdefault(probe, {})
+        previous = timings.get(variant)
+        if not ok:
+            timings[variant] = None
+        elif previous is None:
+            timings[variant] = seconds
+        else:
+            timings[variant] = previous + PROBE_EWMA_ALPHA * (seconds - previous)
+        if ok and self.preferred.get(probe) != variant:
+            preferred = self.preferred.get(probe)
+            if preferred is None or timings.get(preferred) is None:
+                self.preferred[probe] = variant
+                self.changed = True
+
+    def select_fastest(self) -> None:
+        """Prefer the fastest working variant of every probe."""
+        for probe, timings in self.timings.items():
+            working = {name: s for name, s in timings.items() if s is not None}
+            if working:
+                fastest = min(working, key=working.__getitem__)
+                if self.preferred.get(probe) != fastest:
+                    self.preferred[probe] = fastest
+                    self.changed = True
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the matrix in storable form."""
+        return {
+            "preferred": dict(self.preferred),
+            "timings": {
+                probe: {name: round(s, 4) if s is not None else None for name, s in values.items()}
+                for probe, values in self.timings.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, fingerprint: str, data: Dict[str, Any]) -> DeviceCapabilities:
+        """Restore a matrix saved with ``as_dict``."""
+        return cls(fingerprint, data.get("preferred"), data.get("timings"))
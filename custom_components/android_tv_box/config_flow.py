@@ -19,9 +19,23 @@ from .const import (
     DEFAULT_NAME,
     DEFAULT_PORT,
     DOMAIN,
+    CAPTURE_MODE_PNG,
+    CAPTURE_MODES,
+    OPT_CAPTURE_MODE,
+    OPT_H264_BITRATE,
+    OPT_H264_SIZE,
+    OPT_H264_STREAM,
+    DEFAULT_H264_BITRATE,
+    DEFAULT_H264_SIZE,
+    OPT_ARCHIVE_ON_CHANGE,
+    OPT_SCREENSHOT_ARCHIVE,
     OPT_SCREENSHOT_DIR,
+    OPT_SCREENSHOT_MAX_MB,
     OPT_SCREENSHOT_RETAIN,
+    OPT_SCREENSHOT_TTL,
+    DEFAULT_SCREENSHOT_TTL,
     SCREENSHOT_DIR,
+    SCREENSHOT_MAX_MB,
     SCREENSHOT_RETAIN,
     OPT_APPS,
     OPT_WAKE_TAP_KEY,
@@ -209,6 +223,41 @@ class AndroidTVBoxOptionsFlow(config_entries.OptionsFlow):
                             SCREENSHOT_RETAIN,
                         ),
                     ): vol.All(int, vol.Range(min=1, max=200)),
+                    vol.Optional(
+                        OPT_SCREENSHOT_MAX_MB,
+                        default=self.config_entry.options.get(
+                            OPT_SCREENSHOT_MAX_MB,
+                            SCREENSHOT_MAX_MB,
+                        ),
+                    ): vol.All(int, vol.Range(min=1, max=10000)),
+                    vol.Optional(
+                        OPT_SCREENSHOT_ARCHIVE,
+                        default=self.config_entry.options.get(OPT_SCREENSHOT_ARCHIVE, False),
+                    ): bool,
+                    vol.Optional(
+                        OPT_ARCHIVE_ON_CHANGE,
+                        default=self.config_entry.options.get(OPT_ARCHIVE_ON_CHANGE, True),
+                    ): bool,
+                    vol.Optional(
+                        OPT_CAPTURE_MODE,
+                        default=self.config_entry.options.get(OPT_CAPTURE_MODE, CAPTURE_MODE_PNG),
+                    ): vol.In(CAPTURE_MODES),
+                    vol.Optional(
+                        OPT_SCREENSHOT_TTL,
+                        default=self.config_entry.options.get(OPT_SCREENSHOT_TTL, DEFAULT_SCREENSHOT_TTL),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=60)),
+                    vol.Optional(
+                        OPT_H264_STREAM,
+                        default=self.config_entry.options.get(OPT_H264_STREAM, False),
+                    ): bool,
+                    vol.Optional(
+                        OPT_H264_BITRATE,
+                        default=self.config_entry.options.get(OPT_H264_BITRATE, DEFAULT_H264_BITRATE),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=100_000, max=20_000_000)),
+                    vol.Optional(
+                        OPT_H264_SIZE,
+                        default=self.config_entry.options.get(OPT_H264_SIZE, DEFAULT_H264_SIZE),
+                    ): vol.Any("", vol.Match(r"^\d+x\d+$")),
                     vol.Optional(
                         OPT_APPS,
                         default=self.config_entry.options.get(OPT_APPS, "{\"ISG\": \"com.linknlink.app.device.isg\"}"),
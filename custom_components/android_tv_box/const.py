@@ -17,6 +17,34 @@ DEFAULT_PORT: Final = 5555
 DEFAULT_NAME: Final = "Android TV Box"
 DEFAULT_SCAN_INTERVAL: Final = timedelta(seconds=60)
 DEFAULT_TIMEOUT: Final = 15
+# Time budget (seconds) for one poll cycle; slower probes publish late
+DEFAULT_POLL_BUDGET: Final = 8.0
+# Probes still running after this many seconds are cancelled
+DEFAULT_PROBE_MAX_RUNTIME: Final = 120.0
+# Weight of the newest run in the smoothed latency of each probe variant
+PROBE_EWMA_ALPHA: Final = 0.3
+
+# Domain-wide polling: how many devices may be probed at once, and how much of
+# each device's slot may be used for deterministic jitter
+DEFAULT_MAX_CONCURRENT_POLLS: Final = 4
+POLL_JITTER_FRACTION: Final = 0.25
+
+# Shared ADB worker pool: total worker threads across all devices, and how
+# many blocking calls a single device may have queued or running at once
+DEFAULT_ADB_POOL_WORKERS: Final = 8
+DEFAULT_ADB_PER_DEVICE_LIMIT: Final = 2
+
+# Keys in hass.data[DOMAIN] holding domain-wide objects (not config entries)
+DATA_SCHEDULER: Final = "scheduler"
+DATA_ADB_POOL: Final = "adb_pool"
+DATA_STORE: Final = "store"
+SHARED_DATA_KEYS: Final = (DATA_SCHEDULER, DATA_ADB_POOL, DATA_STORE)
+
+# Persistent storage of learned device data (sections keyed by build fingerprint)
+STORAGE_VERSION: Final = 1
+STORAGE_SAVE_DELAY: Final = 10  # seconds
+STORE_CAPABILITIES: Final = "capabilities"
+STORE_APP_CATALOG: Final = "app_catalog"  # keyed by host:port
 
 # Debug and diagnostics
 DEBUG_COMMANDS: Final = {
@@ -37,8 +65,6 @@ ADB_COMMANDS: Final = {
     
     # Network status
     "wifi_state": "settings get global wifi_on",
-    "wifi_ssid": "dumpsys wifi | grep 'SSID:' | head -1",
-    "ip_address": "ip addr show wlan0 | grep 'inet '",
     
     # Device info
     "device_model": "getprop ro.product.model",
@@ -46,6 +72,9 @@ ADB_COMMANDS: Final = {
     "device_brand": "getprop ro.product.brand",
 }
 
+# Read on connect and every connection check; a new value means the device rebooted
+BOOT_ID_PATH: Final = "/proc/sys/kernel/random/boot_id"
+
 # ADB Control Commands
 ADB_CONTROL_COMMANDS: Final = {
     # Power control
@@ -62,8 +91,23 @@ ENTITY_SUFFIXES: Final = {
     "adb_connection": "adb_connection",
     "power": "power",
     "wifi": "wifi",
+    # Settings-backed diagnostic entities
+    "screen_off_timeout": "screen_off_timeout",
+    "screen_brightness": "screen_brightness",
+    "stay_on_while_plugged_in": "stay_on_while_plugged_in",
+    "adb_enabled": "adb_enabled",
+    "adb_wifi_enabled": "adb_wifi_enabled",
+    "development_settings": "development_settings",
+    # Network diagnostic entities
+    "wifi_signal": "wifi_signal",
+    "wifi_link_speed": "wifi_link_speed",
+    "ethernet": "ethernet",
+    "app_launch_time": "app_launch_time",
 }
 
+# Namespaces read in one batched `settings list` call
+SETTINGS_NAMESPACES: Final = ("global", "secure", "system")
+
 # Button unique ID suffixes
 BUTTON_SUFFIXES: Final = {
     # Navigation
@@ -105,6 +149,7 @@ ATTR_ANDROID_VERSION: Final = "android_version"
 ATTR_DEVICE_BRAND: Final = "device_brand"
 ATTR_IP_ADDRESS: Final = "ip_address"
 ATTR_WIFI_SSID: Final = "wifi_ssid"
+ATTR_NETWORK_TYPE: Final = "network_type"
 
 # Update intervals for different data types
 UPDATE_INTERVALS: Final = {
@@ -117,17 +162,98 @@ UPDATE_INTERVALS: Final = {
 # Camera / Screenshot settings
 SCREENSHOT_DIR: Final = "/home/bo/.homeassistant/www/screenshots"
 SCREENSHOT_RETAIN: Final = 10  # keep last N screenshots locally
+SCREENSHOT_MAX_MB: Final = 200  # archive size quota per device
+
+# Screenshot files older versions left on the device, purged on connect
+DEVICE_SCREENSHOT_LEFTOVERS: Final = (
+    "/sdcard/Download/android_tv_box_*.png /data/local/tmp/android_tv_box_screen.png"
+)
 
 # Options keys for config entry
 OPT_SCREENSHOT_DIR: Final = "screenshot_dir"
 OPT_SCREENSHOT_RETAIN: Final = "screenshot_retain"
+OPT_SCREENSHOT_MAX_MB: Final = "screenshot_max_mb"
+OPT_SCREENSHOT_ARCHIVE: Final = "screenshot_archive"  # bool: also save camera frames to disk
+OPT_ARCHIVE_ON_CHANGE: Final = "archive_on_change"  # bool: skip archiving unchanged frames
+OPT_CAPTURE_MODE: Final = "capture_mode"  # one of CAPTURE_MODES
+
+# Screen capture modes: device-encoded PNG, or raw framebuffer encoded to JPEG on the host,
+# optionally gzip-compressed on the device for slow links ("auto" picks raw or gzip
+# from the measured transfer times)
+CAPTURE_MODE_PNG: Final = "png"
+CAPTURE_MODE_RAW: Final = "raw"
+CAPTURE_MODE_GZIP: Final = "raw_gzip"
+CAPTURE_MODE_AUTO: Final = "auto"
+CAPTURE_MODES: Final = [CAPTURE_MODE_PNG, CAPTURE_MODE_RAW, CAPTURE_MODE_GZIP, CAPTURE_MODE_AUTO]
+# On-device gzip implementations tried, in order, for compressed transfers
+COMPRESSOR_CANDIDATES: Final = ("gzip", "toybox gzip", "busybox gzip")
+TRANSFER_EWMA_ALPHA: Final = 0.3  # weight of the newest transfer in smoothed timings
+AUTO_REPROBE_CAPTURES: Final = 30  # auto mode retries the slower transfer every N captures
+
+# Condition waits in control paths: polls start WAIT_INITIAL_INTERVAL apart and
+# grow by WAIT_BACKOFF up to WAIT_MAX_INTERVAL until the deadline (seconds)
+WAIT_INITIAL_INTERVAL: Final = 0.05
+WAIT_MAX_INTERVAL: Final = 0.5
+WAIT_BACKOFF: Final = 1.5
+WAIT_TIMEOUTS: Final = {
+    "power": 2.0,
+    "wifi": 5.0,
+    "network": 8.0,
+    "app_stop": 3.0,
+}
+# Controls where a newer command supersedes older ones, with how long a
+# command waits for a newer one before it is sent (seconds)
+CONTROL_SETTLE: Final = {
+    "power": 0.0,
+    "volume": 0.15,
+    "wifi": 0.0,
+}
+JPEG_QUALITY: Final = 80
+ENCODED_FRAME_CACHE_SIZE: Final = 8  # encoded images kept per device, keyed by frame and size
+
+# Shared frame cache: how long a captured frame is served to all viewers
+OPT_SCREENSHOT_TTL: Final = "screenshot_ttl"  # seconds
+DEFAULT_SCREENSHOT_TTL: Final = 2.0
+CAPTURE_RATE_WINDOW: Final = 30  # recent captures used for the capture-rate metric
+
+# MJPEG live view: frame interval bounds (seconds), interval as a multiple of
+# the measured capture latency, and the width frames are downscaled to
+MJPEG_MIN_INTERVAL: Final = 0.2
+MJPEG_MAX_INTERVAL: Final = 5.0
+MJPEG_LATENCY_FACTOR: Final = 1.5
+MJPEG_FRAME_WIDTH: Final = 1280
+
+# H.264 mirroring via screenrecord (camera stream source)
+OPT_H264_STREAM: Final = "h264_stream"  # bool
+OPT_H264_BITRATE: Final = "h264_bitrate"  # bits per second
+OPT_H264_SIZE: Final = "h264_size"  # WIDTHxHEIGHT, empty for native
+DEFAULT_H264_BITRATE: Final = 2_000_000
+DEFAULT_H264_SIZE: Final = "1280x720"
+H264_SEGMENT_SECONDS: Final = 180  # Android caps screenrecord at 3 minutes
+H264_CLIENT_BUFFER_BYTES: Final = 4 * 1024 * 1024
+DATA_VIEWS_REGISTERED: Final = f"{DOMAIN}_views_registered"
 
 # Options for media player apps mapping (JSON string of {label: package})
 OPT_APPS: Final = "apps"
+# Friendly names used when the apps option is empty
+DEFAULT_APPS: Final = {
+    "ISG": "com.linknlink.app.device.isg",
+    "YouTube": "com.google.android.youtube",
+    "Netflix": "com.netflix.mediaclient",
+    "Spotify": "com.spotify.music",
+}
+# Installed-app catalog: list checksum interval and metadata reads per refresh
+APP_CATALOG_INTERVAL: Final = timedelta(minutes=15)
+APP_DETAILS_BATCH: Final = 20
+# Launches kept per app for launch timing statistics
+LAUNCH_HISTORY_SIZE: Final = 20
 
 # Option: send an extra key after wake to ensure screen lights
 OPT_WAKE_TAP_KEY: Final = "wake_tap_key"  # one of: NONE, CENTER, MENU
 
+# Seconds an optimistic value is shown without a confirming observation
+OPTIMISTIC_TIMEOUT: Final = 10.0
+
 # Playback behavior options
 OPT_OPTIMISTIC_PLAYBACK: Final = "optimistic_playback"  # bool
 OPT_PLAY_PAUSE_COMBINED: Final = "play_pause_combined"  # bool: use KEYCODE_MEDIA_PLAY_PAUSE for both actions
@@ -0,0 +1,63 @@
+"""Latest-wins command supersession for Android TV Box controls."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+_LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LatestWinsControl:
+    """Runs the commands of one control (power, volume, ...) one at a time.
+
+    Only the newest command matters: commands still queued behind the
+    running one are skipped without touching the device once a newer one
+    arrives. The running command is left to finish, since an adb-shell call
+    cannot be interrupted on its thread and a superseded power toggle landing
+    after its replacement would undo it. With a ``settle`` delay, a command
+    also waits that long for a newer one before it is queued, so a burst
+    such as a dragged volume slider ends in a single final command instead
+    of replaying every value.
+    """
+
+    def __init__(self, name: str, settle: float = 0.0) -> None:
+        """Initialize the control."""
+        self.name = name
+        self._settle = settle
+        self._lock = asyncio.Lock()
+        self._generation = 0
+        self.completed = 0
+        self.skipped = 0
+
+    async def async_run(self, command: Callable[[], Awaitable[T]]) -> Optional[T]:
+        """Run ``command`` unless a newer one arrives before it starts.
+
+        Returns the command's result, or None if it was superseded; the
+        caller must then leave any optimistic state to the newer command.
+        """
+        self._generation += 1
+        generation = self._generation
+        if self._settle:
+            await asyncio.sleep(self._settle)
+        if generation != self._generation:
+            self.skipped += 1
+            return None
+        async with self._lock:
+            if generation != self._generation:
+                self.skipped += 1
+                _LOGGER.debug("%s command superseded before it started", self.name)
+                return None
+            result = await command()
+            self.completed += 1
+            return result
+
+    def diagnostics(self) -> Dict[str, Any]:
+        """Return command counters."""
+        return {
+            "busy": self._lock.locked(),
+            "completed": self.completed,
+            "skipped": self.skipped,
+        }
@@ -4,97 +4,301 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, NamedTuple, Optional, Tuple, TypeVar
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .adb_manager import ADBManager
+from .app_catalog import AppCatalog
+from .capabilities import DeviceCapabilities
+from .controls import LatestWinsControl
+from .device_settings import SettingsSnapshot
+from .media_session import MediaSession, session_changed
 from .const import (
+    APP_CATALOG_INTERVAL,
+    CONTROL_SETTLE,
+    CAPTURE_MODE_PNG,
     ATTR_ANDROID_VERSION,
     ATTR_DEVICE_BRAND,
     ATTR_DEVICE_MODEL,
     ATTR_IP_ADDRESS,
+    ATTR_NETWORK_TYPE,
     ATTR_WIFI_SSID,
     CONF_DEVICE_NAME,
-    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_POLL_BUDGET,
+    DEFAULT_H264_BITRATE,
+    DEFAULT_H264_SIZE,
+    DEFAULT_PROBE_MAX_RUNTIME,
+    DEFAULT_SCREENSHOT_TTL,
     DOMAIN,
+    OPTIMISTIC_TIMEOUT,
+    OPT_APPS,
+    OPT_CAPTURE_MODE,
+    OPT_H264_BITRATE,
+    OPT_H264_SIZE,
+    OPT_OPTIMISTIC_POWER,
+    OPT_SCREENSHOT_DIR,
+    OPT_SCREENSHOT_MAX_MB,
+    OPT_SCREENSHOT_RETAIN,
+    OPT_SCREENSHOT_TTL,
+    SCREENSHOT_DIR,
+    STORE_APP_CATALOG,
+    STORE_CAPABILITIES,
+    WAIT_TIMEOUTS,
+    SCREENSHOT_MAX_MB,
+    SCREENSHOT_RETAIN,
 )
+from .screen_capture import ScreenCapturer, ScreenStreamer
+from .screen_record import ScreenRecordStream
+from .screenshot_archive import ScreenshotArchive
+
+if TYPE_CHECKING:
+    from .storage import AndroidTVBoxStore
+    from .worker_pool import ADBWorkerPool
 
 _LOGGER = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# A probe is a (fetch, apply) pair: ``fetch`` queries the device and ``apply``
+# folds its result into a snapshot.
+_Probe = Tuple[
+    Callable[[], Awaitable[Any]],
+    Callable[["AndroidTVBoxData", Any], "AndroidTVBoxData"],
+]
+
+# A snapshot transform such as ``lambda d: d.with_power_state("on", True)``
+SnapshotUpdate = Callable[["AndroidTVBoxData"], "AndroidTVBoxData"]
+
+
+class _Intent(NamedTuple):
+    """Optimistic value of one snapshot field, shown until ``expires`` (loop time)."""
+
+    value: Any
+    expires: float
+
+
+# Snapshot fields refreshed by each probe, used for staleness reporting.
+PROBE_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "power": ("power_state", "screen_on"),
+    "settings": ("settings", "wifi_enabled"),
+    "network": (
+        "wifi_connected",
+        "wifi_ssid",
+        "wifi_rssi",
+        "wifi_link_speed",
+        "wifi_frequency",
+        "ethernet_connected",
+        "network_type",
+        "ip_address",
+    ),
+    "volume": ("volume_level", "volume_max", "volume_percentage", "muted"),
+    "current_app": ("current_app_package",),
+    "playback": ("playback_state", "media_session"),
+    "installed_apps": ("installed_apps",),
+    "device_info": ("device_model", "android_version", "device_brand", "serial_number"),
+}
+
+
+# Snapshot fields and their defaults, in declaration order.
+_SNAPSHOT_FIELDS: Dict[str, Any] = {
+    # Connection status
+    "is_connected": False,
+    "last_seen": None,
+    # Device information
+    "device_model": None,
+    "android_version": None,
+    "device_brand": None,
+    "serial_number": None,
+    # Power state
+    "power_state": "unknown",  # on, off, standby, unknown
+    "screen_on": False,
+    # Network state
+    "wifi_enabled": False,
+    "wifi_connected": False,
+    "wifi_ssid": None,
+    "wifi_rssi": None,  # dBm
+    "wifi_link_speed": None,  # Mbps
+    "wifi_frequency": None,  # MHz
+    "ethernet_connected": False,
+    "network_type": None,  # ethernet, wifi, other
+    "ip_address": None,
+    # Media / volume state
+    "volume_level": 0,
+    "volume_max": 15,
+    "volume_percentage": 0.0,
+    "muted": False,
+    "current_app_package": None,
+    "playback_state": "idle",  # playing, paused, idle
+    # Active media session (package, metadata, position anchor)
+    "media_session": None,
+    "installed_apps": (),
+    # Latest `settings list` snapshot (global/secure/system)
+    "settings": None,
+    # Error tracking
+    "last_error": None,
+    "error_count": 0,
+}
+
 
 class AndroidTVBoxData:
-    """Class to hold Android TV Box data."""
+    """Immutable, versioned snapshot of Android TV Box state.
+
+    Snapshots are never modified in place. ``replace`` returns a new snapshot
+    that shares every unchanged value with its parent and carries the next
+    version number, so readers always see a consistent state.
+    """
+
+    __slots__ = ("version", *_SNAPSHOT_FIELDS)
+
+    if TYPE_CHECKING:
+        version: int
+        is_connected: bool
+        last_seen: Optional[datetime]
+        device_model: Optional[str]
+        android_version: Optional[str]
+        device_brand: Optional[str]
+        serial_number: Optional[str]
+        power_state: str
+        screen_on: bool
+        wifi_enabled: bool
+        wifi_connected: bool
+        wifi_ssid: Optional[str]
+        wifi_rssi: Optional[int]
+        wifi_link_speed: Optional[int]
+        wifi_frequency: Optional[int]
+        ethernet_connected: bool
+        network_type: Optional[str]
+        ip_address: Optional[str]
+        volume_level: int
+        volume_max: int
+        volume_percentage: float
+        muted: bool
+        current_app_package: Optional[str]
+        playback_state: str
+        media_session: Optional[MediaSession]
+        installed_apps: Tuple[str, ...]
+        settings: Optional[SettingsSnapshot]
+        last_error: Optional[str]
+        error_count: int
+
+    def __init__(self, version: int = 0, **fields: Any) -> None:
+        """Initialize a snapshot, using defaults for omitted fields."""
+        unknown = set(fields) - set(_SNAPSHOT_FIELDS)
+        if unknown:
+            raise TypeError(f"Unknown snapshot fields: {sorted(unknown)}")
+        object.__setattr__(self, "version", version)
+        for name, default in _SNAPSHOT_FIELDS.items():
+            object.__setattr__(self, name, fields.get(name, default))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable; use replace()")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} v{self.version} power={self.power_state} connected={self.is_connected}>"
+
+    def replace(self, **changes: Any) -> AndroidTVBoxData:
+        """Return a new snapshot with ``changes`` applied.
+
+        Returns ``self`` when no value actually changes, so the version only
+        advances on real state transitions.
+        """
+        unknown = set(changes) - set(_SNAPSHOT_FIELDS)
+        if unknown:
+            raise TypeError(f"Unknown snapshot fields: {sorted(unknown)}")
+        if "installed_apps" in changes:
+            changes["installed_apps"] = tuple(changes["installed_apps"])
+        if all(getattr(self, name) == value for name, value in changes.items()):
+            return self
+
+        snapshot = object.__new__(type(self))
+        object.__setattr__(snapshot, "version", self.version + 1)
+        for name in _SNAPSHOT_FIELDS:
+            object.__setattr__(snapshot, name, changes.get(name, getattr(self, name)))
+        return snapshot
+
+    def diff(self, other: Optional[AndroidTVBoxData]) -> frozenset[str]:
+        """Return the names of fields that differ between ``other`` and this snapshot."""
+        if other is None:
+            return frozenset(_SNAPSHOT_FIELDS)
+        if other is self:
+            return frozenset()
+        return frozenset(
+            name
+            for name in _SNAPSHOT_FIELDS
+            if getattr(self, name) is not getattr(other, name)
+            and getattr(self, name) != getattr(other, name)
+        )
 
-    def __init__(self) -> None:
-        """Initialize the data class."""
-        # Connection status
-        self.is_connected: bool = False
-        self.last_seen: Optional[datetime] = None
-        
-        # Device information
-        self.device_model: Optional[str] = None
-        self.android_version: Optional[str] = None
-        self.device_brand: Optional[str] = None
-        
-        # Power state
-        self.power_state: str = "unknown"  # on, off, standby, unknown
-        self.screen_on: bool = False
-        
-        # Network state
-        self.wifi_enabled: bool = False
-        self.wifi_connected: bool = False
-        self.wifi_ssid: Optional[str] = None
-        self.ip_address: Optional[str] = None
-        
-        # Media / volume state
-        self.volume_level: int = 0
-        self.volume_max: int = 15
-        self.volume_percentage: float = 0.0
-        self.muted: bool = False
-        self.current_app_package: Optional[str] = None
-        self.playback_state: str = "idle"  # playing, paused, idle
-        self.installed_apps: list[str] = []
-        
-        # Error tracking
-        self.last_error: Optional[str] = None
-        self.error_count: int = 0
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the snapshot fields as a plain dict."""
+        return {name: getattr(self, name) for name in _SNAPSHOT_FIELDS}
 
-    def update_connection_status(self, connected: bool) -> None:
-        """Update connection status."""
-        self.is_connected = connected
+    def with_connection_status(self, connected: bool) -> AndroidTVBoxData:
+        """Return a snapshot with updated connection status."""
         if connected:
-            self.last_seen = datetime.now()
-            self.error_count = 0
-            self.last_error = None
-        else:
-            self.error_count += 1
-
-    def update_device_info(self, device_info: Dict[str, Any]) -> None:
-        """Update device information."""
-        self.device_model = device_info.get("model")
-        self.android_version = device_info.get("android_version")
-        self.device_brand = device_info.get("brand")
-
-    def update_power_state(self, power_state: str, screen_on: bool) -> None:
-        """Update power state."""
-        self.power_state = power_state
-        self.screen_on = screen_on
-
-    def update_wifi_state(self, wifi_info: Dict[str, Any]) -> None:
-        """Update WiFi state."""
-        self.wifi_enabled = wifi_info.get("enabled", False)
-        self.wifi_connected = wifi_info.get("connected", False)
-        self.wifi_ssid = wifi_info.get("ssid")
-        self.ip_address = wifi_info.get("ip_address")
-
-    def set_error(self, error: str) -> None:
-        """Set error information."""
-        self.last_error = error
-        self.error_count += 1
+            return self.replace(
+                is_connected=True,
+                last_seen=datetime.now(),
+                error_count=0,
+                last_error=None,
+            )
+        return self.replace(is_connected=False, error_count=self.error_count + 1)
+
+    def with_device_info(self, device_info: Dict[str, Any]) -> AndroidTVBoxData:
+        """Return a snapshot with updated device information."""
+        return self.replace(
+            device_model=device_info.get("model"),
+            android_version=device_info.get("android_version"),
+            device_brand=device_info.get("brand"),
+            serial_number=device_info.get("serial"),
+        )
+
+    def with_power_state(self, power_state: str, screen_on: bool) -> AndroidTVBoxData:
+        """Return a snapshot with updated power state."""
+        return self.replace(power_state=power_state, screen_on=screen_on)
+
+    def with_network_state(self, network_info: Dict[str, Any]) -> AndroidTVBoxData:
+        """Return a snapshot with updated WiFi and Ethernet state."""
+        return self.replace(
+            wifi_connected=bool(network_info.get("connected")),
+            wifi_ssid=network_info.get("ssid"),
+            wifi_rssi=network_info.get("rssi"),
+            wifi_link_speed=network_info.get("link_speed"),
+            wifi_frequency=network_info.get("frequency"),
+            ethernet_connected=bool(network_info.get("ethernet_connected")),
+            network_type=network_info.get("network_type"),
+            ip_address=network_info.get("ip_address"),
+        )
+
+    def with_volume_state(self, volume: int, volume_max: int, muted: bool) -> AndroidTVBoxData:
+        """Return a snapshot with updated volume state."""
+        return self.replace(
+            volume_level=volume,
+            volume_max=volume_max,
+            muted=muted,
+            volume_percentage=(volume / volume_max * 100.0) if volume_max else 0.0,
+        )
+
+    def with_media_session(self, session: MediaSession) -> AndroidTVBoxData:
+        """Return a snapshot with updated media session state.
+
+        A session that only advanced along its previous position anchor
+        keeps that anchor, so playback alone does not publish a new snapshot.
+        """
+        if not session_changed(self.media_session, session):
+            return self.replace(playback_state=session.state)
+        return self.replace(playback_state=session.state, media_session=session)
+
+    def with_error(self, error: str) -> AndroidTVBoxData:
+        """Return a snapshot with error information recorded."""
+        return self.replace(last_error=error, error_count=self.error_count + 1)
 
     @property
     def device_info_dict(self) -> Dict[str, Any]:
@@ -105,6 +309,7 @@ class AndroidTVBoxData:
             ATTR_DEVICE_BRAND: self.device_brand or "Unknown",
             ATTR_IP_ADDRESS: self.ip_address,
             ATTR_WIFI_SSID: self.wifi_ssid,
+            ATTR_NETWORK_TYPE: self.network_type,
         }
 
 
@@ -115,33 +320,98 @@ class AndroidTVBoxUpdateCoordinator(DataUpdateCoordinator[AndroidTVBoxData]):
         self,
         hass: HomeAssistant,
         config_entry: ConfigEntry,
+        pool: Optional[ADBWorkerPool] = None,
+        store: Optional[AndroidTVBoxStore] = None,
     ) -> None:
         """Initialize the coordinator."""
         self.config_entry = config_entry
+        self._store = store
         self.host = config_entry.data[CONF_HOST]
         self.port = config_entry.data[CONF_PORT]
         self.device_name = config_entry.data[CONF_DEVICE_NAME]
         
         # Initialize ADB manager
-        self.adb_manager = ADBManager(self.host, self.port)
+        self.adb_manager = ADBManager(self.host, self.port, pool=pool)
+
+        # Screen frames shared by the camera and screenshot button
+        self.screen_capture = ScreenCapturer(
+            self.adb_manager,
+            config_entry.options.get(OPT_CAPTURE_MODE, CAPTURE_MODE_PNG),
+            config_entry.options.get(OPT_SCREENSHOT_TTL, DEFAULT_SCREENSHOT_TTL),
+            screen_on=lambda: self.observed.screen_on,
+        )
+        self.screen_streamer = ScreenStreamer(self.screen_capture)
+        self.screen_record = ScreenRecordStream(
+            self.adb_manager,
+            int(config_entry.options.get(OPT_H264_BITRATE, DEFAULT_H264_BITRATE)),
+            config_entry.options.get(OPT_H264_SIZE, DEFAULT_H264_SIZE) or None,
+        )
+        # Saved screenshots (camera archive and screenshot button)
+        self.screenshot_archive = ScreenshotArchive(
+            hass,
+            config_entry.options.get(OPT_SCREENSHOT_DIR, SCREENSHOT_DIR),
+            f"{self.host}:{self.port}",
+            int(config_entry.options.get(OPT_SCREENSHOT_RETAIN, SCREENSHOT_RETAIN)),
+            int(config_entry.options.get(OPT_SCREENSHOT_MAX_MB, SCREENSHOT_MAX_MB)) * 1024 * 1024,
+        )
         
+        # Installed apps with friendly names, shared by the select and media player
+        self.app_catalog = AppCatalog(
+            self.adb_manager,
+            config_entry.options.get(OPT_APPS),
+            store.get(STORE_APP_CATALOG, f"{self.host}:{self.port}") if store else None,
+        )
+
         # Update intervals
         self._last_device_info_update: Optional[datetime] = None
+        self._last_installed_apps_update: Optional[datetime] = None
+        self._boot_id: Optional[str] = None
+        # Settings that differed between the last two settings snapshots
+        self.settings_changes: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
         self._device_info_interval = timedelta(minutes=15)
-        self._installed_apps_interval = timedelta(minutes=15)
+        self._installed_apps_interval = APP_CATALOG_INTERVAL
         self._connection_check_failures = 0
         self._max_failures_before_reconnect = 3
 
+        # Per-cycle time budget; probes that miss it keep running in the background
+        self._poll_budget = DEFAULT_POLL_BUDGET
+        self._probe_max_runtime = DEFAULT_PROBE_MAX_RUNTIME
+        self._probe_tasks: Dict[str, asyncio.Task] = {}
+        self._probe_started: Dict[str, float] = {}
+        # Probe tasks the running cycle waits on; it collects their results
+        self._cycle_tasks: frozenset[asyncio.Task] = frozenset()
+        # Last measured latency (seconds) and outcome per probe
+        self.probe_latency: Dict[str, float] = {}
+        self.probe_errors: Dict[str, str] = {}
+        # When each probe last delivered a fresh result / started missing deadlines
+        self.probe_fresh_at: Dict[str, datetime] = {}
+        self.stale_probes: Dict[str, datetime] = {}
+
+        # Polling is driven by the domain-level scheduler, which staggers
+        # entries across DEFAULT_SCAN_INTERVAL, so no interval is set here
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=DEFAULT_SCAN_INTERVAL,
+            update_interval=None,
         )
         
         # Initialize data after super().__init__()
         # This ensures DataUpdateCoordinator doesn't override our data
-        self.data = AndroidTVBoxData()
+        self.data = AndroidTVBoxData().replace(installed_apps=self.app_catalog.packages)
+        # What the device last reported; ``data`` is this plus pending intents
+        self.observed = self.data
+        # Fields changed by the most recently published snapshot
+        self.last_changes: frozenset[str] = frozenset()
+        # Optimistic values awaiting confirmation, per snapshot field
+        self._intents: Dict[str, _Intent] = {}
+        self._intent_timer: Optional[asyncio.TimerHandle] = None
+        self.intents_confirmed = 0
+        self.intents_rolled_back = 0
+        # Device controls whose newest command supersedes older ones
+        self._controls: Dict[str, LatestWinsControl] = {
+            name: LatestWinsControl(name, settle) for name, settle in CONTROL_SETTLE.items()
+        }
 
     async def async_setup(self) -> bool:
         """Set up the coordinator."""
@@ -149,10 +419,11 @@ class AndroidTVBoxUpdateCoordinator(DataUpdateCoordinator[AndroidTVBoxData]):
             # Initial connection attempt
             connected = await self.adb_manager.connect()
             if connected:
+                await self._async_check_boot()
                 # Get initial device info
                 device_info = await self.adb_manager.get_device_info()
-                self.data.update_device_info(device_info)
-                self.data.update_connection_status(True)
+                self.observed = self.observed.with_device_info(device_info).with_connection_status(True)
+                self.data = self._render(self.observed)
                 _LOGGER.info("Android TV Box coordinator setup completed successfully")
                 return True
             else:
@@ -162,8 +433,181 @@ class AndroidTVBoxUpdateCoordinator(DataUpdateCoordinator[AndroidTVBoxData]):
             _LOGGER.error("Failed to set up Android TV Box coordinator: %s", e)
             return False
 
+    async def _async_check_boot(self) -> None:
+        """Reset boot-scoped state when the device has booted since last seen.
+
+        The ADB manager reads the boot id on every connect and connection
+        check (and drops its own property map then); here frames, periodic
+        probe timers and the capability matrix follow.
+        """
+        adb = self.adb_manager
+        if adb.boot_id is None or adb.boot_id == self._boot_id:
+            return
+        if self._boot_id is not None:
+            self.screen_capture.invalidate()
+            self._last_device_info_update = None
+        self._boot_id = adb.boot_id
+        await self._async_load_capabilities()
+
+    async def _async_load_capabilities(self) -> None:
+        """Load or discover the device's probe capabilities.
+
+        The matrix is stored per build fingerprint, so discovery only runs
+        for builds not seen before (including after a system update).
+        """
+        adb = self.adb_manager
+        fingerprint = await adb.get_build_fingerprint()
+        if not fingerprint or fingerprint == adb.capabilities.fingerprint:
+            return
+        stored = self._store.get(STORE_CAPABILITIES, fingerprint) if self._store else None
+        if stored:
+            adb.capabilities = DeviceCapabilities.from_dict(fingerprint, stored)
+            return
+        adb.capabilities = DeviceCapabilities(fingerprint)
+        await adb.async_discover_capabilities()
+        self._async_save_capabilities()
+
+    @callback
+    def _async_save_capabilities(self) -> None:
+        """Persist the capability matrix if it changed."""
+        capabilities = self.adb_manager.capabilities
+        if not capabilities.changed or not capabilities.fingerprint or self._store is None:
+            return
+        self._store.set(STORE_CAPABILITIES, capabilities.fingerprint, capabilities.as_dict())
+        capabilities.changed = False
+
+    @callback
+    def _async_save_app_catalog(self) -> None:
+        """Persist the app catalog if it changed."""
+        if not self.app_catalog.changed or self._store is None:
+            return
+        self._store.set(STORE_APP_CATALOG, f"{self.host}:{self.port}", self.app_catalog.as_dict())
+        self.app_catalog.changed = False
+
+    async def async_start_app(self, package: str) -> bool:
+        """Start ``package`` (or a ``package/activity`` component).
+
+        The launcher component comes from the app catalog when cached for the
+        installed build, so the launch is a single ``am start``; otherwise it
+        is resolved once and cached. A rejected cached component is dropped
+        and the launch retried with a fresh resolution. If resolution fails,
+        the launcher intent is started directly and nothing is cached, so the
+        next launch resolves again.
+        """
+        adb = self.adb_manager
+        if "/" in package:
+            return await adb.start_app(package)
+        catalog = self.app_catalog
+        component = catalog.launch_component(package)
+        if component is not None:
+            if await adb.start_app(component):
+                return True
+            catalog.set_launch_component(package, None)
+        component = await adb.resolve_launch_activity(package)
+        if component is None:
+            return await adb.start_launcher_intent(package)
+        catalog.set_launch_component(package, component)
+        self._async_save_app_catalog()
+        return await adb.start_app(component)
+
+    async def async_refresh_apps(self) -> None:
+        """Re-read the installed apps now, even if the list looks unchanged."""
+        packages = await self.app_catalog.async_refresh(force=True)
+        self.async_publish(self._apply_installed_apps(self.observed, packages))
+
+    @callback
+    def async_publish(self, snapshot: AndroidTVBoxData) -> None:
+        """Publish a newly observed snapshot to entities.
+
+        ``snapshot`` must derive from ``observed``, never from ``data``, so
+        optimistic values cannot pass for observations. Pending intents are
+        reconciled against it and the rest stay overlaid; listeners are only
+        called if what entities render changed.
+        """
+        self.observed = snapshot
+        rendered = self._render(snapshot)
+        if rendered is self.data:
+            return
+        self.last_changes = rendered.diff(self.data)
+        self.data = rendered
+        self.async_update_listeners()
+
+    @callback
+    def async_observe(self, update: SnapshotUpdate) -> None:
+        """Publish ``update`` applied to the observed snapshot."""
+        self.async_publish(update(self.observed))
+
+    @callback
+    def async_add_intent(self, update: SnapshotUpdate, timeout: float = OPTIMISTIC_TIMEOUT) -> frozenset[str]:
+        """Show ``update`` applied to the observed state right away.
+
+        Each field it changes stays overlaid on ``data`` until an observation
+        reports the same value, or is rolled back after ``timeout`` seconds.
+        Returns the fields, for ``async_cancel_intent``.
+        """
+        target = update(self.observed)
+        # Fields already showing the same optimistic value still replace the
+        # older intent (e.g. turning off again while "on" is pending)
+        fields = target.diff(self.observed) | update(self.data).diff(self.data)
+        expires = self.hass.loop.time() + timeout
+        for field in fields:
+            self._intents[field] = _Intent(getattr(target, field), expires)
+        self.async_publish(self.observed)
+        return fields
+
+    @callback
+    def async_cancel_intent(self, fields: Iterable[str]) -> None:
+        """Roll back intents now, e.g. after the command failed."""
+        for field in fields:
+            if self._intents.pop(field, None) is not None:
+                self.intents_rolled_back += 1
+        self.async_publish(self.observed)
+
+    def _render(self, observed: AndroidTVBoxData) -> AndroidTVBoxData:
+        """Reconcile intents with ``observed`` and return what entities show.
+
+        Intents whose value was observed are confirmed, expired ones are
+        dropped; the result keeps ``data``'s identity when nothing changed so
+        versions stay monotonic.
+        """
+        now = self.hass.loop.time()
+        for field, intent in list(self._intents.items()):
+            if getattr(observed, field) == intent.value:
+                del self._intents[field]
+                self.intents_confirmed += 1
+            elif now >= intent.expires:
+                del self._intents[field]
+                self.intents_rolled_back += 1
+                _LOGGER.debug(
+                    "Rolled back optimistic %s=%s (device reports %s)", field, intent.value, getattr(observed, field)
+                )
+        self._schedule_intent_expiry()
+        values = observed.as_dict()
+        values.update((field, intent.value) for field, intent in self._intents.items())
+        return self.data.replace(**values)
+
+    def _schedule_intent_expiry(self) -> None:
+        if self._intent_timer is not None:
+            self._intent_timer.cancel()
+            self._intent_timer = None
+        if self._intents:
+            expires = min(intent.expires for intent in self._intents.values())
+            self._intent_timer = self.hass.loop.call_at(expires, self._async_intents_expired)
+
+    @callback
+    def _async_intents_expired(self) -> None:
+        """Roll back what expired and look at the device again."""
+        self._intent_timer = None
+        self.async_publish(self.observed)
+        self.hass.async_create_task(self.async_request_refresh())
+
     async def _async_update_data(self) -> AndroidTVBoxData:
-        """Fetch data from Android TV Box."""
+        """Fetch data from Android TV Box.
+
+        ``observed`` is re-read after every await rather than captured up
+        front, so late probe results and control observations published
+        meanwhile are built upon instead of overwritten.
+        """
         try:
             # Check connection first
             if not self.adb_manager.is_connected:
@@ -179,7 +623,8 @@ class AndroidTVBoxUpdateCoordinator(DataUpdateCoordinator[AndroidTVBoxData]):
             connection_active = await self.adb_manager.check_connection()
             if not connection_active:
                 self._connection_check_failures += 1
-                self.data.update_connection_status(False)
+                self.observed = self.observed.with_connection_status(False)
+                self.data = self._render(self.observed)
                 
                 # Try to reconnect after multiple failures
                 if self._connection_check_failures >= self._max_failures_before_reconnect:
@@ -192,83 +637,205 @@ class AndroidTVBoxUpdateCoordinator(DataUpdateCoordinator[AndroidTVBoxData]):
                     else:
                         raise UpdateFailed("Failed to reconnect after multiple failures")
 
+            data = self.observed
             if connection_active:
-                self.data.update_connection_status(True)
-                
-                # Update power state
-                try:
-                    power_state, screen_on = await self.adb_manager.get_power_state()
-                    self.data.update_power_state(power_state, screen_on)
-                except Exception as e:
-                    _LOGGER.warning("Failed to get power state: %s", e)
-
-                # Update WiFi state
-                try:
-                    wifi_info = await self.adb_manager.get_wifi_state()
-                    self.data.update_wifi_state(wifi_info)
-                except Exception as e:
-                    _LOGGER.warning("Failed to get WiFi state: %s", e)
-
-                # Update volume state
-                try:
-                    vol, vmax, muted = await self.adb_manager.get_volume_state()
-                    self.data.volume_level = vol
-                    self.data.volume_max = vmax
-                    self.data.muted = muted
-                    self.data.volume_percentage = (vol / vmax * 100.0) if vmax else 0.0
-                except Exception as e:
-                    _LOGGER.debug("Failed to get volume state: %s", e)
-
-                # Update current app
-                try:
-                    pkg = await self.adb_manager.get_current_app()
-                    self.data.current_app_package = pkg
-                except Exception as e:
-                    _LOGGER.debug("Failed to get current app: %s", e)
-
-                # Update playback state (lightweight)
-                try:
-                    self.data.playback_state = await self.adb_manager.get_playback_state()
-                except Exception as e:
-                    _LOGGER.debug("Failed to get playback state: %s", e)
-
-                # Update installed apps periodically
-                now = datetime.now()
-                if (
-                    self._last_device_info_update is None
-                    or now - (self._last_device_info_update or now) > self._installed_apps_interval
-                ):
-                    try:
-                        apps = await self.adb_manager.list_installed_apps()
-                        if apps:
-                            self.data.installed_apps = apps
-                    except Exception as e:
-                        _LOGGER.debug("Failed to list installed apps: %s", e)
-
-                # Update device info periodically
-                now = datetime.now()
-                if (
-                    self._last_device_info_update is None
-                    or now - self._last_device_info_update > self._device_info_interval
-                ):
-                    try:
-                        device_info = await self.adb_manager.get_device_info()
-                        self.data.update_device_info(device_info)
-                        self._last_device_info_update = now
-                    except Exception as e:
-                        _LOGGER.warning("Failed to get device info: %s", e)
-
-            return self.data
+                await self._async_check_boot()
+                data = await self._async_run_probes()
+                data = data.with_connection_status(True)
+                self._async_save_capabilities()
+
+            self.observed = data
+            rendered = self._render(data)
+            self.last_changes = rendered.diff(self.data)
+            return rendered
 
         except UpdateFailed:
             raise
         except Exception as e:
             error_msg = f"Error updating Android TV Box data: {e}"
             _LOGGER.error(error_msg)
-            self.data.set_error(str(e))
-            self.data.update_connection_status(False)
+            self.observed = self.observed.with_error(str(e)).with_connection_status(False)
+            self.data = self._render(self.observed)
             raise UpdateFailed(error_msg)
 
+    def _due_probes(self) -> Dict[str, _Probe]:
+        """Return the probes that should run in this cycle."""
+        adb = self.adb_manager
+        probes: Dict[str, _Probe] = {
+            "power": (adb.get_power_state, lambda d, r: d.with_power_state(*r)),
+            "settings": (adb.get_settings, self._apply_settings),
+            "network": (adb.get_network_state, lambda d, r: d.with_network_state(r)),
+            "volume": (adb.get_volume_state, lambda d, r: d.with_volume_state(*r)),
+            "current_app": (adb.get_current_app, lambda d, r: d.replace(current_app_package=r)),
+            "playback": (adb.get_media_session, lambda d, r: d.with_media_session(r)),
+        }
+
+        # Update installed apps periodically
+        now = datetime.now()
+        if (
+            self._last_installed_apps_update is None
+            or now - self._last_installed_apps_update > self._installed_apps_interval
+        ):
+            probes["installed_apps"] = (self.app_catalog.async_refresh, self._apply_installed_apps)
+
+        # Update device info periodically
+        if (
+            self._last_device_info_update is None
+            or now - self._last_device_info_update > self._device_info_interval
+        ):
+            probes["device_info"] = (adb.get_device_info, self._apply_device_info)
+
+        return probes
+
+    def _apply_settings(self, data: AndroidTVBoxData, settings: SettingsSnapshot) -> AndroidTVBoxData:
+        changes = settings.diff(data.settings)
+        if data.settings is not None and changes:
+            _LOGGER.debug("Settings changed on %s: %s", self.adb_manager.device_id, sorted(changes))
+            self.settings_changes = changes
+        return data.replace(
+            settings=settings if changes else data.settings,
+            wifi_enabled=bool(settings.wifi_enabled),
+        )
+
+    def _apply_installed_apps(self, data: AndroidTVBoxData, packages: Optional[Tuple[str, ...]]) -> AndroidTVBoxData:
+        self._last_installed_apps_update = datetime.now()
+        self._async_save_app_catalog()
+        return data.replace(installed_apps=packages) if packages is not None else data
+
+    def _apply_device_info(self, data: AndroidTVBoxData, device_info: Dict[str, Any]) -> AndroidTVBoxData:
+        self._last_device_info_update = datetime.now()
+        return data.with_device_info(device_info)
+
+    async def _async_timed_probe(self, name: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Run one probe and record its latency."""
+        start = self.hass.loop.time()
+        try:
+            return await fetch()
+        finally:
+            self.probe_latency[name] = round(self.hass.loop.time() - start, 3)
+
+    def _collect_probe(self, name: str, task: asyncio.Task, apply: Callable, data: AndroidTVBoxData) -> AndroidTVBoxData:
+        """Fold a finished probe task into ``data``."""
+        self._probe_tasks.pop(name, None)
+        self._probe_started.pop(name, None)
+        self.stale_probes.pop(name, None)
+        if task.cancelled():
+            self.probe_errors[name] = "cancelled"
+            return data
+        err = task.exception()
+        if err is not None:
+            _LOGGER.debug("Probe %s failed: %s", name, err)
+            self.probe_errors[name] = str(err) or type(err).__name__
+            return data
+        self.probe_errors.pop(name, None)
+        self.probe_fresh_at[name] = datetime.now()
+        return apply(data, task.result())
+
+    @callback
+    def _async_late_probe_done(self, name: str, apply: Callable, task: asyncio.Task) -> None:
+        """Publish a probe that finished after its cycle's deadline."""
+        if task in self._cycle_tasks or self._probe_tasks.get(name) is not task:
+            # The running cycle collects it (or it was already collected)
+            return
+        self.async_publish(self._collect_probe(name, task, apply, self.observed))
+
+    async def _async_run_probes(self) -> AndroidTVBoxData:
+        """Run due probes within the poll budget and fold in what finishes.
+
+        Results are folded into ``observed`` as it is once the wait is over,
+        so anything published while the probes ran is kept. Probes that miss
+        the deadline keep their previous values and are reported as stale;
+        they keep running in the background and publish their result when
+        they complete, unless they exceed the maximum runtime, in which case
+        they are cancelled.
+        """
+        loop = self.hass.loop
+        now = loop.time()
+        probes = self._due_probes()
+
+        # Cancel probes stuck beyond the maximum runtime
+        for name, task in list(self._probe_tasks.items()):
+            if now - self._probe_started.get(name, now) > self._probe_max_runtime:
+                _LOGGER.debug("Cancelling probe %s after %.1fs", name, now - self._probe_started[name])
+                task.cancel()
+
+        appliers: Dict[str, Callable] = {}
+        for name, (fetch, apply) in probes.items():
+            appliers[name] = apply
+            if name in self._probe_tasks:
+                # Still running from an earlier cycle; wait on it again
+                continue
+            task = loop.create_task(self._async_timed_probe(name, fetch))
+            task.add_done_callback(lambda t, n=name, a=apply: self._async_late_probe_done(n, a, t))
+            self._probe_tasks[name] = task
+            self._probe_started[name] = now
+
+        in_flight = {task: name for name, task in self._probe_tasks.items() if name in appliers}
+        if not in_flight:
+            return self.observed
+
+        self._cycle_tasks = frozenset(in_flight)
+        try:
+            done, pending = await asyncio.wait(in_flight, timeout=self._poll_budget)
+        finally:
+            self._cycle_tasks = frozenset()
+
+        data = self.observed
+        for task in done:
+            name = in_flight[task]
+            data = self._collect_probe(name, task, appliers[name], data)
+
+        stale_since = datetime.now()
+        for task in pending:
+            name = in_flight[task]
+            self.stale_probes.setdefault(name, self.probe_fresh_at.get(name, stale_since))
+            _LOGGER.debug("Probe %s missed the %.1fs poll budget", name, self._poll_budget)
+
+        return data
+
+    @property
+    def stale_fields(self) -> Dict[str, Optional[str]]:
+        """Return stale snapshot fields mapped to when they were last fresh."""
+        report: Dict[str, Optional[str]] = {}
+        for name in self.stale_probes:
+            fresh = self.probe_fresh_at.get(name)
+            for field in PROBE_FIELDS.get(name, ()):
+                report[field] = fresh.isoformat() if fresh else None
+        return report
+
+    def poll_diagnostics(self) -> Dict[str, Any]:
+        """Return per-probe latency and staleness details for diagnostics."""
+        loop_now = self.hass.loop.time()
+        return {
+            "poll_budget_s": self._poll_budget,
+            "probe_latency_s": dict(self.probe_latency),
+            "probe_errors": dict(self.probe_errors),
+            "probes_in_flight": {
+                name: round(loop_now - started, 3)
+                for name, started in self._probe_started.items()
+            },
+            "stale_fields": self.stale_fields,
+            "snapshot_version": self.data.version,
+            "optimistic": {
+                "pending": {
+                    field: {"value": intent.value, "expires_in_s": round(intent.expires - loop_now, 3)}
+                    for field, intent in self._intents.items()
+                },
+                "confirmed": self.intents_confirmed,
+                "rolled_back": self.intents_rolled_back,
+            },
+            "controls": {name: control.diagnostics() for name, control in self._controls.items()},
+        }
+
+    async def async_run_control(self, control: str, command: Callable[[], Awaitable[T]]) -> Optional[T]:
+        """Run ``command`` on ``control`` ("power", "volume" or "wifi").
+
+        A command still waiting behind the running one is skipped when a
+        newer command for the same control arrives; None is returned then,
+        and the newer command owns the control's optimistic state.
+        """
+        return await self._controls[control].async_run(command)
+
     async def async_set_power_state(self, power_on: bool) -> bool:
         """Set device power state."""
         try:
@@ -277,13 +844,22 @@ class AndroidTVBoxUpdateCoordinator(DataUpdateCoordinator[AndroidTVBoxData]):
                 if not connected:
                     return False
 
-            success = await self.adb_manager.set_power_state(power_on)
-            
+            intent: frozenset[str] = frozenset()
+            if self.config_entry.options.get(OPT_OPTIMISTIC_POWER, True):
+                intent = self.async_add_intent(
+                    lambda d: d.with_power_state("on" if power_on else "off", power_on)
+                )
+            success = await self.async_run_control("power", lambda: self.adb_manager.set_power_state(power_on))
+            if success is None:
+                # Superseded; the newer command reports the outcome
+                return True
+
             if success:
-                # Immediately update local state
-                await asyncio.sleep(0.5)  # Brief wait for state change
+                # set_power_state returns once the device reports the target state
                 power_state, screen_on = await self.adb_manager.get_power_state()
-                self.data.update_power_state(power_state, screen_on)
+                self.async_observe(lambda d: d.with_power_state(power_state, screen_on))
+            else:
+                self.async_cancel_intent(intent)
                 
             # Request a full refresh
             await self.async_request_refresh()
@@ -301,13 +877,28 @@ class AndroidTVBoxUpdateCoordinator(DataUpdateCoordinator[AndroidTVBoxData]):
                 if not connected:
                     return False
 
-            success = await self.adb_manager.set_wifi_state(enabled)
-            
-            if success:
-                # Immediately update local state
-                await asyncio.sleep(1.0)  # Wait for WiFi state change
-                wifi_info = await self.adb_manager.get_wifi_state()
-                self.data.update_wifi_state(wifi_info)
+            intent = self.async_add_intent(lambda d: d.replace(wifi_enabled=enabled))
+
+            async def set_wifi() -> Tuple[bool, Dict[str, Any]]:
+                if not await self.adb_manager.set_wifi_state(enabled):
+                    return False, {}
+                # Publish as soon as the association follows (or fails to in time)
+                _ok, network_info = await self.adb_manager.async_wait_for(
+                    self.adb_manager.get_network_state,
+                    lambda info: bool(info["connected"]) == enabled,
+                    WAIT_TIMEOUTS["network"],
+                )
+                return True, network_info or {}
+
+            result = await self.async_run_control("wifi", set_wifi)
+            if result is None:
+                # Superseded; the newer command reports the outcome
+                return True
+            success, network_info = result
+            if not success:
+                self.async_cancel_intent(intent)
+            else:
+                self.async_observe(lambda d: d.with_network_state(network_info).replace(wifi_enabled=enabled))
                 
             # Request a full refresh
             await self.async_request_refresh()
@@ -319,6 +910,16 @@ class AndroidTVBoxUpdateCoordinator(DataUpdateCoordinator[AndroidTVBoxData]):
 
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
+        self.screen_streamer.stop()
+        self.screen_record.stop()
+        for task in self._probe_tasks.values():
+            task.cancel()
+        self._probe_tasks.clear()
+        self._probe_started.clear()
+        await self.screenshot_archive.async_shutdown()
+        if self._intent_timer is not None:
+            self._intent_timer.cancel()
+            self._intent_timer = None
         if self.adb_manager:
             await self.adb_manager.disconnect()
 
@@ -331,5 +932,6 @@ class AndroidTVBoxUpdateCoordinator(DataUpdateCoordinator[AndroidTVBoxData]):
             "manufacturer": self.data.device_brand or "Android",
             "model": self.data.device_model or "TV Box",
             "sw_version": self.data.android_version,
+            "serial_number": self.data.serial_number,
             "configuration_url": f"http://{self.host}:{self.port}",
         } 
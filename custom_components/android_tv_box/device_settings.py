@@ -0,0 +1,92 @@
+"""Android settings snapshots for Android TV Box integration."""
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+from .const import SETTINGS_NAMESPACES
+
+_SECTION_MARKER = "@@settings:"
+
+# One shell call listing every namespace, each preceded by a marker line
+SETTINGS_LIST_COMMAND = "; ".join(
+    f"echo '{_SECTION_MARKER}{namespace}'; settings list {namespace}"
+    for namespace in SETTINGS_NAMESPACES
+)
+
+
+class SettingsSnapshot:
+    """Immutable view of ``settings list`` for the global, secure and system namespaces."""
+
+    __slots__ = ("_values",)
+
+    def __init__(self, values: Mapping[str, Mapping[str, str]]) -> None:
+        """Initialize the snapshot."""
+        self._values: Mapping[str, Mapping[str, str]] = MappingProxyType(
+            {namespace: MappingProxyType(dict(values.get(namespace, {}))) for namespace in SETTINGS_NAMESPACES}
+        )
+
+    @classmethod
+    def parse(cls, output: str) -> SettingsSnapshot:
+        """Parse the output of ``SETTINGS_LIST_COMMAND``."""
+        values: Dict[str, Dict[str, str]] = {}
+        current: Optional[Dict[str, str]] = None
+        for line in output.splitlines():
+            line = line.rstrip("\r")
+            if line.startswith(_SECTION_MARKER):
+                current = values.setdefault(line[len(_SECTION_MARKER):].strip(), {})
+            elif current is not None and "=" in line:
+                key, _, value = line.partition("=")
+                current[key.strip()] = value
+        return cls(values)
+
+    def get(self, namespace: str, key: str) -> Optional[str]:
+        """Return a setting value, or None if it is not set."""
+        return self._values.get(namespace, {}).get(key)
+
+    def get_int(self, namespace: str, key: str) -> Optional[int]:
+        """Return a setting as an integer, or None if unset or not numeric."""
+        value = self.get(namespace, key)
+        try:
+            return int(value) if value not in (None, "null") else None
+        except ValueError:
+            return None
+
+    @property
+    def wifi_enabled(self) -> Optional[bool]:
+        """Return whether WiFi is on (``wifi_on`` 2 means on in airplane mode)."""
+        value = self.get("global", "wifi_on")
+        return value in ("1", "2") if value is not None else None
+
+    def _items(self) -> Iterator[Tuple[str, str, str]]:
+        for namespace, values in self._values.items():
+            for key, value in values.items():
+                yield namespace, key, value
+
+    def diff(self, other: Optional[SettingsSnapshot]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """Return ``{"namespace/key": (old, new)}`` for settings that differ from ``other``."""
+        changes: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        for namespace, key, value in self._items():
+            old = other.get(namespace, key) if other is not None else None
+            if old != value:
+                changes[f"{namespace}/{key}"] = (old, value)
+        if other is not None:
+            for namespace, key, value in other._items():
+                if self.get(namespace, key) is None:
+                    changes[f"{namespace}/{key}"] = (value, None)
+        return changes
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, SettingsSnapshot):
+            return NotImplemented
+        return self._values == other._values
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self._items()))
+
+    def __len__(self) -> int:
+        return sum(len(values) for values in self._values.values())
+
+    def __repr__(self) -> str:
+        counts = ", ".join(f"{namespace}={len(values)}" for namespace, values in self._values.items())
+        return f"SettingsSnapshot({counts})"
@@ -0,0 +1,51 @@
+"""Diagnostics support for Android TV Box integration."""
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_ADB_POOL, DATA_SCHEDULER, DOMAIN
+from .coordinator import AndroidTVBoxUpdateCoordinator
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> Dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: AndroidTVBoxUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+
+    state = coordinator.data.as_dict()
+    # Settings may hold identifiers; report their size and what changed, not values
+    settings = state.pop("settings")
+    state["settings"] = {
+        "entries": len(settings) if settings is not None else None,
+        "last_changes": sorted(coordinator.settings_changes),
+    }
+    session = state.pop("media_session")
+    state["media_session"] = session._asdict() if session is not None else None
+
+    return {
+        "entry": {
+            "data": dict(config_entry.data),
+            "options": dict(config_entry.options),
+        },
+        "state": state,
+        "polling": coordinator.poll_diagnostics(),
+        "probe_capabilities": {
+            "fingerprint": coordinator.adb_manager.capabilities.fingerprint,
+            **coordinator.adb_manager.capabilities.as_dict(),
+        },
+        "screen_capture": coordinator.screen_capture.diagnostics(),
+        "mjpeg_stream": coordinator.screen_streamer.diagnostics(),
+        "h264_stream": coordinator.screen_record.diagnostics(),
+        "app_catalog": coordinator.app_catalog.diagnostics(),
+        "app_launches": coordinator.adb_manager.launch_history.diagnostics(),
+        "screenshot_archive": coordinator.screenshot_archive.diagnostics(),
+        "device_storage_reclaimed": coordinator.adb_manager.storage_reclaimed,
+        "compressed_transfers": coordinator.adb_manager.compression_diagnostics(),
+        "condition_waits": coordinator.adb_manager.wait_diagnostics(),
+        "fleet": hass.data[DOMAIN][DATA_SCHEDULER].diagnostics(),
+        "adb_pool": hass.data[DOMAIN][DATA_ADB_POOL].diagnostics(),
+    }
@@ -0,0 +1,130 @@
+"""App launch timing telemetry for Android TV Box integration."""
+from __future__ import annotations
+
+import re
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, NamedTuple, Optional
+
+from .const import LAUNCH_HISTORY_SIZE
+
+# Printed before `am start -W` when the app already had a process
+_RUNNING_MARKER = "@@running"
+
+_TIMES = {
+    "this_time": re.compile(r"^ThisTime:\s*(\d+)", re.M),
+    "total_time": re.compile(r"^TotalTime:\s*(\d+)", re.M),
+    "wait_time": re.compile(r"^WaitTime:\s*(\d+)", re.M),
+}
+_LAUNCH_STATE = re.compile(r"^LaunchState:\s*(\w+)", re.M)
+_FAILED = re.compile(r"^Error|Exception", re.M)
+# Printed by `am start -W` once the launch went through
+_SUCCEEDED = re.compile(r"^(?:Status: ok|Complete|TotalTime:)", re.M)
+
+
+def am_start_command(package: str, args: str) -> str:
+    """Return ``am start -W {args}`` preceded by a check for a running process."""
+    return f"pidof {package} >/dev/null 2>&1 && echo '{_RUNNING_MARKER}'; am start -W {args}"
+
+
+class LaunchResult(NamedTuple):
+    """Timing of one ``am start -W`` launch, in milliseconds.
+
+    ``launch_state`` is "cold" (new process), "warm" (process was running,
+    activity created) or "hot" (existing activity brought to the front).
+    """
+
+    package: str
+    launch_state: str
+    this_time: Optional[int]
+    total_time: Optional[int]
+    wait_time: Optional[int]
+    started_at: datetime
+
+
+def parse_am_start(output: str, package: str) -> Optional[LaunchResult]:
+    """Parse the output of ``am_start_command``; None if the launch failed.
+
+    Output without a success line (``sh: am: not found``, a timeout) is a
+    failure too, not a launch that reported no times.
+    """
+    if _FAILED.search(output) or not _SUCCEEDED.search(output):
+        return None
+    times: Dict[str, Optional[int]] = {}
+    for name, regex in _TIMES.items():
+        m = regex.search(output)
+        times[name] = int(m.group(1)) if m else None
+    state = _LAUNCH_STATE.search(output)  # Android 10+
+    if state and state.group(1).lower() in ("cold", "warm", "hot"):
+        launch_state = state.group(1).lower()
+    elif "Activity not started" in output:
+        launch_state = "hot"
+    else:
+        launch_state = "warm" if _RUNNING_MARKER in output else "cold"
+    return LaunchResult(package, launch_state, started_at=datetime.now(), **times)
+
+
+def _launch_time(launch: LaunchResult) -> Optional[int]:
+    """Return the launch's TotalTime (WaitTime if missing); None if zero or unknown."""
+    value = launch.total_time if launch.total_time is not None else launch.wait_time
+    return value or None
+
+
+def _average(values: list[int]) -> Optional[int]:
+    return round(sum(values) / len(values)) if values else None
+
+
+class LaunchHistory:
+    """Rolling per-app history of launch timings."""
+
+    def __init__(self, size: int = LAUNCH_HISTORY_SIZE) -> None:
+        """Initialize the history."""
+        self._size = size
+        self._launches: Dict[str, Deque[LaunchResult]] = {}
+        self.last: Optional[LaunchResult] = None
+
+    def record(self, result: LaunchResult) -> None:
+        """Add a launch to its app's history.
+
+        ``last`` only follows launches that reported a time; bringing an
+        already visible activity to the front reports none, or zero.
+        """
+        self._launches.setdefault(result.package, deque(maxlen=self._size)).append(result)
+        if _launch_time(result) is not None:
+            self.last = result
+
+    def stats(self, package: str) -> Dict[str, Any]:
+        """Return launch counts and TotalTime averages (ms) for ``package``."""
+        launches = self._launches.get(package, ())
+        by_state: Dict[str, list[int]] = {"cold": [], "warm": [], "hot": []}
+        for launch in launches:
+            if launch.total_time:
+                by_state.setdefault(launch.launch_state, []).append(launch.total_time)
+        timed = [t for values in by_state.values() for t in values]
+        last_timed = next((launch for launch in reversed(launches) if launch.total_time), None)
+        return {
+            "launches": len(launches),
+            "cold_launches": sum(1 for launch in launches if launch.launch_state == "cold"),
+            "last_ms": last_timed.total_time if last_timed else None,
+            "avg_cold_ms": _average(by_state["cold"]),
+            "avg_warm_ms": _average(by_state["warm"]),
+            "avg_hot_ms": _average(by_state["hot"]),
+            "max_ms": max(timed) if timed else None,
+        }
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Return ``stats`` for every launched app."""
+        return {package: self.stats(package) for package in sorted(self._launches)}
+
+    def diagnostics(self) -> Dict[str, Any]:
+        """Return per-app stats and the raw recent launches."""
+        return {
+            "apps": self.as_dict(),
+            "recent": {
+                package: [
+                    {**launch._asdict(), "started_at": launch.started_at.isoformat()}
+                    for launch in launches
+                ]
+                for package, launches in self._launches.items()
+            },
+        }
@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from typing import Any, Dict, Optional
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 from homeassistant.components.media_player import (
     MediaPlayerEntity,
@@ -19,13 +19,14 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
-    OPT_APPS,
     OPT_WAKE_TAP_KEY,
     ANDROID_KEYCODES,
     OPT_OPTIMISTIC_PLAYBACK,
+    OPT_OPTIMISTIC_POWER,
     OPT_PLAY_PAUSE_COMBINED,
 )
 from .coordinator import AndroidTVBoxUpdateCoordinator
+from .media_session import MediaSession
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -64,23 +65,6 @@ class AndroidTVBoxMediaPlayer(CoordinatorEntity[AndroidTVBoxUpdateCoordinator],
             | MediaPlayerEntityFeature.PREVIOUS_TRACK
         )
 
-        # Parse apps mapping from options (JSON string) if provided
-        self._apps: Dict[str, str] = {}
-        opt_apps = config_entry.options.get(OPT_APPS)
-        if isinstance(opt_apps, str) and opt_apps.strip():
-            try:
-                self._apps = json.loads(opt_apps)
-            except Exception as e:
-                _LOGGER.warning("Failed to parse apps option: %s", e)
-        if not self._apps:
-            # Default minimal mapping
-            self._apps = {
-                "ISG": "com.linknlink.app.device.isg",
-                "YouTube": "com.google.android.youtube",
-                "Netflix": "com.netflix.mediaclient",
-                "Spotify": "com.spotify.music",
-            }
-
     @property
     def device_info(self) -> Dict[str, Any]:
         return self.coordinator.device_info
@@ -105,63 +89,103 @@ class AndroidTVBoxMediaPlayer(CoordinatorEntity[AndroidTVBoxUpdateCoordinator],
         return (self.coordinator.data.volume_level / vmax) if vmax else 0.0
 
     async def async_set_volume_level(self, volume: float) -> None:
-        # Convert to device scale and set; then immediately refresh via get_volume_state
+        # Convert to device scale and set; the refresh confirms the level the device reports
         vmax = self.coordinator.data.volume_max or 15
         level = max(0, min(vmax, int(round(volume * vmax))))
-        ok = await self.coordinator.adb_manager.set_volume(level)
-        if ok:
-            await asyncio.sleep(0.3)
-            vol, vmax2, muted = await self.coordinator.adb_manager.get_volume_state()
-            self.coordinator.data.volume_level = vol
-            self.coordinator.data.volume_max = vmax2
-            self.coordinator.data.muted = muted
-            self.coordinator.data.volume_percentage = (vol / vmax2 * 100.0) if vmax2 else 0.0
-            self.async_write_ha_state()
+        intent = self.coordinator.async_add_intent(lambda d: d.with_volume_state(level, vmax, level == 0))
+        # While the slider moves, each new level supersedes the ones still waiting
+        ok = await self.coordinator.async_run_control(
+            "volume", lambda: self.coordinator.adb_manager.set_volume(level)
+        )
+        if ok is None:
+            return
+        if not ok:
+            self.coordinator.async_cancel_intent(intent)
         await self.coordinator.async_request_refresh()
 
     async def async_turn_on(self) -> None:
         # Low-latency path with optional optimistic update
-        from .const import OPT_OPTIMISTIC_POWER
         optimistic = bool(self._config_entry.options.get(OPT_OPTIMISTIC_POWER, True))
         if optimistic:
-            # Immediately reflect desired state
-            self.coordinator.data.update_power_state("on", True)
-            self.async_write_ha_state()
-        await self.coordinator.adb_manager.quick_power(True)
-        tap = self._config_entry.options.get(OPT_WAKE_TAP_KEY, "CENTER")
-        if tap and tap != "NONE":
-            keycode = ANDROID_KEYCODES.get(tap)
+            # Immediately reflect desired state until a poll confirms it
+            self.coordinator.async_add_intent(lambda d: d.with_power_state("on", True))
+
+        async def wake() -> bool:
+            await self.coordinator.adb_manager.quick_power(True)
+            tap = self._config_entry.options.get(OPT_WAKE_TAP_KEY, "CENTER")
+            keycode = ANDROID_KEYCODES.get(tap) if tap and tap != "NONE" else None
             if keycode:
                 await asyncio.sleep(0.1)
                 await self.coordinator.adb_manager.send_key(keycode)
-        for _ in range(3):
-            ps, so = await self.coordinator.adb_manager.get_power_state()
-            self.coordinator.data.update_power_state(ps, so)
-            self.async_write_ha_state()
-            if so:
-                break
-            await asyncio.sleep(0.1)
-        await self.coordinator.async_request_refresh()
+            return True
+
+        if await self.coordinator.async_run_control("power", wake) is not None:
+            await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
-        from .const import OPT_OPTIMISTIC_POWER
         optimistic = bool(self._config_entry.options.get(OPT_OPTIMISTIC_POWER, True))
         if optimistic:
-            self.coordinator.data.update_power_state("off", False)
-            self.async_write_ha_state()
-        await self.coordinator.adb_manager.quick_power(False)
-        for _ in range(3):
-            ps, so = await self.coordinator.adb_manager.get_power_state()
-            self.coordinator.data.update_power_state(ps, so)
-            self.async_write_ha_state()
-            if not so:
-                break
-            await asyncio.sleep(0.1)
-        await self.coordinator.async_request_refresh()
+            self.coordinator.async_add_intent(lambda d: d.with_power_state("off", False))
+
+        async def power_off() -> bool:
+            await self.coordinator.adb_manager.quick_power(False)
+            return True
+
+        if await self.coordinator.async_run_control("power", power_off) is not None:
+            await self.coordinator.async_request_refresh()
+
+    @property
+    def _session(self) -> Optional[MediaSession]:
+        """Return the active media session while the device is on."""
+        if self.state in (MediaPlayerState.OFF, None):
+            return None
+        return self.coordinator.data.media_session
+
+    @property
+    def media_title(self) -> Optional[str]:
+        session = self._session
+        return session.title if session else None
+
+    @property
+    def media_artist(self) -> Optional[str]:
+        session = self._session
+        return session.artist if session else None
+
+    @property
+    def media_album_name(self) -> Optional[str]:
+        session = self._session
+        return session.album if session else None
+
+    @property
+    def media_duration(self) -> Optional[float]:
+        session = self._session
+        return session.duration if session else None
+
+    @property
+    def media_position(self) -> Optional[float]:
+        # Reported once per session update; Home Assistant advances it from
+        # media_position_updated_at while playing, so it is never polled
+        session = self._session
+        return session.position if session else None
+
+    @property
+    def media_position_updated_at(self) -> Optional[datetime]:
+        session = self._session
+        return session.position_updated_at if session else None
+
+    @property
+    def app_id(self) -> Optional[str]:
+        session = self._session
+        return session.package if session else None
+
+    @property
+    def app_name(self) -> Optional[str]:
+        package = self.app_id
+        return self.coordinator.app_catalog.display_name(package) if package else None
 
     @property
     def source_list(self) -> list[str] | None:
-        return list(self._apps.keys())
+        return list(self.coordinator.app_catalog.names)
 
     @property
     def source(self) -> Optional[str]:
@@ -169,76 +193,37 @@ class AndroidTVBoxMediaPlayer(CoordinatorEntity[AndroidTVBoxUpdateCoordinator],
         pkg = self.coordinator.data.current_app_package
         if not pkg:
             return None
-        for name, package in self._apps.items():
-            if package == pkg:
-                return name
-        return None
+        return self.coordinator.app_catalog.label_for(pkg)
 
     async def async_select_source(self, source: str) -> None:
-        pkg = self._apps.get(source)
+        pkg = self.coordinator.app_catalog.names.get(source)
         if not pkg:
             return
-        await self.coordinator.adb_manager.start_app(pkg)
-        # Immediate app/state refresh
-        await asyncio.sleep(0.3)
-        cur = await self.coordinator.adb_manager.get_current_app()
-        self.coordinator.data.current_app_package = cur
-        # Playback state may change after switching app
-        self.coordinator.data.playback_state = await self.coordinator.adb_manager.get_playback_state()
-        self.async_write_ha_state()
+        intent = self.coordinator.async_add_intent(lambda d: d.replace(current_app_package=pkg))
+        if not await self.coordinator.async_start_app(pkg):
+            self.coordinator.async_cancel_intent(intent)
+        # The refresh confirms the foreground app and picks up its playback state
+        await self.coordinator.async_request_refresh()
+
+    async def _async_media_command(self, command: Callable[[], Awaitable[bool]], desired: Optional[str]) -> None:
+        """Send a media key, showing ``desired`` playback state until a poll confirms it."""
+        if desired and self._config_entry.options.get(OPT_OPTIMISTIC_PLAYBACK, True):
+            self.coordinator.async_add_intent(lambda d: d.replace(playback_state=desired))
+        await command()
         await self.coordinator.async_request_refresh()
 
     async def async_media_play(self) -> None:
+        adb = self.coordinator.adb_manager
         combined = bool(self._config_entry.options.get(OPT_PLAY_PAUSE_COMBINED, False))
-        optimistic = bool(self._config_entry.options.get(OPT_OPTIMISTIC_PLAYBACK, True))
-        if combined:
-            await self.coordinator.adb_manager.media_play_pause()
-        else:
-            await self.coordinator.adb_manager.media_play()
-        desired = "playing"
-        if optimistic:
-            self.coordinator.data.playback_state = desired
-            self.async_write_ha_state()
-        for _ in range(5):
-            st = await self.coordinator.adb_manager.get_playback_state()
-            self.coordinator.data.playback_state = st
-            self.async_write_ha_state()
-            if st == desired:
-                break
-            await asyncio.sleep(0.1)
-        await self.coordinator.async_request_refresh()
+        await self._async_media_command(adb.media_play_pause if combined else adb.media_play, "playing")
 
     async def async_media_pause(self) -> None:
+        adb = self.coordinator.adb_manager
         combined = bool(self._config_entry.options.get(OPT_PLAY_PAUSE_COMBINED, False))
-        optimistic = bool(self._config_entry.options.get(OPT_OPTIMISTIC_PLAYBACK, True))
-        if combined:
-            await self.coordinator.adb_manager.media_play_pause()
-        else:
-            await self.coordinator.adb_manager.media_pause()
-        desired = "paused"
-        if optimistic:
-            self.coordinator.data.playback_state = desired
-            self.async_write_ha_state()
-        for _ in range(5):
-            st = await self.coordinator.adb_manager.get_playback_state()
-            self.coordinator.data.playback_state = st
-            self.async_write_ha_state()
-            if st == desired:
-                break
-            await asyncio.sleep(0.1)
-        await self.coordinator.async_request_refresh()
+        await self._async_media_command(adb.media_play_pause if combined else adb.media_pause, "paused")
 
     async def async_media_next_track(self) -> None:
-        await self.coordinator.adb_manager.media_next()
-        # Try to keep state in PLAYING after next
-        st = await self.coordinator.adb_manager.get_playback_state()
-        self.coordinator.data.playback_state = st
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self._async_media_command(self.coordinator.adb_manager.media_next, None)
 
     async def async_media_previous_track(self) -> None:
-        await self.coordinator.adb_manager.media_previous()
-        st = await self.coordinator.adb_manager.get_playback_state()
-        self.coordinator.data.playback_state = st
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self._async_media_command(self.coordinator.adb_manager.media_previous, None)
@@ -0,0 +1,166 @@
+"""Media session probe for Android TV Box integration."""
+from __future__ import annotations
+
+import re
+from datetime import datetime, timezone
+from typing import Dict, List, NamedTuple, Optional
+
+# Uptime (CLOCK_BOOTTIME, the clock of PlaybackState's updateTime) first,
+# then the session lines of `dumpsys media_session`, most recent session first
+MEDIA_SESSION_COMMAND = (
+    "cat /proc/uptime; "
+    "dumpsys media_session | grep -E '^ *(package|active|state)=|^ *metadata:' || true"
+)
+
+_UPTIME = re.compile(r"^(\d+(?:\.\d+)?)\s+\d+(?:\.\d+)?\s*$", re.M)
+_PLAYBACK_STATE = re.compile(r"state=PlaybackState \{state=(\d+)")
+_TEXT_STATE = re.compile(r"state=([A-Z_]+)")
+_POSITION = re.compile(r"(?:\{|, )position=(-?\d+)")
+_SPEED = re.compile(r"speed=(-?\d+(?:\.\d+)?)")
+_UPDATED = re.compile(r"updated=(-?\d+)")
+_DESCRIPTION = re.compile(r"description=(.*)$")
+_DURATION = re.compile(r"duration=(\d+)")
+
+# PlaybackState codes; everything else (none, stopped, error, ...) is idle
+_STATE_CODES = {3: "playing", 2: "paused"}
+_TEXT_STATES = {"PLAYING": "playing", "PAUSED": "paused", "STOPPED": "paused"}
+
+
+class MediaSession(NamedTuple):
+    """The active media session, as reported by ``dumpsys media_session``.
+
+    ``position`` (seconds) is extrapolated to when the probe ran, from the
+    session's last reported position, ``updated`` time and ``speed``;
+    ``position_updated_at`` is that moment. ``update_time`` is the session's
+    own update stamp (device uptime, ms), which changes only when the app
+    reports a new state or seeks.
+    """
+
+    state: str
+    package: Optional[str] = None
+    title: Optional[str] = None
+    artist: Optional[str] = None
+    album: Optional[str] = None
+    duration: Optional[float] = None
+    position: Optional[float] = None
+    position_updated_at: Optional[datetime] = None
+    speed: Optional[float] = None
+    update_time: Optional[int] = None
+
+
+def _text(value: str) -> Optional[str]:
+    value = value.strip()
+    return value if value and value != "null" else None
+
+
+def _sessions(lines: List[str]) -> List[Dict[str, str]]:
+    """Group session lines by the ``package=`` line that opens each session."""
+    sessions: List[Dict[str, str]] = []
+    for line in lines:
+        line = line.strip()
+        if line.startswith("package="):
+            sessions.append({"package": line[len("package="):]})
+        elif sessions and line.startswith("active="):
+            sessions[-1]["active"] = line[len("active="):]
+        elif sessions and line.startswith("state="):
+            sessions[-1].setdefault("state", line)
+        elif sessions and line.startswith("metadata:"):
+            sessions[-1].setdefault("metadata", line)
+    return sessions
+
+
+def _playback_state(line: str) -> str:
+    m = _PLAYBACK_STATE.search(line)
+    if m:
+        return _STATE_CODES.get(int(m.group(1)), "idle")
+    m = _TEXT_STATE.search(line)
+    return _TEXT_STATES.get(m.group(1), "idle") if m else "idle"
+
+
+def _active_session(sessions: List[Dict[str, str]]) -> Optional[Dict[str, str]]:
+    """Return the session the user is most likely watching.
+
+    Playing beats paused beats anything else; among equals the most
+    recently active session, listed first, wins.
+    """
+    ranked = [
+        session for session in sessions if session.get("active") != "false" and "state" in session
+    ]
+    for wanted in ("playing", "paused"):
+        for session in ranked:
+            if _playback_state(session["state"]) == wanted:
+                return session
+    return ranked[0] if ranked else None
+
+
+def parse_media_session(out: str, now: Optional[datetime] = None) -> Optional[MediaSession]:
+    """Parse the output of ``MEDIA_SESSION_COMMAND``; None if it did not run."""
+    uptime = _UPTIME.search(out)
+    if not uptime:
+        return None
+    session = _active_session(_sessions(out.splitlines()))
+    if session is None:
+        return MediaSession("idle")
+
+    state_line = session["state"]
+    state = _playback_state(state_line)
+    title = artist = album = None
+    duration = None
+    metadata = session.get("metadata", "")
+    description = _DESCRIPTION.search(metadata)
+    if description:
+        # MediaDescription prints "title, subtitle, description"; titles are
+        # the likeliest to contain commas, so split from the right
+        parts = description.group(1).rsplit(", ", 2)
+        if len(parts) == 3:
+            title, artist, album = (_text(part) for part in parts)
+        else:
+            title = _text(description.group(1))
+    m = _DURATION.search(metadata)
+    if m and int(m.group(1)) > 0:
+        duration = int(m.group(1)) / 1000
+
+    position = speed = update_time = None
+    m = _POSITION.search(state_line)
+    if m and int(m.group(1)) >= 0:
+        position = int(m.group(1)) / 1000
+    m = _SPEED.search(state_line)
+    if m:
+        speed = float(m.group(1))
+    m = _UPDATED.search(state_line)
+    if m and int(m.group(1)) > 0:
+        update_time = int(m.group(1))
+
+    now = now or datetime.now(timezone.utc)
+    if position is not None and state == "playing" and speed and update_time is not None:
+        elapsed = float(uptime.group(1)) - update_time / 1000
+        if elapsed > 0:
+            position += speed * elapsed
+    if duration is not None and position is not None:
+        position = min(position, duration)
+
+    return MediaSession(
+        state,
+        session.get("package"),
+        title,
+        artist,
+        album,
+        duration,
+        round(position, 3) if position is not None else None,
+        now if position is not None else None,
+        speed,
+        update_time,
+    )
+
+
+def session_changed(old: Optional[MediaSession], new: MediaSession) -> bool:
+    """Return True if ``new`` is more than the extrapolation of ``old``.
+
+    The position of an unchanged session only moves with time, so its
+    previous anchor stays valid and need not be republished.
+    """
+    if old is None or new.position is None or old.position is None:
+        return True
+    keys = ("state", "package", "title", "artist", "album", "duration", "speed", "update_time")
+    return any(getattr(old, key) != getattr(new, key) for key in keys)
+
@@ -0,0 +1,117 @@
+"""Media source for Android TV Box screenshots."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from homeassistant.components.http.auth import async_sign_path
+from homeassistant.components.media_player import MediaClass, MediaType
+from homeassistant.components.media_source.error import Unresolvable
+from homeassistant.components.media_source.models import (
+    BrowseMediaSource,
+    MediaSource,
+    MediaSourceItem,
+    PlayMedia,
+)
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import AndroidTVBoxUpdateCoordinator
+from .screenshot_archive import ScreenshotFileView
+
+SIGNED_URL_EXPIRY = timedelta(minutes=10)
+
+
+async def async_get_media_source(hass: HomeAssistant) -> AndroidTVBoxMediaSource:
+    """Set up the screenshot media source."""
+    return AndroidTVBoxMediaSource(hass)
+
+
+class AndroidTVBoxMediaSource(MediaSource):
+    """Browse archived screenshots per device.
+
+    Identifiers are ``<entry_id>`` for a device folder and
+    ``<entry_id>/<file name>`` for a screenshot.
+    """
+
+    name = "Android TV Box Screenshots"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the media source."""
+        super().__init__(DOMAIN)
+        self.hass = hass
+
+    def _coordinators(self) -> dict[str, AndroidTVBoxUpdateCoordinator]:
+        return {
+            entry_id: coordinator
+            for entry_id, coordinator in self.hass.data.get(DOMAIN, {}).items()
+            if isinstance(coordinator, AndroidTVBoxUpdateCoordinator)
+        }
+
+    async def async_resolve_media(self, item: MediaSourceItem) -> PlayMedia:
+        """Resolve a screenshot to a signed URL."""
+        entry_id, _, name = (item.identifier or "").partition("/")
+        coordinator = self._coordinators().get(entry_id)
+        if coordinator is None or coordinator.screenshot_archive.path_for(name) is None:
+            raise Unresolvable(f"Unknown screenshot: {item.identifier}")
+        path = ScreenshotFileView.url.format(entry_id=entry_id, name=name)
+        mime_type = "image/jpeg" if name.endswith(".jpg") else "image/png"
+        return PlayMedia(async_sign_path(self.hass, path, SIGNED_URL_EXPIRY), mime_type)
+
+    async def async_browse_media(self, item: MediaSourceItem) -> BrowseMediaSource:
+        """Return the device folders, or the screenshots of one device."""
+        coordinators = self._coordinators()
+        if not item.identifier:
+            return BrowseMediaSource(
+                domain=DOMAIN,
+                identifier=None,
+                media_class=MediaClass.DIRECTORY,
+                media_content_type=MediaType.IMAGE,
+                title=self.name,
+                can_play=False,
+                can_expand=True,
+                children_media_class=MediaClass.DIRECTORY,
+                children=[
+                    self._device_folder(entry_id, coordinator)
+                    for entry_id, coordinator in coordinators.items()
+                ],
+            )
+
+        entry_id = item.identifier.partition("/")[0]
+        coordinator = coordinators.get(entry_id)
+        if coordinator is None:
+            raise Unresolvable(f"Unknown device: {item.identifier}")
+
+        archive = coordinator.screenshot_archive
+        await archive.async_ensure_loaded()
+        folder = self._device_folder(entry_id, coordinator)
+        folder.children = [
+            BrowseMediaSource(
+                domain=DOMAIN,
+                identifier=f"{entry_id}/{screenshot.name}",
+                media_class=MediaClass.IMAGE,
+                media_content_type=MediaType.IMAGE,
+                title=datetime.fromtimestamp(screenshot.mtime).strftime("%Y-%m-%d %H:%M:%S"),
+                can_play=False,
+                can_expand=False,
+                thumbnail=async_sign_path(
+                    self.hass,
+                    ScreenshotFileView.url.format(entry_id=entry_id, name=screenshot.name),
+                    SIGNED_URL_EXPIRY,
+                ),
+            )
+            for screenshot in archive.files()
+        ]
+        return folder
+
+    @staticmethod
+    def _device_folder(entry_id: str, coordinator: AndroidTVBoxUpdateCoordinator) -> BrowseMediaSource:
+        return BrowseMediaSource(
+            domain=DOMAIN,
+            identifier=entry_id,
+            media_class=MediaClass.DIRECTORY,
+            media_content_type=MediaType.IMAGE,
+            title=coordinator.device_name,
+            can_play=False,
+            can_expand=True,
+            children_media_class=MediaClass.IMAGE,
+        )
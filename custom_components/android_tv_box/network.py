@@ -0,0 +1,148 @@
+"""Network state probe for Android TV Box integration."""
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Optional
+
+_IP_MARKER = "@@ip"
+
+# WiFi status from `cmd wifi status` (Android 11+), falling back to the
+# WifiInfo line of `dumpsys wifi` on older releases
+WIFI_STATUS_COMMAND = (
+    "cmd wifi status 2>/dev/null | grep -E '^Wifi is|^WifiInfo' "
+    "|| dumpsys wifi 2>/dev/null | grep -m 2 -E '^Wi-Fi is|mWifiInfo'"
+)
+# One line per interface and per address, for every interface
+INTERFACES_COMMAND = f"echo '{_IP_MARKER}'; ip -o link 2>/dev/null; ip -o addr 2>/dev/null"
+NETWORK_COMMAND = f"{WIFI_STATUS_COMMAND}; {INTERFACES_COMMAND}"
+
+_SSID = re.compile(r'SSID: (?:"([^"]*)"|([^,]+))')
+_SUPPLICANT = re.compile(r"Supplicant state: ([A-Z_]+)")
+_RSSI = re.compile(r"RSSI: (-?\d+)")
+_LINK_SPEED = re.compile(r"(?:^|, )Link speed: (-?\d+)Mbps")
+_FREQUENCY = re.compile(r"Frequency: (-?\d+)MHz")
+_LINK = re.compile(r"^\d+:\s+([^:@\s]+)(?:@\S+)?:\s+<([^>]*)>")
+_MAC = re.compile(r"link/ether ([0-9a-fA-F:]{17})")
+_ADDR = re.compile(r"^\d+:\s+(\S+)\s+(inet6?)\s+([0-9a-fA-F.:]+)/\d+")
+
+# Values WifiInfo reports while there is no association
+_INVALID_RSSI = -127
+_UNKNOWN_SSID = "<unknown ssid>"
+
+
+def _int(regex: re.Pattern, text: str) -> Optional[int]:
+    m = regex.search(text)
+    return int(m.group(1)) if m else None
+
+
+def parse_wifi_status(out: str) -> Dict[str, Any]:
+    """Parse the WiFi lines of ``NETWORK_COMMAND``.
+
+    Returns connected, ssid, rssi, link_speed (Mbps) and frequency (MHz);
+    values that are not reported or not valid are None.
+    """
+    info: Dict[str, Any] = {
+        "connected": None,
+        "ssid": None,
+        "rssi": None,
+        "link_speed": None,
+        "frequency": None,
+    }
+    for line in out.splitlines():
+        line = line.strip()
+        if line.startswith("Wifi is connected"):
+            info["connected"] = True
+        elif line.startswith("Wifi is not connected"):
+            info["connected"] = False
+        elif "WifiInfo" in line:
+            supplicant = _SUPPLICANT.search(line)
+            if supplicant and info["connected"] is None:
+                info["connected"] = supplicant.group(1) == "COMPLETED"
+            ssid = _SSID.search(line)
+            if ssid:
+                value = (ssid.group(1) if ssid.group(1) is not None else ssid.group(2)).strip()
+                info["ssid"] = value if value and value != _UNKNOWN_SSID else None
+            rssi = _int(_RSSI, line)
+            info["rssi"] = rssi if rssi is not None and _INVALID_RSSI < rssi < 0 else None
+            speed = _int(_LINK_SPEED, line)
+            info["link_speed"] = speed if speed is not None and speed > 0 else None
+            frequency = _int(_FREQUENCY, line)
+            info["frequency"] = frequency if frequency is not None and frequency > 0 else None
+    if not info["connected"]:
+        info.update(ssid=None, rssi=None, link_speed=None, frequency=None)
+    return info
+
+
+def parse_interfaces(out: str) -> Dict[str, Dict[str, Any]]:
+    """Parse ``ip -o link`` and ``ip -o addr`` lines into per-interface state.
+
+    The loopback interface is skipped. Each interface maps to
+    ``{"up": carrier present, "mac": ..., "ipv4": [...], "ipv6": [...]}``.
+    """
+    interfaces: Dict[str, Dict[str, Any]] = {}
+
+    def entry(name: str) -> Dict[str, Any]:
+        return interfaces.setdefault(name, {"up": False, "mac": None, "ipv4": [], "ipv6": []})
+
+    for line in out.splitlines():
+        link = _LINK.match(line)
+        if link:
+            name, flags = link.groups()
+            if name != "lo":
+                iface = entry(name)
+                iface["up"] = "LOWER_UP" in flags.split(",")
+                mac = _MAC.search(line)
+                iface["mac"] = mac.group(1).lower() if mac else None
+            continue
+        addr = _ADDR.match(line)
+        if addr:
+            name, family, address = addr.groups()
+            if name != "lo":
+                entry(name)["ipv4" if family == "inet" else "ipv6"].append(address)
+    return interfaces
+
+
+def _first_ipv4(interfaces: Dict[str, Dict[str, Any]], names: List[str]) -> Optional[str]:
+    for name in names:
+        addresses = interfaces[name]["ipv4"]
+        if interfaces[name]["up"] and addresses:
+            return addresses[0]
+    return None
+
+
+def parse_network_state(out: str) -> Dict[str, Any]:
+    """Parse the output of ``NETWORK_COMMAND``.
+
+    ``network_type`` is the transport holding the reported ``ip_address``:
+    "ethernet", "wifi", "other" or None when nothing is connected. Ethernet
+    wins over WiFi when both have an address, as Android routes over it.
+    """
+    wifi_part, _, ip_part = out.partition(_IP_MARKER)
+    info = parse_wifi_status(wifi_part)
+    interfaces = parse_interfaces(ip_part)
+
+    ethernet = sorted(name for name in interfaces if name.startswith("eth"))
+    wlan = sorted(name for name in interfaces if name.startswith("wlan"))
+    others = sorted(name for name in interfaces if name not in ethernet and name not in wlan)
+
+    ethernet_ip = _first_ipv4(interfaces, ethernet)
+    wifi_ip = _first_ipv4(interfaces, wlan)
+    if info["connected"] is None:
+        # No WiFi status on this device; fall back to the interface state
+        info["connected"] = wifi_ip is not None
+
+    if ethernet_ip:
+        network_type, ip_address = "ethernet", ethernet_ip
+    elif info["connected"] and wifi_ip:
+        network_type, ip_address = "wifi", wifi_ip
+    else:
+        ip_address = _first_ipv4(interfaces, others)
+        network_type = "other" if ip_address else None
+
+    info.update(
+        ip_address=ip_address,
+        ethernet_connected=ethernet_ip is not None,
+        network_type=network_type,
+        interfaces=interfaces,
+    )
+    return info
@@ -0,0 +1,166 @@
+"""Domain-level poll scheduler for Android TV Box integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import zlib
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import POLL_JITTER_FRACTION
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+def _stable_fraction(key: str, salt: str = "") -> float:
+    """Return a deterministic value in [0, 1) derived from ``key``."""
+    return (zlib.crc32(f"{salt}{key}".encode()) & 0xFFFFFFFF) / 2**32
+
+
+class AndroidTVBoxPollScheduler:
+    """Spread coordinator polls for all config entries across the scan interval.
+
+    Every device gets a deterministic phase offset: devices are ordered by a
+    stable hash of their key and spaced evenly across the interval, with a
+    small per-device jitter inside their slot. A semaphore caps how many
+    devices are probed at the same time.
+    """
+
+    def __init__(self, hass: HomeAssistant, interval: timedelta, max_concurrent: int) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.interval = interval.total_seconds()
+        self.max_concurrent = max_concurrent
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._epoch = hass.loop.time()
+        self._coordinators: Dict[str, Any] = {}
+        self._phases: Dict[str, float] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._polls: Dict[str, asyncio.Task] = {}
+
+        # Fleet-level metrics
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.polls_started = 0
+        self.polls_skipped = 0
+        self.total_wait_s = 0.0
+
+    @callback
+    def async_register(self, key: str, coordinator: Any) -> None:
+        """Add a coordinator to the schedule and rebalance phases."""
+        self._coordinators[key] = coordinator
+        self._rebalance()
+
+    async def async_unregister(self, key: str) -> None:
+        """Remove a coordinator from the schedule and rebalance phases.
+
+        Returns once a poll already running for ``key`` has finished, so the
+        caller can release the device without that poll reconnecting it.
+        """
+        self._coordinators.pop(key, None)
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+        self._rebalance()
+        poll = self._polls.get(key)
+        if poll is not None:
+            await asyncio.wait([poll])
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel all scheduled polls."""
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        self._coordinators.clear()
+        self._phases.clear()
+
+    def phase_for(self, key: str) -> Optional[float]:
+        """Return the phase offset (seconds into the interval) for ``key``."""
+        return self._phases.get(key)
+
+    def _rebalance(self) -> None:
+        """Recompute evenly spaced phases and reschedule every device."""
+        keys = sorted(self._coordinators, key=_stable_fraction)
+        slot = self.interval / len(keys) if keys else self.interval
+        self._phases = {
+            key: index * slot + _stable_fraction(key, "jitter") * slot * POLL_JITTER_FRACTION
+            for index, key in enumerate(keys)
+        }
+        for key in keys:
+            self._schedule(key)
+
+    def _next_due(self, key: str) -> float:
+        """Return the loop time of the next slot for ``key``."""
+        now = self.hass.loop.time()
+        phase = self._phases[key]
+        cycles = int((now - self._epoch - phase) // self.interval) + 1
+        return self._epoch + phase + cycles * self.interval
+
+    def _schedule(self, key: str) -> None:
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+        if key not in self._coordinators:
+            return
+        self._timers[key] = self.hass.loop.call_at(self._next_due(key), self._fire, key)
+
+    @callback
+    def _fire(self, key: str) -> None:
+        self._timers.pop(key, None)
+        if key not in self._coordinators:
+            return
+        if key in self._polls:
+            # Previous poll for this device is still running; skip this slot
+            self.polls_skipped += 1
+            self._schedule(key)
+            return
+        self._polls[key] = self.hass.async_create_background_task(
+            self._async_poll(key), f"android_tv_box poll {key}"
+        )
+
+    async def _async_poll(self, key: str) -> None:
+        async def refresh() -> None:
+            # Looked up once a slot is free: the entry may have been unloaded meanwhile
+            coordinator = self._coordinators.get(key)
+            if coordinator is not None:
+                await coordinator.async_refresh()
+
+        try:
+            await self.async_run_limited(refresh)
+        except Exception as e:  # coordinator handles its own UpdateFailed
+            _LOGGER.debug("Scheduled poll for %s failed: %s", key, e)
+        finally:
+            self._polls.pop(key, None)
+            self._schedule(key)
+
+    async def async_run_limited(self, job: Callable[[], Awaitable[_T]]) -> _T:
+        """Run ``job`` under the fleet-wide concurrency cap."""
+        queued = self.hass.loop.time()
+        async with self._semaphore:
+            self.total_wait_s += self.hass.loop.time() - queued
+            self.polls_started += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            try:
+                return await job()
+            finally:
+                self.in_flight -= 1
+
+    def diagnostics(self) -> Dict[str, Any]:
+        """Return fleet-level scheduling metrics."""
+        return {
+            "interval_s": self.interval,
+            "devices": len(self._coordinators),
+            "max_concurrent": self.max_concurrent,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "polls_started": self.polls_started,
+            "polls_skipped": self.polls_skipped,
+            "avg_wait_s": round(self.total_wait_s / self.polls_started, 3) if self.polls_started else 0.0,
+            "phases_s": {key: round(phase, 2) for key, phase in self._phases.items()},
+        }
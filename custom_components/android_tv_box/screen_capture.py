@@ -0,0 +1,592 @@
+"""Screen capture pipeline for Android TV Box integration."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import struct
+import time
+import zlib
+from collections import OrderedDict, deque
+from io import BytesIO
+from typing import TYPE_CHECKING, Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow ships with Home Assistant; degrade to PNG capture without it
+    Image = None
+
+from .adb_manager import PNG_SIGNATURE
+from .const import (
+    AUTO_REPROBE_CAPTURES,
+    CAPTURE_MODE_AUTO,
+    CAPTURE_MODE_GZIP,
+    CAPTURE_MODE_PNG,
+    CAPTURE_MODE_RAW,
+    CAPTURE_RATE_WINDOW,
+    DEFAULT_SCREENSHOT_TTL,
+    DOMAIN,
+    ENCODED_FRAME_CACHE_SIZE,
+    JPEG_QUALITY,
+    MJPEG_FRAME_WIDTH,
+    MJPEG_LATENCY_FACTOR,
+    MJPEG_MAX_INTERVAL,
+    MJPEG_MIN_INTERVAL,
+    TRANSFER_EWMA_ALPHA,
+)
+
+if TYPE_CHECKING:
+    from .adb_manager import ADBManager
+
+_LOGGER = logging.getLogger(__name__)
+
+# screencap raw pixel formats (android.graphics.PixelFormat) mapped to the
+# Pillow raw decoder that reads them as RGB, skipping the alpha byte
+_PIXEL_FORMATS: Dict[int, str] = {
+    1: "RGBX",  # RGBA_8888
+    2: "RGBX",  # RGBX_8888
+    5: "BGRX",  # BGRA_8888
+}
+
+
+class RawFrame(NamedTuple):
+    """Decoded ``screencap`` framebuffer."""
+
+    width: int
+    height: int
+    mode: str
+    pixels: memoryview
+
+
+def parse_raw_screencap(data: bytes) -> RawFrame:
+    """Parse raw ``screencap`` output into a frame.
+
+    The header is width, height and pixel format as little-endian uint32;
+    Android 9+ appends a uint32 colour space, which is detected from the
+    payload length.
+    """
+    if len(data) < 12:
+        raise ValueError(f"screencap output too short ({len(data)} bytes)")
+    width, height, fmt = struct.unpack_from("<III", data, 0)
+    mode = _PIXEL_FORMATS.get(fmt)
+    if mode is None:
+        raise ValueError(f"Unsupported screencap pixel format {fmt}")
+    size = width * height * 4
+    if len(data) >= 16 + size:
+        offset = 16
+    elif len(data) >= 12 + size:
+        offset = 12
+    else:
+        raise ValueError(f"screencap payload truncated ({len(data)} bytes for {width}x{height})")
+    return RawFrame(width, height, mode, memoryview(data)[offset:offset + size])
+
+
+def encode_jpeg(frame: RawFrame, width: Optional[int], height: Optional[int], quality: int = JPEG_QUALITY) -> bytes:
+    """Downscale ``frame`` to fit ``width``x``height`` and encode it as JPEG.
+
+    Runs in a worker thread; aspect ratio is preserved and frames are never
+    upscaled.
+    """
+    img = Image.frombuffer("RGB", (frame.width, frame.height), frame.pixels, "raw", frame.mode, 0, 1)
+    if width or height:
+        img.thumbnail((width or frame.width, height or frame.height), Image.BILINEAR)
+    out = BytesIO()
+    img.save(out, format="JPEG", quality=quality)
+    return out.getvalue()
+
+
+def _frame_digest(frame: RawFrame) -> str:
+    """Return a content hash of a raw frame's pixels."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(struct.pack("<II", frame.width, frame.height))
+    digest.update(frame.pixels)
+    return digest.hexdigest()
+
+
+def _placeholder_png(width: int = 16, height: int = 9) -> bytes:
+    """Return a small dark-grey PNG used while the screen is off."""
+    row = b"\x00" + b"\x20\x20\x20" * width
+    raw = zlib.compress(row * height)
+
+    def chunk(tag: bytes, body: bytes) -> bytes:
+        return struct.pack(">I", len(body)) + tag + body + struct.pack(">I", zlib.crc32(tag + body))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return PNG_SIGNATURE + chunk(b"IHDR", header) + chunk(b"IDAT", raw) + chunk(b"IEND", b"")
+
+
+class ScreenCapturer:
+    """Shared screen frame source for the camera and screenshot button.
+
+    In raw mode the device sends the uncompressed framebuffer (no device-side
+    PNG compression); it is downscaled to the requested size and encoded on
+    the host. The gzip mode compresses that framebuffer on the device for
+    slow links, and auto mode picks whichever of the two transfers has been
+    faster, retrying the other one now and then. Encoded images are kept in a small LRU keyed by frame and size,
+    so several viewers asking for different sizes of the same frame share the
+    work.
+
+    The most recent frame is reused for ``ttl`` seconds and concurrent
+    requests join a single in-flight capture. While the screen is off no
+    capture is attempted: the last frame, or a placeholder, is returned.
+    """
+
+    def __init__(
+        self,
+        adb_manager: ADBManager,
+        mode: str = CAPTURE_MODE_PNG,
+        ttl: float = DEFAULT_SCREENSHOT_TTL,
+        screen_on: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        """Initialize the capturer."""
+        self._adb = adb_manager
+        if mode != CAPTURE_MODE_PNG and Image is None:
+            _LOGGER.warning("Pillow is not available; falling back to PNG capture")
+            mode = CAPTURE_MODE_PNG
+        self.mode = mode
+        self.ttl = ttl
+        self._screen_on = screen_on or (lambda: True)
+        self._frame_id = 0
+        self._frame: Optional[RawFrame] = None
+        self._png: Optional[bytes] = None
+        self._captured_at: Optional[float] = None
+        self._inflight: Optional[asyncio.Task] = None
+        self._encoded: OrderedDict[Tuple[int, Optional[int], Optional[int]], bytes] = OrderedDict()
+        self._placeholder: Optional[bytes] = None
+        # Content hash of the current frame, usable as an HTTP entity tag
+        self.etag: Optional[str] = None
+
+        # Cache metrics
+        self._started_at = time.monotonic()
+        self.requests = 0
+        self.hits = 0
+        self.shared = 0
+        self.placeholders = 0
+        self.captures = 0
+        self.capture_failures = 0
+        self.unchanged_frames = 0
+        # Frame (or capture) most recently handed to the screenshot archive
+        self.archived_key: Optional[Tuple[str, int]] = None
+        self._capture_times: deque[float] = deque(maxlen=CAPTURE_RATE_WINDOW)
+        # Transfer metrics: smoothed seconds per transfer kind, and the last transfer
+        self.transfer_s: Dict[str, float] = {}
+        self.throughput_bps: Optional[float] = None
+        self.last_transfer: Dict[str, Any] = {}
+        self.gzip_failures = 0
+        self._gzip_failed = False
+        self._auto_captures = 0
+
+    @property
+    def content_type(self) -> str:
+        """Return the MIME type of images produced by this capturer."""
+        return "image/png" if self.mode == CAPTURE_MODE_PNG else "image/jpeg"
+
+    @property
+    def screen_on(self) -> bool:
+        """Return True if the device screen is reported on."""
+        return self._screen_on()
+
+    @property
+    def frame_id(self) -> int:
+        """Return the id of the latest distinct frame."""
+        return self._frame_id
+
+    @property
+    def has_frame(self) -> bool:
+        """Return True if a frame has been captured."""
+        return self._frame is not None or self._png is not None
+
+    def invalidate(self) -> None:
+        """Force the next request to capture a new frame."""
+        self._captured_at = None
+
+    def _is_fresh(self, max_age: float) -> bool:
+        return (
+            self.has_frame
+            and self._captured_at is not None
+            and time.monotonic() - self._captured_at < max_age
+        )
+
+    async def async_get_frame(
+        self,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        max_age: Optional[float] = None,
+    ) -> Optional[bytes]:
+        """Return the latest frame, capturing a new one only when needed.
+
+        ``max_age`` tightens the cache TTL for callers that need fresher frames.
+        """
+        self.requests += 1
+        if not self._screen_on():
+            if self.has_frame:
+                self.hits += 1
+                return await self._async_render(width, height)
+            self.placeholders += 1
+            return self._get_placeholder()
+
+        if self._is_fresh(self.ttl if max_age is None else min(self.ttl, max_age)):
+            self.hits += 1
+            return await self._async_render(width, height)
+
+        if self._inflight is not None and not self._inflight.done():
+            self.shared += 1
+        else:
+            self._inflight = asyncio.get_running_loop().create_task(self._async_capture())
+        # Shield so a cancelled viewer does not abort the capture others are waiting on
+        if not await asyncio.shield(self._inflight):
+            return None
+        return await self._async_render(width, height)
+
+    async def _async_capture(self) -> bool:
+        """Capture one frame from the device into the cache.
+
+        Frames whose content hash matches the current frame keep the current
+        frame id, so encoded images, HTTP validators and stream subscribers
+        treat them as unchanged.
+        """
+        if self.mode == CAPTURE_MODE_PNG:
+            started = time.monotonic()
+            png = await self._adb.capture_screen()
+            if png is None:
+                self.capture_failures += 1
+                return False
+            self._record_transfer(CAPTURE_MODE_PNG, len(png), len(png), time.monotonic() - started)
+            digest = hashlib.blake2b(png, digest_size=16).hexdigest()
+            frame: Optional[RawFrame] = None
+        else:
+            data = await self._async_fetch_raw()
+            if data is None:
+                self.capture_failures += 1
+                return False
+            try:
+                frame = parse_raw_screencap(data)
+            except ValueError as e:
+                _LOGGER.warning("Unusable raw screencap: %s", e)
+                self.capture_failures += 1
+                return False
+            digest = await asyncio.to_thread(_frame_digest, frame)
+            png = None
+
+        self._captured_at = time.monotonic()
+        self.captures += 1
+        self._capture_times.append(self._captured_at)
+        if digest == self.etag:
+            self.unchanged_frames += 1
+            return True
+
+        self._png = png
+        self._frame = frame
+        self.etag = digest
+        self._frame_id += 1
+        return True
+
+    def _select_transfer(self) -> str:
+        """Return the raw transfer to use for the next capture."""
+        if self.mode != CAPTURE_MODE_AUTO:
+            return self.mode
+        if self._adb.gzip_available is False:
+            return CAPTURE_MODE_RAW
+        if self._gzip_failed:
+            # The last compressed transfer broke; retry it only when reprobing
+            self._auto_captures += 1
+            if self._auto_captures % AUTO_REPROBE_CAPTURES == 0:
+                return CAPTURE_MODE_GZIP
+            return CAPTURE_MODE_RAW
+        for kind in (CAPTURE_MODE_RAW, CAPTURE_MODE_GZIP):
+            if kind not in self.transfer_s:
+                return kind
+        self._auto_captures += 1
+        fastest = min((CAPTURE_MODE_RAW, CAPTURE_MODE_GZIP), key=self.transfer_s.__getitem__)
+        if self._auto_captures % AUTO_REPROBE_CAPTURES == 0:
+            return CAPTURE_MODE_RAW if fastest == CAPTURE_MODE_GZIP else CAPTURE_MODE_GZIP
+        return fastest
+
+    async def _async_fetch_raw(self) -> Optional[bytes]:
+        """Fetch a raw framebuffer, compressed on the device when selected."""
+        kind = self._select_transfer()
+        started = time.monotonic()
+        if kind == CAPTURE_MODE_GZIP:
+            result = await self._adb.capture_screen_gzip()
+            if result is not None:
+                self._gzip_failed = False
+                data, transferred = result
+                self._record_transfer(kind, len(data), transferred, time.monotonic() - started)
+                return data
+            if self._adb.gzip_available is not False:
+                # A broken pipe or failing gzip; avoid it until the next reprobe
+                self.gzip_failures += 1
+                self._gzip_failed = True
+            # Fall back to a plain raw transfer for this capture
+            kind = CAPTURE_MODE_RAW
+            started = time.monotonic()
+        data = await self._adb.capture_screen_raw()
+        if data is not None:
+            self._record_transfer(kind, len(data), len(data), time.monotonic() - started)
+        return data
+
+    def _record_transfer(self, kind: str, size: int, transferred: int, seconds: float) -> None:
+        """Update smoothed transfer timings and the link throughput estimate."""
+        previous = self.transfer_s.get(kind)
+        self.transfer_s[kind] = (
+            seconds if previous is None
+            else previous + TRANSFER_EWMA_ALPHA * (seconds - previous)
+        )
+        if seconds > 0:
+            bps = transferred / seconds
+            self.throughput_bps = (
+                bps if self.throughput_bps is None
+                else self.throughput_bps + TRANSFER_EWMA_ALPHA * (bps - self.throughput_bps)
+            )
+        self.last_transfer = {
+            "kind": kind,
+            "bytes": size,
+            "bytes_transferred": transferred,
+            "seconds": round(seconds, 3),
+            "compression_ratio": round(size / transferred, 2) if transferred else None,
+        }
+        _LOGGER.debug(
+            "Captured %d bytes via %s: %d bytes transferred in %.3fs",
+            size, kind, transferred, seconds,
+        )
+
+    async def _async_render(self, width: Optional[int], height: Optional[int]) -> Optional[bytes]:
+        if self.mode == CAPTURE_MODE_PNG:
+            return self._png
+        return await self.async_encode(width, height)
+
+    def _get_placeholder(self) -> bytes:
+        if self._placeholder is None:
+            if Image is not None and self.mode != CAPTURE_MODE_PNG:
+                out = BytesIO()
+                Image.new("RGB", (16, 9), (32, 32, 32)).save(out, format="JPEG")
+                self._placeholder = out.getvalue()
+            else:
+                self._placeholder = _placeholder_png()
+        return self._placeholder
+
+    async def async_encode(self, width: Optional[int] = None, height: Optional[int] = None) -> Optional[bytes]:
+        """Return the latest raw frame encoded for the requested size."""
+        if self._frame is None:
+            return None
+        key = (self._frame_id, width, height)
+        cached = self._encoded.get(key)
+        if cached is not None:
+            self._encoded.move_to_end(key)
+            return cached
+
+        image = await asyncio.to_thread(encode_jpeg, self._frame, width, height)
+        self._encoded[key] = image
+        while len(self._encoded) > ENCODED_FRAME_CACHE_SIZE:
+            self._encoded.popitem(last=False)
+        return image
+
+    def capture_rate(self) -> float:
+        """Return device captures per minute over the recent window."""
+        times = self._capture_times
+        if not times:
+            return 0.0
+        span = time.monotonic() - (times[0] if len(times) == times.maxlen else self._started_at)
+        return round(len(times) * 60.0 / span, 2) if span > 0 else 0.0
+
+    def diagnostics(self) -> Dict[str, Any]:
+        """Return capture pipeline and frame cache details."""
+        frame = self._frame
+        return {
+            "mode": self.mode,
+            "ttl_s": self.ttl,
+            "frames_captured": self._frame_id,
+            "last_frame_size": f"{frame.width}x{frame.height}" if frame else None,
+            "last_frame_age_s": (
+                round(time.monotonic() - self._captured_at, 2) if self._captured_at else None
+            ),
+            "encoded_cache_entries": len(self._encoded),
+            "requests": self.requests,
+            "cache_hits": self.hits,
+            "shared_captures": self.shared,
+            "placeholders": self.placeholders,
+            "capture_failures": self.capture_failures,
+            "unchanged_frames": self.unchanged_frames,
+            "etag": self.etag,
+            "hit_ratio": round((self.hits + self.shared) / self.requests, 3) if self.requests else 0.0,
+            "captures_per_minute": self.capture_rate(),
+            "last_transfer": self.last_transfer,
+            "avg_transfer_s": {kind: round(value, 3) for kind, value in self.transfer_s.items()},
+            "throughput_kib_s": round(self.throughput_bps / 1024, 1) if self.throughput_bps else None,
+            "device_gzip": self._adb.gzip_available,
+            "gzip_failures": self.gzip_failures,
+        }
+
+
+class ScreenStreamer:
+    """Fan one adaptive capture loop out to every MJPEG subscriber.
+
+    The loop only runs while someone is subscribed. Its frame interval
+    follows the measured capture latency, so a slow device is not asked for
+    frames faster than it can produce them. Each subscriber holds at most one
+    pending frame; a slow client gets the newest frame instead of a backlog.
+    """
+
+    def __init__(self, capturer: ScreenCapturer) -> None:
+        """Initialize the streamer."""
+        self._capturer = capturer
+        self._subscribers: set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._latest: Optional[bytes] = None
+        self.interval = MJPEG_MIN_INTERVAL
+        self.last_latency: Optional[float] = None
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a subscriber and start the capture loop if needed."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        if self._latest is not None:
+            queue.put_nowait(self._latest)
+        self._subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._async_loop())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Remove a subscriber; the loop stops when none remain."""
+        self._subscribers.discard(queue)
+
+    def stop(self) -> None:
+        """Stop the capture loop and drop all subscribers."""
+        self._subscribers.clear()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _publish(self, frame: bytes) -> None:
+        for queue in self._subscribers:
+            if queue.full():
+                # Backpressure: replace the unsent frame rather than queueing
+                queue.get_nowait()
+                self.frames_dropped += 1
+            queue.put_nowait(frame)
+            self.frames_sent += 1
+
+    async def _async_loop(self) -> None:
+        last_frame_id = -1
+        failures = 0
+        while self._subscribers:
+            started = time.monotonic()
+            try:
+                frame = await self._capturer.async_get_frame(MJPEG_FRAME_WIDTH, None, max_age=0)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Keep the stream alive on the last good frame and back off
+                failures += 1
+                self.errors += 1
+                self.last_error = str(e) or type(e).__name__
+                if failures == 1:
+                    _LOGGER.warning("MJPEG capture failed, serving the last frame: %s", e)
+                else:
+                    _LOGGER.debug("MJPEG capture failed again: %s", e)
+                self.interval = min(MJPEG_MAX_INTERVAL, MJPEG_MIN_INTERVAL * 2**failures)
+                if self._latest is not None:
+                    self._publish(self._latest)
+                await asyncio.sleep(self.interval)
+                continue
+            failures = 0
+            latency = time.monotonic() - started
+
+            if frame is not None and self._capturer.frame_id != last_frame_id:
+                # Adapt to the device: never ask for frames faster than it delivers them
+                self.last_latency = latency
+                self.interval = min(
+                    MJPEG_MAX_INTERVAL,
+                    max(MJPEG_MIN_INTERVAL, latency * MJPEG_LATENCY_FACTOR),
+                )
+                last_frame_id = self._capturer.frame_id
+                self._latest = frame
+                self._publish(frame)
+            elif not self._capturer.screen_on:
+                # Nothing new to show while the screen is off
+                self.interval = MJPEG_MAX_INTERVAL
+                if self._latest is None and frame is not None:
+                    self._latest = frame
+                    self._publish(frame)
+            await asyncio.sleep(max(0.0, self.interval - latency))
+
+    async def async_handle(self, request: web.Request) -> web.StreamResponse:
+        """Serve a multipart MJPEG stream until the client disconnects."""
+        response = web.StreamResponse()
+        response.content_type = "multipart/x-mixed-replace;boundary=--frameboundary"
+        await response.prepare(request)
+
+        content_type = self._capturer.content_type.encode()
+        queue = self.subscribe()
+        try:
+            while True:
+                frame = await queue.get()
+                await response.write(
+                    b"--frameboundary\r\nContent-Type: " + content_type
+                    + b"\r\nContent-Length: " + str(len(frame)).encode()
+                    + b"\r\n\r\n" + frame + b"\r\n"
+                )
+        except (ConnectionResetError, RuntimeError) as e:
+            _LOGGER.debug("MJPEG client disconnected: %s", e)
+        finally:
+            self.unsubscribe(queue)
+        return response
+
+    def diagnostics(self) -> Dict[str, Any]:
+        """Return streaming details."""
+        return {
+            "subscribers": len(self._subscribers),
+            "running": self._task is not None and not self._task.done(),
+            "frame_interval_s": round(self.interval, 3),
+            "fps": round(1.0 / self.interval, 2) if self.interval else None,
+            "last_capture_latency_s": round(self.last_latency, 3) if self.last_latency else None,
+            "frames_sent": self.frames_sent,
+            "frames_dropped": self.frames_dropped,
+            "errors": self.errors,
+            "last_error": self.last_error,
+        }
+
+
+class ScreenSnapshotView(HomeAssistantView):
+    """Serve the latest screen frame with HTTP validators.
+
+    Clients polling with ``If-None-Match`` get ``304 Not Modified`` while the
+    screen content is unchanged, instead of downloading the same image again.
+    """
+
+    url = "/api/android_tv_box/screen/{entry_id}"
+    name = "api:android_tv_box:screen"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self.hass = hass
+
+    async def get(self, request: web.Request, entry_id: str) -> web.Response:
+        """Return the frame for ``entry_id``, or 304 if the client has it."""
+        coordinator = self.hass.data.get(DOMAIN, {}).get(entry_id)
+        capturer: Optional[ScreenCapturer] = getattr(coordinator, "screen_capture", None)
+        if capturer is None:
+            return web.Response(status=404)
+        try:
+            width = int(request.query["width"]) if "width" in request.query else None
+            height = int(request.query["height"]) if "height" in request.query else None
+        except ValueError:
+            return web.Response(status=400)
+
+        image = await capturer.async_get_frame(width, height)
+        if image is None:
+            return web.Response(status=503)
+        etag = f'"{capturer.etag or hashlib.blake2b(image, digest_size=16).hexdigest()}-{width}x{height}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag in request.headers.get("If-None-Match", ""):
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=image, content_type=capturer.content_type, headers=headers)
@@ -0,0 +1,212 @@
+"""H.264 screen mirroring for Android TV Box integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import secrets
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DOMAIN,
+    H264_CLIENT_BUFFER_BYTES,
+    H264_SEGMENT_SECONDS,
+)
+
+if TYPE_CHECKING:
+    from .adb_manager import ADBManager
+
+_LOGGER = logging.getLogger(__name__)
+
+# Annex B start codes followed by an SPS NAL unit (type 7)
+_SPS_MARKERS = (b"\x00\x00\x00\x01\x67", b"\x00\x00\x01\x67", b"\x00\x00\x00\x01\x27", b"\x00\x00\x01\x27")
+
+
+def _has_sps(chunk: bytes) -> bool:
+    return any(marker in chunk for marker in _SPS_MARKERS)
+
+
+class _ClientBuffer:
+    """Bounded per-client chunk buffer.
+
+    When a client falls more than ``limit`` bytes behind, its backlog is
+    discarded and delivery resumes at the next codec header, so the decoder
+    restarts cleanly instead of receiving a stream with holes.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.chunks: deque[bytes] = deque()
+        self.size = 0
+        self.resync = False
+        self.overflows = 0
+        self.event = asyncio.Event()
+
+    def push(self, chunk: bytes) -> None:
+        if self.resync:
+            if not _has_sps(chunk):
+                return
+            self.resync = False
+        if self.size + len(chunk) > self.limit:
+            self.chunks.clear()
+            self.size = 0
+            self.overflows += 1
+            if not _has_sps(chunk):
+                self.resync = True
+                return
+        self.chunks.append(chunk)
+        self.size += len(chunk)
+        self.event.set()
+
+    def pop_all(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        self.size = 0
+        self.event.clear()
+        return data
+
+
+class ScreenRecordStream:
+    """Mirror the device screen as a raw H.264 elementary stream.
+
+    ``screenrecord --output-format=h264 -`` runs over a persistent ADB shell
+    stream in a dedicated thread (so it never occupies a shared ADB worker).
+    Segments are capped at three minutes by Android and are restarted back to
+    back. Recording only runs while a client is connected, and each client
+    has a bounded buffer.
+    """
+
+    def __init__(self, adb_manager: ADBManager, bitrate: int, size: Optional[str]) -> None:
+        """Initialize the stream."""
+        self._adb = adb_manager
+        self.bitrate = bitrate
+        self.size = size
+        self.token = secrets.token_urlsafe(24)
+        self._clients: set[_ClientBuffer] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._header: Optional[bytes] = None
+
+        self.segments = 0
+        self.bytes_streamed = 0
+
+    @property
+    def command(self) -> str:
+        """Return the screenrecord command for one segment."""
+        cmd = (
+            f"screenrecord --output-format=h264 --bit-rate {self.bitrate} "
+            f"--time-limit {H264_SEGMENT_SECONDS}"
+        )
+        if self.size:
+            cmd += f" --size {self.size}"
+        return cmd + " -"
+
+    def _start(self) -> None:
+        # Clearing first also revokes a pending stop if the thread is still winding down
+        self._stop.clear()
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._thread = threading.Thread(
+            target=self._record, name=f"{DOMAIN}_screenrecord_{self._adb.device_id}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop recording after the current chunk."""
+        self._stop.set()
+        self._header = None
+
+    def _record(self) -> None:
+        """Run screenrecord segments back to back until stopped (worker thread)."""
+        while not self._stop.is_set():
+            self.segments += 1
+            first = True
+            try:
+                for chunk in self._adb.iter_shell_output(self.command, H264_SEGMENT_SECONDS + 10):
+                    if self._stop.is_set():
+                        break
+                    if first and _has_sps(chunk):
+                        # Codec header for clients that join mid-segment
+                        self._header = chunk
+                    first = False
+                    self.bytes_streamed += len(chunk)
+                    self._loop.call_soon_threadsafe(self._dispatch, chunk)
+            except Exception as e:
+                _LOGGER.debug("screenrecord segment ended with error: %s", e)
+                if self._stop.wait(1.0):
+                    break
+
+    def _dispatch(self, chunk: bytes) -> None:
+        for client in self._clients:
+            client.push(chunk)
+
+    async def async_handle(self, request: web.Request) -> web.StreamResponse:
+        """Stream H.264 to one HTTP client until it disconnects."""
+        response = web.StreamResponse()
+        response.content_type = "video/h264"
+        await response.prepare(request)
+
+        client = _ClientBuffer(H264_CLIENT_BUFFER_BYTES)
+        if self._header is not None:
+            client.push(self._header)
+        else:
+            client.resync = True
+        self._clients.add(client)
+        self._start()
+        try:
+            while True:
+                await client.event.wait()
+                await response.write(client.pop_all())
+        except (ConnectionResetError, RuntimeError) as e:
+            _LOGGER.debug("H.264 client disconnected: %s", e)
+        finally:
+            self._clients.discard(client)
+            if not self._clients:
+                self.stop()
+                await self._adb.stop_screenrecord()
+        return response
+
+    def diagnostics(self) -> Dict[str, Any]:
+        """Return mirroring details."""
+        return {
+            "clients": len(self._clients),
+            "recording": self._thread is not None and self._thread.is_alive() and not self._stop.is_set(),
+            "bitrate": self.bitrate,
+            "size": self.size,
+            "segments": self.segments,
+            "bytes_streamed": self.bytes_streamed,
+            "buffered_bytes": sum(client.size for client in self._clients),
+            "client_overflows": sum(client.overflows for client in self._clients),
+        }
+
+
+class ScreenRecordView(HomeAssistantView):
+    """Serve a device's H.264 mirror stream to the stream worker.
+
+    Authentication uses a per-device random token in the URL, because the
+    ffmpeg-based stream worker cannot send Home Assistant credentials.
+    """
+
+    url = "/api/android_tv_box/screenrecord/{entry_id}"
+    name = "api:android_tv_box:screenrecord"
+    requires_auth = False
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self.hass = hass
+
+    async def get(self, request: web.Request, entry_id: str) -> web.StreamResponse:
+        """Stream the mirror for ``entry_id``."""
+        coordinator = self.hass.data.get(DOMAIN, {}).get(entry_id)
+        stream: Optional[ScreenRecordStream] = getattr(coordinator, "screen_record", None)
+        if stream is None or not secrets.compare_digest(request.query.get("token", ""), stream.token):
+            return web.Response(status=404)
+        return await stream.async_handle(request)
@@ -0,0 +1,214 @@
+"""Screenshot archive for Android TV Box integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import re
+import time
+from collections import deque
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+_ARCHIVE_FILE = re.compile(r"^android_tv_box_\d+(?:_\d+)?\.(png|jpg)$")
+
+
+class ArchivedScreenshot(NamedTuple):
+    """One file in the archive index."""
+
+    name: str
+    size: int
+    mtime: float
+
+
+class ScreenshotArchive:
+    """Indexed on-disk screenshot archive for one device.
+
+    Files live in a per-device subdirectory of the configured screenshot
+    directory. The directory is scanned once; after that an in-memory index
+    (oldest first) tracks every file and its size, so count and byte quotas
+    are enforced incrementally on each add. Files pushed out by the quotas
+    are deleted in batches by a background task.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        base_dir: str,
+        device_key: str,
+        max_files: int,
+        max_bytes: int,
+    ) -> None:
+        """Initialize the archive."""
+        self.hass = hass
+        self.directory = os.path.join(base_dir, re.sub(r"[^A-Za-z0-9]+", "_", device_key))
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self._index: deque[ArchivedScreenshot] = deque()
+        self._names: set[str] = set()
+        self.total_bytes = 0
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._pending_delete: List[str] = []
+        self._delete_task: Optional[asyncio.Task] = None
+
+        self.files_written = 0
+        self.files_deleted = 0
+
+    async def async_ensure_loaded(self) -> None:
+        """Build the index from disk on first use."""
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+
+            def _scan() -> List[ArchivedScreenshot]:
+                os.makedirs(self.directory, exist_ok=True)
+                entries = []
+                with os.scandir(self.directory) as it:
+                    for entry in it:
+                        if entry.is_file() and _ARCHIVE_FILE.match(entry.name):
+                            st = entry.stat()
+                            entries.append(ArchivedScreenshot(entry.name, st.st_size, st.st_mtime))
+                entries.sort(key=lambda item: item.mtime)
+                return entries
+
+            for item in await self.hass.async_add_executor_job(_scan):
+                self._index_add(item)
+            self._loaded = True
+            self._enforce_quotas()
+
+    def _index_add(self, item: ArchivedScreenshot) -> None:
+        self._index.append(item)
+        self._names.add(item.name)
+        self.total_bytes += item.size
+
+    def _enforce_quotas(self) -> None:
+        """Evict the oldest files until both quotas are met."""
+        while self._index and (
+            len(self._index) > self.max_files or self.total_bytes > self.max_bytes
+        ):
+            item = self._index.popleft()
+            self._names.discard(item.name)
+            self.total_bytes -= item.size
+            self._pending_delete.append(os.path.join(self.directory, item.name))
+        if self._pending_delete and (self._delete_task is None or self._delete_task.done()):
+            self._delete_task = self.hass.async_create_background_task(
+                self._async_flush_deletes(), f"{DOMAIN} screenshot cleanup"
+            )
+
+    async def _async_flush_deletes(self) -> None:
+        """Delete evicted files in one executor job per batch."""
+        while self._pending_delete:
+            batch, self._pending_delete = self._pending_delete, []
+
+            def _delete() -> int:
+                deleted = 0
+                for path in batch:
+                    try:
+                        os.remove(path)
+                        deleted += 1
+                    except FileNotFoundError:
+                        pass
+                    except OSError as e:
+                        _LOGGER.debug("Failed to delete %s: %s", path, e)
+                return deleted
+
+            self.files_deleted += await self.hass.async_add_executor_job(_delete)
+
+    async def async_add(self, image: bytes, content_type: str) -> Optional[str]:
+        """Write ``image`` to the archive and return its path."""
+        await self.async_ensure_loaded()
+        ext = "jpg" if content_type == "image/jpeg" else "png"
+        name = self._unused_name(ext)
+        path = os.path.join(self.directory, name)
+        # Reserved before the write so a concurrent save picks another name
+        self._names.add(name)
+
+        def _write() -> float:
+            with open(path, "wb") as f:
+                f.write(image)
+            return os.path.getmtime(path)
+
+        try:
+            mtime = await self.hass.async_add_executor_job(_write)
+        except OSError as e:
+            self._names.discard(name)
+            _LOGGER.warning("Failed to archive screenshot: %s", e)
+            return None
+        self._index_add(ArchivedScreenshot(name, len(image), mtime))
+        self.files_written += 1
+        self._enforce_quotas()
+        return path
+
+    def _unused_name(self, ext: str) -> str:
+        """Return a timestamped file name that no indexed or evicted file uses.
+
+        Saves within the same millisecond get a sequence suffix instead of
+        overwriting each other.
+        """
+        stem = f"android_tv_box_{int(time.time() * 1000)}"
+        name = f"{stem}.{ext}"
+        sequence = 0
+        while name in self._names or os.path.join(self.directory, name) in self._pending_delete:
+            sequence += 1
+            name = f"{stem}_{sequence}.{ext}"
+        return name
+
+    def files(self) -> List[ArchivedScreenshot]:
+        """Return archived files, newest first."""
+        return list(reversed(self._index))
+
+    def path_for(self, name: str) -> Optional[str]:
+        """Return the path of an archived file, or None if it is not indexed."""
+        if name not in self._names:
+            return None
+        return os.path.join(self.directory, name)
+
+    async def async_shutdown(self) -> None:
+        """Finish pending deletions."""
+        if self._delete_task is not None and not self._delete_task.done():
+            await self._delete_task
+
+    def diagnostics(self) -> Dict[str, Any]:
+        """Return archive details."""
+        return {
+            "directory": self.directory,
+            "loaded": self._loaded,
+            "files": len(self._index),
+            "bytes": self.total_bytes,
+            "max_files": self.max_files,
+            "max_bytes": self.max_bytes,
+            "files_written": self.files_written,
+            "files_deleted": self.files_deleted,
+            "pending_deletes": len(self._pending_delete),
+        }
+
+
+class ScreenshotFileView(HomeAssistantView):
+    """Serve archived screenshots (used by the media source)."""
+
+    url = "/api/android_tv_box/screenshots/{entry_id}/{name}"
+    name = "api:android_tv_box:screenshots"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self.hass = hass
+
+    async def get(self, request: web.Request, entry_id: str, name: str) -> web.StreamResponse:
+        """Return an archived file if it is in the device's index."""
+        coordinator = self.hass.data.get(DOMAIN, {}).get(entry_id)
+        archive: Optional[ScreenshotArchive] = getattr(coordinator, "screenshot_archive", None)
+        path = archive.path_for(name) if archive is not None else None
+        if path is None:
+            return web.Response(status=404)
+        return web.FileResponse(path)
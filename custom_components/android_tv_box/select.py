@@ -1,9 +1,8 @@
 """Select platform for Android TV Box integration (App selector)."""
 from __future__ import annotations
 
-import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
@@ -12,7 +11,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, OPT_APPS
+from .const import DOMAIN
 from .coordinator import AndroidTVBoxUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -39,33 +38,22 @@ class AndroidTVBoxAppSelect(CoordinatorEntity[AndroidTVBoxUpdateCoordinator], Se
         host = config_entry.data[CONF_HOST]
         port = config_entry.data[CONF_PORT]
         self._attr_unique_id = f"{host}:{port}_app_select"
-
-        # Parse friendly mapping from options
-        self._apps_map: Dict[str, str] = {}
-        opt_apps = config_entry.options.get(OPT_APPS)
-        if isinstance(opt_apps, str) and opt_apps.strip():
-            try:
-                self._apps_map = json.loads(opt_apps)
-            except Exception as e:
-                _LOGGER.warning("Failed to parse apps option: %s", e)
-
+        self._installed_apps: Optional[Tuple[str, ...]] = None
         self._update_options()
 
     def _update_options(self) -> None:
-        pkgs = self.coordinator.data.installed_apps or []
-        names = list(self._apps_map.keys()) if self._apps_map else []
-        # Merge friendly names + raw packages as options (de-dup)
-        merged = []
-        seen = set()
-        for n in names:
-            if n not in seen:
-                merged.append(n)
-                seen.add(n)
-        for p in pkgs:
-            if p not in seen:
-                merged.append(p)
-                seen.add(p)
-        self._attr_options = merged
+        pkgs = self.coordinator.data.installed_apps
+        if pkgs is self._installed_apps:
+            return
+        self._installed_apps = pkgs
+        catalog = self.coordinator.app_catalog
+        # Friendly names first, then installed packages that have none
+        self._attr_options = list(catalog.names) + [p for p in pkgs if catalog.label_for(p) is None]
+
+    @property
+    def options(self) -> List[str]:
+        self._update_options()
+        return self._attr_options
 
     @property
     def current_option(self) -> Optional[str]:
@@ -73,19 +61,28 @@ class AndroidTVBoxAppSelect(CoordinatorEntity[AndroidTVBoxUpdateCoordinator], Se
         if not pkg:
             return None
         # map back to friendly name if available
-        for name, package in self._apps_map.items():
-            if package == pkg:
-                return name
-        return pkg
+        return self.coordinator.app_catalog.display_name(pkg)
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        pkg = self.coordinator.data.current_app_package
+        info = self.coordinator.app_catalog.apps.get(pkg) if pkg else None
+        if info is None:
+            return {}
+        return {
+            "package": pkg,
+            "version_name": info.version_name,
+            "version_code": info.version_code,
+            "last_update_time": info.last_update_time,
+        }
 
     async def async_select_option(self, option: str) -> None:
         # Resolve to package
-        pkg = self._apps_map.get(option, option)
-        await self.coordinator.adb_manager.start_app(pkg)
-        # immediate reflect and refresh
-        self.coordinator.data.current_app_package = await self.coordinator.adb_manager.get_current_app()
-        self._update_options()
-        self.async_write_ha_state()
+        pkg = self.coordinator.app_catalog.package_for(option) or option
+        # Show the selection right away; the refresh confirms or rolls it back
+        intent = self.coordinator.async_add_intent(lambda d: d.replace(current_app_package=pkg))
+        if not await self.coordinator.async_start_app(pkg):
+            self.coordinator.async_cancel_intent(intent)
         await self.coordinator.async_request_refresh()
 
     async def async_update(self) -> None:
@@ -0,0 +1,237 @@
+"""Sensor platform for Android TV Box integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_PORT,
+    PERCENTAGE,
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    UnitOfDataRate,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN, ENTITY_SUFFIXES
+from .coordinator import AndroidTVBoxUpdateCoordinator
+from .device_settings import SettingsSnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+# BatteryManager.BATTERY_PLUGGED_* bits of stay_on_while_plugged_in
+_PLUGGED_SOURCES = {"ac": 1, "usb": 2, "wireless": 4, "dock": 8}
+
+
+def _screen_off_timeout(settings: SettingsSnapshot) -> Optional[float]:
+    value = settings.get_int("system", "screen_off_timeout")
+    return value / 1000 if value is not None else None
+
+
+def _screen_brightness(settings: SettingsSnapshot) -> Optional[int]:
+    value = settings.get_int("system", "screen_brightness")
+    return round(value * 100 / 255) if value is not None else None
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Android TV Box sensor entities from a config entry."""
+    coordinator: AndroidTVBoxUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+
+    async_add_entities(
+        [
+            AndroidTVBoxScreenOffTimeoutSensor(coordinator, config_entry),
+            AndroidTVBoxScreenBrightnessSensor(coordinator, config_entry),
+            AndroidTVBoxStayOnSensor(coordinator, config_entry),
+            AndroidTVBoxWifiSignalSensor(coordinator, config_entry),
+            AndroidTVBoxWifiLinkSpeedSensor(coordinator, config_entry),
+            AndroidTVBoxAppLaunchTimeSensor(coordinator, config_entry),
+        ]
+    )
+
+
+class AndroidTVBoxSensor(CoordinatorEntity[AndroidTVBoxUpdateCoordinator], SensorEntity):
+    """Base class for Android TV Box diagnostic sensors."""
+
+    def __init__(
+        self,
+        coordinator: AndroidTVBoxUpdateCoordinator,
+        config_entry: ConfigEntry,
+        entity_suffix: str,
+        name: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._config_entry = config_entry
+        self._attr_has_entity_name = True
+        self._attr_name = name
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+
+        host = config_entry.data[CONF_HOST]
+        port = config_entry.data[CONF_PORT]
+        self._attr_unique_id = f"{host}:{port}_{entity_suffix}"
+
+    @property
+    def device_info(self) -> Dict[str, Any]:
+        """Return device info."""
+        return self.coordinator.device_info
+
+
+class AndroidTVBoxSettingSensor(AndroidTVBoxSensor):
+    """Diagnostic sensor reading one value from the coordinator's settings snapshot."""
+
+    _value: Callable[[SettingsSnapshot], Any]
+
+    @property
+    def available(self) -> bool:
+        """Return True once a settings snapshot has been read."""
+        return self.coordinator.data.is_connected and self.coordinator.data.settings is not None
+
+    @property
+    def native_value(self) -> Any:
+        """Return the setting value."""
+        settings = self.coordinator.data.settings
+        return self._value(settings) if settings is not None else None
+
+
+class AndroidTVBoxScreenOffTimeoutSensor(AndroidTVBoxSettingSensor):
+    """Screen-off timeout (system/screen_off_timeout)."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(self, coordinator: AndroidTVBoxUpdateCoordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(coordinator, config_entry, ENTITY_SUFFIXES["screen_off_timeout"], "Screen Off Timeout")
+        self._value = _screen_off_timeout
+
+
+class AndroidTVBoxScreenBrightnessSensor(AndroidTVBoxSettingSensor):
+    """Screen brightness (system/screen_brightness, 0-255 shown as percent)."""
+
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:brightness-6"
+
+    def __init__(self, coordinator: AndroidTVBoxUpdateCoordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(coordinator, config_entry, ENTITY_SUFFIXES["screen_brightness"], "Screen Brightness")
+        self._value = _screen_brightness
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        settings = self.coordinator.data.settings
+        if settings is None:
+            return {}
+        return {
+            "raw_value": settings.get_int("system", "screen_brightness"),
+            "automatic": settings.get("system", "screen_brightness_mode") == "1",
+        }
+
+
+class AndroidTVBoxStayOnSensor(AndroidTVBoxSettingSensor):
+    """Stay awake while plugged in (global/stay_on_while_plugged_in bitmask)."""
+
+    _attr_icon = "mdi:power-plug"
+
+    def __init__(self, coordinator: AndroidTVBoxUpdateCoordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(
+            coordinator, config_entry, ENTITY_SUFFIXES["stay_on_while_plugged_in"], "Stay On While Plugged In"
+        )
+        self._value = lambda settings: settings.get_int("global", "stay_on_while_plugged_in")
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        value = self.native_value or 0
+        return {source: bool(value & bit) for source, bit in _PLUGGED_SOURCES.items()}
+
+
+class AndroidTVBoxWifiSensor(AndroidTVBoxSensor):
+    """Diagnostic sensor for the current WiFi association."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _field: str
+
+    @property
+    def available(self) -> bool:
+        """Return True while the device is associated with a WiFi network."""
+        return self.coordinator.data.is_connected and self.coordinator.data.wifi_connected
+
+    @property
+    def native_value(self) -> Optional[int]:
+        """Return the value reported by WifiInfo."""
+        return getattr(self.coordinator.data, self._field)
+
+
+class AndroidTVBoxWifiSignalSensor(AndroidTVBoxWifiSensor):
+    """WiFi signal strength (RSSI)."""
+
+    _attr_device_class = SensorDeviceClass.SIGNAL_STRENGTH
+    _attr_native_unit_of_measurement = SIGNAL_STRENGTH_DECIBELS_MILLIWATT
+    _field = "wifi_rssi"
+
+    def __init__(self, coordinator: AndroidTVBoxUpdateCoordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(coordinator, config_entry, ENTITY_SUFFIXES["wifi_signal"], "WiFi Signal")
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        return {"ssid": self.coordinator.data.wifi_ssid, "frequency_mhz": self.coordinator.data.wifi_frequency}
+
+
+class AndroidTVBoxWifiLinkSpeedSensor(AndroidTVBoxWifiSensor):
+    """Negotiated WiFi link speed."""
+
+    _attr_device_class = SensorDeviceClass.DATA_RATE
+    _attr_native_unit_of_measurement = UnitOfDataRate.MEGABITS_PER_SECOND
+    _attr_icon = "mdi:speedometer"
+    _field = "wifi_link_speed"
+
+    def __init__(self, coordinator: AndroidTVBoxUpdateCoordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(coordinator, config_entry, ENTITY_SUFFIXES["wifi_link_speed"], "WiFi Link Speed")
+
+
+class AndroidTVBoxAppLaunchTimeSensor(AndroidTVBoxSensor):
+    """Duration of the most recent app launch (``am start -W`` TotalTime).
+
+    Attributes carry the launch details and per-app rolling statistics, split
+    into cold, warm and hot launches.
+    """
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:rocket-launch-outline"
+
+    def __init__(self, coordinator: AndroidTVBoxUpdateCoordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(coordinator, config_entry, ENTITY_SUFFIXES["app_launch_time"], "App Launch Time")
+
+    @property
+    def native_value(self) -> Optional[int]:
+        """Return the TotalTime of the last launch in milliseconds."""
+        last = self.coordinator.adb_manager.launch_history.last
+        if last is None:
+            return None
+        return last.total_time if last.total_time is not None else last.wait_time
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        history = self.coordinator.adb_manager.launch_history
+        last = history.last
+        if last is None:
+            return {}
+        return {
+            "package": last.package,
+            "launch_state": last.launch_state,
+            "this_time_ms": last.this_time,
+            "wait_time_ms": last.wait_time,
+            "launched_at": last.started_at.isoformat(),
+            "apps": history.as_dict(),
+        }
@@ -0,0 +1,46 @@
+"""Persistent storage for Android TV Box integration."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_SAVE_DELAY, STORAGE_VERSION
+
+
+class AndroidTVBoxStore:
+    """Domain-wide store of learned device data, grouped in sections.
+
+    Each section maps a key (e.g. a build fingerprint) to a JSON-serialisable
+    value. Writes are batched with a delayed save.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self._store: Store[Dict[str, Dict[str, Any]]] = Store(hass, STORAGE_VERSION, DOMAIN)
+        self._data: Dict[str, Dict[str, Any]] = {}
+        self._load_task: Optional[asyncio.Task] = None
+
+    async def async_load(self) -> None:
+        """Load stored data; concurrent callers share one load."""
+        if self._load_task is None:
+            self._load_task = asyncio.get_running_loop().create_task(self._async_load())
+        await self._load_task
+
+    async def _async_load(self) -> None:
+        self._data = await self._store.async_load() or {}
+
+    def get(self, section: str, key: str) -> Optional[Any]:
+        """Return the stored value for ``key`` in ``section``."""
+        return self._data.get(section, {}).get(key)
+
+    def set(self, section: str, key: str, value: Any) -> None:
+        """Store ``value`` for ``key`` in ``section`` and schedule a save."""
+        self._data.setdefault(section, {})[key] = value
+        self._store.async_delay_save(lambda: self._data, STORAGE_SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Write pending changes now."""
+        await self._store.async_save(self._data)
@@ -131,7 +131,7 @@ class AndroidTVBoxADBConnectionSwitch(AndroidTVBoxSwitchEntity):
             connected = await self.coordinator.adb_manager.connect()
             
             if connected:
-                self.coordinator.data.update_connection_status(True)
+                self.coordinator.async_observe(lambda d: d.with_connection_status(True))
                 # Request immediate data refresh
                 await self.coordinator.async_request_refresh()
             else:
@@ -139,7 +139,7 @@ class AndroidTVBoxADBConnectionSwitch(AndroidTVBoxSwitchEntity):
                 
         except Exception as e:
             _LOGGER.error("Error reconnecting ADB: %s", e)
-            self.coordinator.data.set_error(str(e))
+            self.coordinator.async_observe(lambda d: d.with_error(str(e)))
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off ADB connection (disconnect)."""
@@ -147,13 +147,13 @@ class AndroidTVBoxADBConnectionSwitch(AndroidTVBoxSwitchEntity):
         
         try:
             await self.coordinator.adb_manager.disconnect()
-            self.coordinator.data.update_connection_status(False)
+            self.coordinator.async_observe(lambda d: d.with_connection_status(False))
             # Request immediate data refresh
             await self.coordinator.async_request_refresh()
             
         except Exception as e:
             _LOGGER.error("Error disconnecting ADB: %s", e)
-            self.coordinator.data.set_error(str(e))
+            self.coordinator.async_observe(lambda d: d.with_error(str(e)))
 
 
 class AndroidTVBoxPowerSwitch(AndroidTVBoxSwitchEntity):
@@ -258,6 +258,12 @@ class AndroidTVBoxWiFiSwitch(AndroidTVBoxSwitchEntity):
         if self.coordinator.data.wifi_ssid:
             attrs[ATTR_WIFI_SSID] = self.coordinator.data.wifi_ssid
             
+        if self.coordinator.data.wifi_rssi is not None:
+            attrs["rssi"] = self.coordinator.data.wifi_rssi
+
+        if self.coordinator.data.wifi_link_speed is not None:
+            attrs["link_speed"] = self.coordinator.data.wifi_link_speed
+
         if self.coordinator.data.ip_address:
             attrs[ATTR_IP_ADDRESS] = self.coordinator.data.ip_address
             
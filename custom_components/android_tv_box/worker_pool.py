@@ -0,0 +1,120 @@
+"""Shared ADB worker pool for Android TV Box integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ADBWorkerPool:
+    """Sized thread pool shared by every ADB manager in the domain.
+
+    Blocking adb-shell calls run here instead of Home Assistant's default
+    executor, so a large fleet cannot starve other integrations. Each device
+    may have at most ``per_device_limit`` calls waiting for or holding a
+    worker; because the global semaphore wakes waiters in FIFO order, busy
+    devices are interleaved with quiet ones instead of monopolising the pool.
+    """
+
+    def __init__(self, max_workers: int, per_device_limit: int) -> None:
+        """Initialize the worker pool."""
+        self.max_workers = max_workers
+        self.per_device_limit = per_device_limit
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="android_tv_box_adb"
+        )
+        self._global = asyncio.Semaphore(max_workers)
+        self._device_limits: Dict[str, asyncio.Semaphore] = {}
+        self._started_at: float | None = None
+
+        # Utilization metrics
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.queued = 0
+        self.completed = 0
+        self.failed = 0
+        self.busy_s = 0.0
+        self.wait_s = 0.0
+        self.per_device_calls: Dict[str, int] = {}
+
+    async def run(self, device_id: str, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking ``func(*args)`` for ``device_id`` on the shared pool.
+
+        The worker slots are held until the call returns on its thread, even
+        if the caller is cancelled first: the thread cannot be interrupted,
+        so releasing early would let more calls reach the device than the
+        per-device limit allows.
+        """
+        loop = asyncio.get_running_loop()
+        if self._started_at is None:
+            self._started_at = loop.time()
+        device_limit = self._device_limits.setdefault(
+            device_id, asyncio.Semaphore(self.per_device_limit)
+        )
+
+        queued_at = loop.time()
+        self.queued += 1
+        try:
+            await device_limit.acquire()
+            try:
+                await self._global.acquire()
+            except BaseException:
+                device_limit.release()
+                raise
+        finally:
+            # Acquired, or cancelled before a worker became available
+            self.queued -= 1
+
+        started = loop.time()
+        self.wait_s += started - queued_at
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        self.per_device_calls[device_id] = self.per_device_calls.get(device_id, 0) + 1
+
+        def finished(future: asyncio.Future) -> None:
+            self.in_flight -= 1
+            self.busy_s += loop.time() - started
+            self._global.release()
+            device_limit.release()
+            if future.cancelled() or future.exception() is not None:
+                self.failed += 1
+            else:
+                self.completed += 1
+
+        future = loop.run_in_executor(self._executor, func, *args)
+        future.add_done_callback(finished)
+        return await asyncio.shield(future)
+
+    def release_device(self, device_id: str) -> None:
+        """Forget per-device bookkeeping for a removed device."""
+        self._device_limits.pop(device_id, None)
+        self.per_device_calls.pop(device_id, None)
+
+    def shutdown(self) -> None:
+        """Stop the worker threads without waiting for running calls."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def diagnostics(self) -> Dict[str, Any]:
+        """Return pool utilization metrics."""
+        calls = self.completed + self.failed
+        utilization = 0.0
+        if self._started_at is not None:
+            elapsed = asyncio.get_running_loop().time() - self._started_at
+            if elapsed > 0:
+                utilization = min(1.0, self.busy_s / (elapsed * self.max_workers))
+        return {
+            "max_workers": self.max_workers,
+            "per_device_limit": self.per_device_limit,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "queued": self.queued,
+            "completed": self.completed,
+            "failed": self.failed,
+            "utilization": round(utilization, 4),
+            "avg_wait_s": round(self.wait_s / calls, 4) if calls else 0.0,
+            "avg_busy_s": round(self.busy_s / calls, 4) if calls else 0.0,
+            "per_device_calls": dict(self.per_device_calls),
+        }
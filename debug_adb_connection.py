@@ -83,12 +83,14 @@ async def main():
         print(f"Power State: {test_result.get('power_state', 'Unknown')}")
         print(f"WiFi Enabled: {test_result.get('wifi_enabled', 'Unknown')}")
         
-        # Step 5: WiFi details
-        wifi_info = details.get('wifi_info', {})
-        if wifi_info:
-            print(f"WiFi Connected: {wifi_info.get('connected', 'Unknown')}")
-            print(f"WiFi SSID: {wifi_info.get('ssid', 'N/A')}")
-            print(f"IP Address: {wifi_info.get('ip_address', 'N/A')}")
+        # Step 5: Network details
+        network_info = details.get('network_info', {})
+        if network_info:
+            print(f"Network Type: {network_info.get('network_type', 'N/A')}")
+            print(f"WiFi Connected: {network_info.get('connected', 'Unknown')}")
+            print(f"WiFi SSID: {network_info.get('ssid', 'N/A')}")
+            print(f"WiFi RSSI: {network_info.get('rssi', 'N/A')}")
+            print(f"IP Address: {network_info.get('ip_address', 'N/A')}")
         
         print(f"\n🎉 Connection test completed successfully!")
         print(f"✅ Your Android TV Box should work with Home Assistant")
@@ -61,20 +61,20 @@ async def test_coordinator_fix():
         # Test data object methods
         print("3️⃣ Testing data object methods...")
         
-        # Test update_device_info method
+        # Test with_device_info method
         test_device_info = {
             "model": "E3-DBB1",
             "android_version": "14", 
             "brand": "RockChip"
         }
         
-        coordinator.data.update_device_info(test_device_info)
-        print(f"✅ update_device_info method works")
+        coordinator.data = coordinator.data.with_device_info(test_device_info)
+        print(f"✅ with_device_info method works")
         print(f"Device model: {coordinator.data.device_model}")
         
         # Test other methods
-        coordinator.data.update_connection_status(True)
-        print(f"✅ update_connection_status method works")
+        coordinator.data = coordinator.data.with_connection_status(True)
+        print(f"✅ with_connection_status method works")
         
         wifi_info = {
             "enabled": True,
@@ -82,8 +82,8 @@ async def test_coordinator_fix():
             "ssid": "Test_WiFi",
             "ip_address": "192.168.1.100"
         }
-        coordinator.data.update_wifi_info(wifi_info)
-        print(f"✅ update_wifi_info method works")
+        coordinator.data = coordinator.data.with_network_state(wifi_info)
+        print(f"✅ with_network_state method works (snapshot v{coordinator.data.version})")
         
         print("4️⃣ Testing async_setup method...")
         setup_result = await coordinator.async_setup()
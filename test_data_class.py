@@ -27,29 +27,33 @@ def test_data_class():
         # Test methods exist and work
         print("3️⃣ Testing data class methods...")
         
-        # Test update_device_info
+        # Test with_device_info (snapshots are immutable, so rebind)
         device_info = {
             "model": "E3-DBB1",
             "android_version": "14",
             "brand": "RockChip"
         }
-        data.update_device_info(device_info)
-        print(f"✅ update_device_info works - Model: {data.device_model}")
+        data = data.with_device_info(device_info)
+        print(f"✅ with_device_info works - Model: {data.device_model}")
         
-        # Test update_connection_status
-        data.update_connection_status(True)
-        print(f"✅ update_connection_status works - Connected: {data.is_connected}")
+        # Test with_connection_status
+        data = data.with_connection_status(True)
+        print(f"✅ with_connection_status works - Connected: {data.is_connected}")
         
-        # Test update_wifi_state
+        # Test with_network_state
         wifi_info = {
             "enabled": True,
             "connected": True,
             "ssid": "Test_WiFi",
             "ip_address": "192.168.1.100"
         }
-        data.update_wifi_state(wifi_info)
-        print(f"✅ update_wifi_state works - SSID: {data.wifi_ssid}")
+        previous = data
+        data = data.with_network_state(wifi_info)
+        print(f"✅ with_network_state works - SSID: {data.wifi_ssid}")
         
+        # Test versioning and diff
+        print(f"✅ version advanced to {data.version}, changed: {sorted(data.diff(previous))}")
+
         # Test property
         device_dict = data.device_info_dict
         print(f"✅ device_info_dict property works - Keys: {list(device_dict.keys())}")